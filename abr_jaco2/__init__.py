@@ -1,3 +1,4 @@
 from .config.config import Config
 from .interface.interface import Interface
 from .interface import jaco2_rs485
+from .utils.realtime import RealTime
@@ -3,6 +3,52 @@ import numpy as np
 from abr_control.interfaces.interface import Interface as BaseInterface
 from . import jaco2_rs485
 
+# unit conversion constant, Jaco API uses degrees
+_RAD2DEG = 180.0 / np.pi
+
+
+class Feedback(object):
+    """ Joint angle and velocity feedback from the arm
+
+    Filled in place by Interface.get_feedback. For compatibility with the
+    dictionary returned by the ABR_Control interface API it also supports
+    read only dictionary access: feedback['q'], 'q' in feedback,
+    feedback.get('q'), feedback.keys() and iterating over the keys.
+
+    Attributes
+    ----------
+    q : numpy.array
+        joint angles [radians]
+    dq : numpy.array
+        joint velocities [radians/second]
+    """
+
+    __slots__ = ('q', 'dq')
+
+    def __init__(self, q, dq):
+        self.q = q
+        self.dq = dq
+
+    def __getitem__(self, key):
+        if key not in self.__slots__:
+            raise KeyError(key)
+        return getattr(self, key)
+
+    def __contains__(self, key):
+        return key in self.__slots__
+
+    def __iter__(self):
+        return iter(self.__slots__)
+
+    def __len__(self):
+        return len(self.__slots__)
+
+    def get(self, key, default=None):
+        return self[key] if key in self else default
+
+    def keys(self):
+        return list(self.__slots__)
+
 
 class Interface(BaseInterface):
     """ Interface class for the Jaco2 Kinova arm.
@@ -40,6 +86,14 @@ class Interface(BaseInterface):
         super(Interface, self).__init__(robot_config)
         self.jaco2 = jaco2_rs485.pyJaco2(display_error_level, use_redis)
 
+        # preallocated buffers for feedback and unit conversion, reused
+        # every call
+        self._q_buf = np.empty(robot_config.N_JOINTS, dtype=np.float64)
+        self._dq_buf = np.empty(robot_config.N_JOINTS, dtype=np.float64)
+        self._q_target_buf = np.empty(robot_config.N_JOINTS, dtype=np.float32)
+        self._u32 = np.empty(robot_config.N_JOINTS, dtype=np.float32)
+        self._feedback = Feedback(self._q_buf, self._dq_buf)
+
     def connect(self):
         """ All initial setup, establish RS485 connection
         """
@@ -53,18 +107,25 @@ class Interface(BaseInterface):
         self.jaco2.Disconnect()
 
     def get_feedback(self):
-        """ Returns a dictionary of relevant information
+        """ Returns a Feedback object with relevant information
 
         Returns the current joint and joint velocity information
-        to the controller [radians] [radians/second] respectively
+        to the controller [radians] [radians/second] respectively,
+        accessible as feedback.q and feedback.dq (or feedback['q'] and
+        feedback['dq'])
+
+        NOTE: the same Feedback object and arrays are returned and
+        overwritten on every call, copy them if they need to be kept around
+
+        NOTE: this does not communicate with the arm, in force mode the
+        values are those returned in reply to the last send_forces call,
+        so each control loop is a single RS485 request / response
         """
 
-        # convert from degrees from the Jaco into radians
-        # Jaco API uses degrees
-        feedback = self.jaco2.GetFeedback()
-        feedback['q'] = (np.array(feedback['q']) * np.pi / 180.0) % (2 * np.pi)
-        feedback['dq'] = np.array(feedback['dq']) * np.pi / 180.0
-        return feedback
+        # Jaco API uses degrees, the conversion into radians is done
+        # element-wise in the cython wrapper while copying into the buffers
+        self.jaco2.GetFeedbackInto(self._q_buf, self._dq_buf)
+        return self._feedback
 
     def get_torque_load(self):
         """ Returns the torque at each joint in Nm
@@ -109,12 +170,17 @@ class Interface(BaseInterface):
         applied every 200ms then the arm reverts back to position
         control and the InitForceMode function must be called again.
 
+        The joint feedback in the reply is read in the same transaction
+        and is available afterwards through get_feedback.
+
         Parameters
         ----------
         u : numpy.array
-            float value of torques to apply to each joint [Nm]
+            float value of torques to apply to each joint [Nm], any
+            float dtype is accepted and copied into a float32 buffer
         """
-        self.jaco2.SendForces(u)
+        np.copyto(self._u32, u, casting='same_kind')
+        self.jaco2.SendForces(self._u32)
 
     def send_target_angles(self, q):
         """ Moves the arm to the specified joint angles
@@ -127,5 +193,5 @@ class Interface(BaseInterface):
         """
         # TODO: need to account for negative degrees
         # convert from radians into degrees the Jaco expects
-        q = np.array(q) * 180.0 / np.pi
-        self.jaco2.SendTargetAngles(q)
+        np.multiply(q, _RAD2DEG, out=self._q_target_buf)
+        self.jaco2.SendTargetAngles(self._q_target_buf)
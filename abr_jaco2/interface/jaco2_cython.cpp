@@ -448,6 +448,7 @@ static CYTHON_INLINE float __PYX_NAN() {
 #include <stdlib.h>
 #include "numpy/arrayobject.h"
 #include "numpy/ufuncobject.h"
+#include <math.h>
 #include "jaco2_rs485.h"
 #ifdef _OPENMP
 #include <omp.h>
@@ -708,7 +709,7 @@ typedef struct {
 } __Pyx_BufFmt_Context;
 
 
-/* "../../../anaconda3/envs/control/lib/python3.4/site-packages/Cython/Includes/numpy/__init__.pxd":725
+/* "../../tmp/cy/Cython-0.25.2/Cython/Includes/numpy/__init__.pxd":725
  * # in Cython to enable them only on the right systems.
  * 
  * ctypedef npy_int8       int8_t             # <<<<<<<<<<<<<<
@@ -717,7 +718,7 @@ typedef struct {
  */
 typedef npy_int8 __pyx_t_5numpy_int8_t;
 
-/* "../../../anaconda3/envs/control/lib/python3.4/site-packages/Cython/Includes/numpy/__init__.pxd":726
+/* "../../tmp/cy/Cython-0.25.2/Cython/Includes/numpy/__init__.pxd":726
  * 
  * ctypedef npy_int8       int8_t
  * ctypedef npy_int16      int16_t             # <<<<<<<<<<<<<<
@@ -726,7 +727,7 @@ typedef npy_int8 __pyx_t_5numpy_int8_t;
  */
 typedef npy_int16 __pyx_t_5numpy_int16_t;
 
-/* "../../../anaconda3/envs/control/lib/python3.4/site-packages/Cython/Includes/numpy/__init__.pxd":727
+/* "../../tmp/cy/Cython-0.25.2/Cython/Includes/numpy/__init__.pxd":727
  * ctypedef npy_int8       int8_t
  * ctypedef npy_int16      int16_t
  * ctypedef npy_int32      int32_t             # <<<<<<<<<<<<<<
@@ -735,7 +736,7 @@ typedef npy_int16 __pyx_t_5numpy_int16_t;
  */
 typedef npy_int32 __pyx_t_5numpy_int32_t;
 
-/* "../../../anaconda3/envs/control/lib/python3.4/site-packages/Cython/Includes/numpy/__init__.pxd":728
+/* "../../tmp/cy/Cython-0.25.2/Cython/Includes/numpy/__init__.pxd":728
  * ctypedef npy_int16      int16_t
  * ctypedef npy_int32      int32_t
  * ctypedef npy_int64      int64_t             # <<<<<<<<<<<<<<
@@ -744,7 +745,7 @@ typedef npy_int32 __pyx_t_5numpy_int32_t;
  */
 typedef npy_int64 __pyx_t_5numpy_int64_t;
 
-/* "../../../anaconda3/envs/control/lib/python3.4/site-packages/Cython/Includes/numpy/__init__.pxd":732
+/* "../../tmp/cy/Cython-0.25.2/Cython/Includes/numpy/__init__.pxd":732
  * #ctypedef npy_int128     int128_t
  * 
  * ctypedef npy_uint8      uint8_t             # <<<<<<<<<<<<<<
@@ -753,7 +754,7 @@ typedef npy_int64 __pyx_t_5numpy_int64_t;
  */
 typedef npy_uint8 __pyx_t_5numpy_uint8_t;
 
-/* "../../../anaconda3/envs/control/lib/python3.4/site-packages/Cython/Includes/numpy/__init__.pxd":733
+/* "../../tmp/cy/Cython-0.25.2/Cython/Includes/numpy/__init__.pxd":733
  * 
  * ctypedef npy_uint8      uint8_t
  * ctypedef npy_uint16     uint16_t             # <<<<<<<<<<<<<<
@@ -762,7 +763,7 @@ typedef npy_uint8 __pyx_t_5numpy_uint8_t;
  */
 typedef npy_uint16 __pyx_t_5numpy_uint16_t;
 
-/* "../../../anaconda3/envs/control/lib/python3.4/site-packages/Cython/Includes/numpy/__init__.pxd":734
+/* "../../tmp/cy/Cython-0.25.2/Cython/Includes/numpy/__init__.pxd":734
  * ctypedef npy_uint8      uint8_t
  * ctypedef npy_uint16     uint16_t
  * ctypedef npy_uint32     uint32_t             # <<<<<<<<<<<<<<
@@ -771,7 +772,7 @@ typedef npy_uint16 __pyx_t_5numpy_uint16_t;
  */
 typedef npy_uint32 __pyx_t_5numpy_uint32_t;
 
-/* "../../../anaconda3/envs/control/lib/python3.4/site-packages/Cython/Includes/numpy/__init__.pxd":735
+/* "../../tmp/cy/Cython-0.25.2/Cython/Includes/numpy/__init__.pxd":735
  * ctypedef npy_uint16     uint16_t
  * ctypedef npy_uint32     uint32_t
  * ctypedef npy_uint64     uint64_t             # <<<<<<<<<<<<<<
@@ -780,7 +781,7 @@ typedef npy_uint32 __pyx_t_5numpy_uint32_t;
  */
 typedef npy_uint64 __pyx_t_5numpy_uint64_t;
 
-/* "../../../anaconda3/envs/control/lib/python3.4/site-packages/Cython/Includes/numpy/__init__.pxd":739
+/* "../../tmp/cy/Cython-0.25.2/Cython/Includes/numpy/__init__.pxd":739
  * #ctypedef npy_uint128    uint128_t
  * 
  * ctypedef npy_float32    float32_t             # <<<<<<<<<<<<<<
@@ -789,7 +790,7 @@ typedef npy_uint64 __pyx_t_5numpy_uint64_t;
  */
 typedef npy_float32 __pyx_t_5numpy_float32_t;
 
-/* "../../../anaconda3/envs/control/lib/python3.4/site-packages/Cython/Includes/numpy/__init__.pxd":740
+/* "../../tmp/cy/Cython-0.25.2/Cython/Includes/numpy/__init__.pxd":740
  * 
  * ctypedef npy_float32    float32_t
  * ctypedef npy_float64    float64_t             # <<<<<<<<<<<<<<
@@ -798,7 +799,7 @@ typedef npy_float32 __pyx_t_5numpy_float32_t;
  */
 typedef npy_float64 __pyx_t_5numpy_float64_t;
 
-/* "../../../anaconda3/envs/control/lib/python3.4/site-packages/Cython/Includes/numpy/__init__.pxd":749
+/* "../../tmp/cy/Cython-0.25.2/Cython/Includes/numpy/__init__.pxd":749
  * # The int types are mapped a bit surprising --
  * # numpy.int corresponds to 'l' and numpy.long to 'q'
  * ctypedef npy_long       int_t             # <<<<<<<<<<<<<<
@@ -807,7 +808,7 @@ typedef npy_float64 __pyx_t_5numpy_float64_t;
  */
 typedef npy_long __pyx_t_5numpy_int_t;
 
-/* "../../../anaconda3/envs/control/lib/python3.4/site-packages/Cython/Includes/numpy/__init__.pxd":750
+/* "../../tmp/cy/Cython-0.25.2/Cython/Includes/numpy/__init__.pxd":750
  * # numpy.int corresponds to 'l' and numpy.long to 'q'
  * ctypedef npy_long       int_t
  * ctypedef npy_longlong   long_t             # <<<<<<<<<<<<<<
@@ -816,7 +817,7 @@ typedef npy_long __pyx_t_5numpy_int_t;
  */
 typedef npy_longlong __pyx_t_5numpy_long_t;
 
-/* "../../../anaconda3/envs/control/lib/python3.4/site-packages/Cython/Includes/numpy/__init__.pxd":751
+/* "../../tmp/cy/Cython-0.25.2/Cython/Includes/numpy/__init__.pxd":751
  * ctypedef npy_long       int_t
  * ctypedef npy_longlong   long_t
  * ctypedef npy_longlong   longlong_t             # <<<<<<<<<<<<<<
@@ -825,7 +826,7 @@ typedef npy_longlong __pyx_t_5numpy_long_t;
  */
 typedef npy_longlong __pyx_t_5numpy_longlong_t;
 
-/* "../../../anaconda3/envs/control/lib/python3.4/site-packages/Cython/Includes/numpy/__init__.pxd":753
+/* "../../tmp/cy/Cython-0.25.2/Cython/Includes/numpy/__init__.pxd":753
  * ctypedef npy_longlong   longlong_t
  * 
  * ctypedef npy_ulong      uint_t             # <<<<<<<<<<<<<<
@@ -834,7 +835,7 @@ typedef npy_longlong __pyx_t_5numpy_longlong_t;
  */
 typedef npy_ulong __pyx_t_5numpy_uint_t;
 
-/* "../../../anaconda3/envs/control/lib/python3.4/site-packages/Cython/Includes/numpy/__init__.pxd":754
+/* "../../tmp/cy/Cython-0.25.2/Cython/Includes/numpy/__init__.pxd":754
  * 
  * ctypedef npy_ulong      uint_t
  * ctypedef npy_ulonglong  ulong_t             # <<<<<<<<<<<<<<
@@ -843,7 +844,7 @@ typedef npy_ulong __pyx_t_5numpy_uint_t;
  */
 typedef npy_ulonglong __pyx_t_5numpy_ulong_t;
 
-/* "../../../anaconda3/envs/control/lib/python3.4/site-packages/Cython/Includes/numpy/__init__.pxd":755
+/* "../../tmp/cy/Cython-0.25.2/Cython/Includes/numpy/__init__.pxd":755
  * ctypedef npy_ulong      uint_t
  * ctypedef npy_ulonglong  ulong_t
  * ctypedef npy_ulonglong  ulonglong_t             # <<<<<<<<<<<<<<
@@ -852,7 +853,7 @@ typedef npy_ulonglong __pyx_t_5numpy_ulong_t;
  */
 typedef npy_ulonglong __pyx_t_5numpy_ulonglong_t;
 
-/* "../../../anaconda3/envs/control/lib/python3.4/site-packages/Cython/Includes/numpy/__init__.pxd":757
+/* "../../tmp/cy/Cython-0.25.2/Cython/Includes/numpy/__init__.pxd":757
  * ctypedef npy_ulonglong  ulonglong_t
  * 
  * ctypedef npy_intp       intp_t             # <<<<<<<<<<<<<<
@@ -861,7 +862,7 @@ typedef npy_ulonglong __pyx_t_5numpy_ulonglong_t;
  */
 typedef npy_intp __pyx_t_5numpy_intp_t;
 
-/* "../../../anaconda3/envs/control/lib/python3.4/site-packages/Cython/Includes/numpy/__init__.pxd":758
+/* "../../tmp/cy/Cython-0.25.2/Cython/Includes/numpy/__init__.pxd":758
  * 
  * ctypedef npy_intp       intp_t
  * ctypedef npy_uintp      uintp_t             # <<<<<<<<<<<<<<
@@ -870,7 +871,7 @@ typedef npy_intp __pyx_t_5numpy_intp_t;
  */
 typedef npy_uintp __pyx_t_5numpy_uintp_t;
 
-/* "../../../anaconda3/envs/control/lib/python3.4/site-packages/Cython/Includes/numpy/__init__.pxd":760
+/* "../../tmp/cy/Cython-0.25.2/Cython/Includes/numpy/__init__.pxd":760
  * ctypedef npy_uintp      uintp_t
  * 
  * ctypedef npy_double     float_t             # <<<<<<<<<<<<<<
@@ -879,7 +880,7 @@ typedef npy_uintp __pyx_t_5numpy_uintp_t;
  */
 typedef npy_double __pyx_t_5numpy_float_t;
 
-/* "../../../anaconda3/envs/control/lib/python3.4/site-packages/Cython/Includes/numpy/__init__.pxd":761
+/* "../../tmp/cy/Cython-0.25.2/Cython/Includes/numpy/__init__.pxd":761
  * 
  * ctypedef npy_double     float_t
  * ctypedef npy_double     double_t             # <<<<<<<<<<<<<<
@@ -888,7 +889,7 @@ typedef npy_double __pyx_t_5numpy_float_t;
  */
 typedef npy_double __pyx_t_5numpy_double_t;
 
-/* "../../../anaconda3/envs/control/lib/python3.4/site-packages/Cython/Includes/numpy/__init__.pxd":762
+/* "../../tmp/cy/Cython-0.25.2/Cython/Includes/numpy/__init__.pxd":762
  * ctypedef npy_double     float_t
  * ctypedef npy_double     double_t
  * ctypedef npy_longdouble longdouble_t             # <<<<<<<<<<<<<<
@@ -924,7 +925,7 @@ static CYTHON_INLINE __pyx_t_double_complex __pyx_t_double_complex_from_parts(do
 /*--- Type declarations ---*/
 struct __pyx_obj_9abr_jaco2_9interface_11jaco2_rs485_pyJaco2;
 
-/* "../../../anaconda3/envs/control/lib/python3.4/site-packages/Cython/Includes/numpy/__init__.pxd":764
+/* "../../tmp/cy/Cython-0.25.2/Cython/Includes/numpy/__init__.pxd":764
  * ctypedef npy_longdouble longdouble_t
  * 
  * ctypedef npy_cfloat      cfloat_t             # <<<<<<<<<<<<<<
@@ -933,7 +934,7 @@ struct __pyx_obj_9abr_jaco2_9interface_11jaco2_rs485_pyJaco2;
  */
 typedef npy_cfloat __pyx_t_5numpy_cfloat_t;
 
-/* "../../../anaconda3/envs/control/lib/python3.4/site-packages/Cython/Includes/numpy/__init__.pxd":765
+/* "../../tmp/cy/Cython-0.25.2/Cython/Includes/numpy/__init__.pxd":765
  * 
  * ctypedef npy_cfloat      cfloat_t
  * ctypedef npy_cdouble     cdouble_t             # <<<<<<<<<<<<<<
@@ -942,7 +943,7 @@ typedef npy_cfloat __pyx_t_5numpy_cfloat_t;
  */
 typedef npy_cdouble __pyx_t_5numpy_cdouble_t;
 
-/* "../../../anaconda3/envs/control/lib/python3.4/site-packages/Cython/Includes/numpy/__init__.pxd":766
+/* "../../tmp/cy/Cython-0.25.2/Cython/Includes/numpy/__init__.pxd":766
  * ctypedef npy_cfloat      cfloat_t
  * ctypedef npy_cdouble     cdouble_t
  * ctypedef npy_clongdouble clongdouble_t             # <<<<<<<<<<<<<<
@@ -951,7 +952,7 @@ typedef npy_cdouble __pyx_t_5numpy_cdouble_t;
  */
 typedef npy_clongdouble __pyx_t_5numpy_clongdouble_t;
 
-/* "../../../anaconda3/envs/control/lib/python3.4/site-packages/Cython/Includes/numpy/__init__.pxd":768
+/* "../../tmp/cy/Cython-0.25.2/Cython/Includes/numpy/__init__.pxd":768
  * ctypedef npy_clongdouble clongdouble_t
  * 
  * ctypedef npy_cdouble     complex_t             # <<<<<<<<<<<<<<
@@ -960,8 +961,8 @@ typedef npy_clongdouble __pyx_t_5numpy_clongdouble_t;
  */
 typedef npy_cdouble __pyx_t_5numpy_complex_t;
 
-/* "abr_jaco2/interface/jaco2_cython.pyx":27
- *         # bool use_redis
+/* "abr_jaco2/interface/jaco2_cython.pyx":31
+ *         float vel[6]
  * 
  * cdef class pyJaco2:             # <<<<<<<<<<<<<<
  *     cdef Jaco2* thisptr # hold a C++ instance
@@ -1253,6 +1254,11 @@ typedef struct {
 static Py_ssize_t __Pyx_zeros[] = {0, 0, 0, 0, 0, 0, 0, 0};
 static Py_ssize_t __Pyx_minusones[] = {-1, -1, -1, -1, -1, -1, -1, -1};
 
+/* ForceInitThreads.proto */
+#ifndef __PYX_FORCE_INIT_THREADS
+  #define __PYX_FORCE_INIT_THREADS 0
+#endif
+
 /* RealImag.proto */
 #if CYTHON_CCOMPLEX
   #ifdef __cplusplus
@@ -1420,20 +1426,25 @@ static PyTypeObject *__pyx_ptype_5numpy_ndarray = 0;
 static PyTypeObject *__pyx_ptype_5numpy_ufunc = 0;
 static CYTHON_INLINE char *__pyx_f_5numpy__util_dtypestring(PyArray_Descr *, char *, char *, int *); /*proto*/
 
+/* Module declarations from 'libc.math' */
+
 /* Module declarations from 'libcpp' */
 
 /* Module declarations from 'abr_jaco2.interface.jaco2_rs485' */
 static PyTypeObject *__pyx_ptype_9abr_jaco2_9interface_11jaco2_rs485_pyJaco2 = 0;
+static double __pyx_v_9abr_jaco2_9interface_11jaco2_rs485_DEG2RAD;
+static double __pyx_v_9abr_jaco2_9interface_11jaco2_rs485_TWO_PI;
 static CYTHON_INLINE PyObject *__Pyx_carray_to_py_float(float *, Py_ssize_t); /*proto*/
 static CYTHON_INLINE PyObject *__Pyx_carray_to_tuple_float(float *, Py_ssize_t); /*proto*/
+static __Pyx_TypeInfo __Pyx_TypeInfo_double = { "double", NULL, sizeof(double), { 0 }, 0, 'R', 0, 0 };
 static __Pyx_TypeInfo __Pyx_TypeInfo_float = { "float", NULL, sizeof(float), { 0 }, 0, 'R', 0, 0 };
 #define __Pyx_MODULE_NAME "abr_jaco2.interface.jaco2_rs485"
 int __pyx_module_is_main_abr_jaco2__interface__jaco2_rs485 = 0;
 
 /* Implementation of 'abr_jaco2.interface.jaco2_rs485' */
 static PyObject *__pyx_builtin_ImportError;
-static PyObject *__pyx_builtin_ValueError;
 static PyObject *__pyx_builtin_range;
+static PyObject *__pyx_builtin_ValueError;
 static PyObject *__pyx_builtin_RuntimeError;
 static const char __pyx_k_q[] = "q";
 static const char __pyx_k_r[] = "r";
@@ -1498,12 +1509,13 @@ static void __pyx_pf_9abr_jaco2_9interface_11jaco2_rs485_7pyJaco2_2__dealloc__(s
 static PyObject *__pyx_pf_9abr_jaco2_9interface_11jaco2_rs485_7pyJaco2_4Connect(struct __pyx_obj_9abr_jaco2_9interface_11jaco2_rs485_pyJaco2 *__pyx_v_self); /* proto */
 static PyObject *__pyx_pf_9abr_jaco2_9interface_11jaco2_rs485_7pyJaco2_6Disconnect(struct __pyx_obj_9abr_jaco2_9interface_11jaco2_rs485_pyJaco2 *__pyx_v_self); /* proto */
 static PyObject *__pyx_pf_9abr_jaco2_9interface_11jaco2_rs485_7pyJaco2_8GetFeedback(struct __pyx_obj_9abr_jaco2_9interface_11jaco2_rs485_pyJaco2 *__pyx_v_self); /* proto */
-static PyObject *__pyx_pf_9abr_jaco2_9interface_11jaco2_rs485_7pyJaco2_10GetTorqueLoad(struct __pyx_obj_9abr_jaco2_9interface_11jaco2_rs485_pyJaco2 *__pyx_v_self); /* proto */
-static PyObject *__pyx_pf_9abr_jaco2_9interface_11jaco2_rs485_7pyJaco2_12InitForceMode(struct __pyx_obj_9abr_jaco2_9interface_11jaco2_rs485_pyJaco2 *__pyx_v_self); /* proto */
-static PyObject *__pyx_pf_9abr_jaco2_9interface_11jaco2_rs485_7pyJaco2_14InitPositionMode(struct __pyx_obj_9abr_jaco2_9interface_11jaco2_rs485_pyJaco2 *__pyx_v_self); /* proto */
-static PyObject *__pyx_pf_9abr_jaco2_9interface_11jaco2_rs485_7pyJaco2_16SendForces(struct __pyx_obj_9abr_jaco2_9interface_11jaco2_rs485_pyJaco2 *__pyx_v_self, PyArrayObject *__pyx_v_u); /* proto */
-static PyObject *__pyx_pf_9abr_jaco2_9interface_11jaco2_rs485_7pyJaco2_18SendTargetAngles(struct __pyx_obj_9abr_jaco2_9interface_11jaco2_rs485_pyJaco2 *__pyx_v_self, PyArrayObject *__pyx_v_q_target); /* proto */
-static PyObject *__pyx_pf_9abr_jaco2_9interface_11jaco2_rs485_7pyJaco2_20SendTargetAnglesHand(struct __pyx_obj_9abr_jaco2_9interface_11jaco2_rs485_pyJaco2 *__pyx_v_self, bool __pyx_v_open); /* proto */
+static PyObject *__pyx_pf_9abr_jaco2_9interface_11jaco2_rs485_7pyJaco2_10GetFeedbackInto(struct __pyx_obj_9abr_jaco2_9interface_11jaco2_rs485_pyJaco2 *__pyx_v_self, PyArrayObject *__pyx_v_q, PyArrayObject *__pyx_v_dq); /* proto */
+static PyObject *__pyx_pf_9abr_jaco2_9interface_11jaco2_rs485_7pyJaco2_12GetTorqueLoad(struct __pyx_obj_9abr_jaco2_9interface_11jaco2_rs485_pyJaco2 *__pyx_v_self); /* proto */
+static PyObject *__pyx_pf_9abr_jaco2_9interface_11jaco2_rs485_7pyJaco2_14InitForceMode(struct __pyx_obj_9abr_jaco2_9interface_11jaco2_rs485_pyJaco2 *__pyx_v_self); /* proto */
+static PyObject *__pyx_pf_9abr_jaco2_9interface_11jaco2_rs485_7pyJaco2_16InitPositionMode(struct __pyx_obj_9abr_jaco2_9interface_11jaco2_rs485_pyJaco2 *__pyx_v_self); /* proto */
+static PyObject *__pyx_pf_9abr_jaco2_9interface_11jaco2_rs485_7pyJaco2_18SendForces(struct __pyx_obj_9abr_jaco2_9interface_11jaco2_rs485_pyJaco2 *__pyx_v_self, PyArrayObject *__pyx_v_u); /* proto */
+static PyObject *__pyx_pf_9abr_jaco2_9interface_11jaco2_rs485_7pyJaco2_20SendTargetAngles(struct __pyx_obj_9abr_jaco2_9interface_11jaco2_rs485_pyJaco2 *__pyx_v_self, PyArrayObject *__pyx_v_q_target); /* proto */
+static PyObject *__pyx_pf_9abr_jaco2_9interface_11jaco2_rs485_7pyJaco2_22SendTargetAnglesHand(struct __pyx_obj_9abr_jaco2_9interface_11jaco2_rs485_pyJaco2 *__pyx_v_self, bool __pyx_v_open); /* proto */
 static int __pyx_pf_5numpy_7ndarray___getbuffer__(PyArrayObject *__pyx_v_self, Py_buffer *__pyx_v_info, int __pyx_v_flags); /* proto */
 static void __pyx_pf_5numpy_7ndarray_2__releasebuffer__(PyArrayObject *__pyx_v_self, Py_buffer *__pyx_v_info); /* proto */
 static PyObject *__pyx_tp_new_9abr_jaco2_9interface_11jaco2_rs485_pyJaco2(PyTypeObject *t, PyObject *a, PyObject *k); /*proto*/
@@ -1517,12 +1529,12 @@ static PyObject *__pyx_tuple__7;
 static PyObject *__pyx_tuple__8;
 static PyObject *__pyx_tuple__9;
 
-/* "abr_jaco2/interface/jaco2_cython.pyx":36
+/* "abr_jaco2/interface/jaco2_cython.pyx":40
  *         pass
  * 
  *     def __cinit__(self, display_error_level, use_redis=False):             # <<<<<<<<<<<<<<
- *         if use_redis:
- *             # try:
+ *         self.use_redis = use_redis
+ *         self.thisptr = new Jaco2(display_error_level)
  */
 
 /* Python wrapper */
@@ -1558,7 +1570,7 @@ static int __pyx_pw_9abr_jaco2_9interface_11jaco2_rs485_7pyJaco2_1__cinit__(PyOb
         }
       }
       if (unlikely(kw_args > 0)) {
-        if (unlikely(__Pyx_ParseOptionalKeywords(__pyx_kwds, __pyx_pyargnames, 0, values, pos_args, "__cinit__") < 0)) __PYX_ERR(0, 36, __pyx_L3_error)
+        if (unlikely(__Pyx_ParseOptionalKeywords(__pyx_kwds, __pyx_pyargnames, 0, values, pos_args, "__cinit__") < 0)) __PYX_ERR(0, 40, __pyx_L3_error)
       }
     } else {
       switch (PyTuple_GET_SIZE(__pyx_args)) {
@@ -1573,7 +1585,7 @@ static int __pyx_pw_9abr_jaco2_9interface_11jaco2_rs485_7pyJaco2_1__cinit__(PyOb
   }
   goto __pyx_L4_argument_unpacking_done;
   __pyx_L5_argtuple_error:;
-  __Pyx_RaiseArgtupleInvalid("__cinit__", 0, 1, 2, PyTuple_GET_SIZE(__pyx_args)); __PYX_ERR(0, 36, __pyx_L3_error)
+  __Pyx_RaiseArgtupleInvalid("__cinit__", 0, 1, 2, PyTuple_GET_SIZE(__pyx_args)); __PYX_ERR(0, 40, __pyx_L3_error)
   __pyx_L3_error:;
   __Pyx_AddTraceback("abr_jaco2.interface.jaco2_rs485.pyJaco2.__cinit__", __pyx_clineno, __pyx_lineno, __pyx_filename);
   __Pyx_RefNannyFinishContext();
@@ -1589,67 +1601,36 @@ static int __pyx_pw_9abr_jaco2_9interface_11jaco2_rs485_7pyJaco2_1__cinit__(PyOb
 static int __pyx_pf_9abr_jaco2_9interface_11jaco2_rs485_7pyJaco2___cinit__(struct __pyx_obj_9abr_jaco2_9interface_11jaco2_rs485_pyJaco2 *__pyx_v_self, PyObject *__pyx_v_display_error_level, PyObject *__pyx_v_use_redis) {
   int __pyx_r;
   __Pyx_RefNannyDeclarations
-  int __pyx_t_1;
+  bool __pyx_t_1;
   int __pyx_t_2;
   __Pyx_RefNannySetupContext("__cinit__", 0);
 
-  /* "abr_jaco2/interface/jaco2_cython.pyx":37
- * 
- *     def __cinit__(self, display_error_level, use_redis=False):
- *         if use_redis:             # <<<<<<<<<<<<<<
- *             # try:
- *             #     import redis
- */
-  __pyx_t_1 = __Pyx_PyObject_IsTrue(__pyx_v_use_redis); if (unlikely(__pyx_t_1 < 0)) __PYX_ERR(0, 37, __pyx_L1_error)
-  if (__pyx_t_1) {
-
-    /* "abr_jaco2/interface/jaco2_cython.pyx":42
- *             #     cdef redis.StrictRedis self.r = redis.StrictRedis(host='localhost')
- *             #     self.r = redis.StrictRedis(host='localhost')
- *             self.use_redis = True             # <<<<<<<<<<<<<<
- *             # except ImportError:
- *             #     print('Please install redis to get joint information during'
- */
-    __pyx_v_self->use_redis = 1;
-
-    /* "abr_jaco2/interface/jaco2_cython.pyx":37
+  /* "abr_jaco2/interface/jaco2_cython.pyx":41
  * 
  *     def __cinit__(self, display_error_level, use_redis=False):
- *         if use_redis:             # <<<<<<<<<<<<<<
- *             # try:
- *             #     import redis
- */
-    goto __pyx_L3;
-  }
-
-  /* "abr_jaco2/interface/jaco2_cython.pyx":47
- *             #           + ' position control movement')
- *         else:
- *             self.use_redis = False             # <<<<<<<<<<<<<<
+ *         self.use_redis = use_redis             # <<<<<<<<<<<<<<
  *         self.thisptr = new Jaco2(display_error_level)
  * 
  */
-  /*else*/ {
-    __pyx_v_self->use_redis = 0;
-  }
-  __pyx_L3:;
+  __pyx_t_1 = __Pyx_PyObject_IsTrue(__pyx_v_use_redis); if (unlikely((__pyx_t_1 == ((bool)-1)) && PyErr_Occurred())) __PYX_ERR(0, 41, __pyx_L1_error)
+  __pyx_v_self->use_redis = __pyx_t_1;
 
-  /* "abr_jaco2/interface/jaco2_cython.pyx":48
- *         else:
- *             self.use_redis = False
+  /* "abr_jaco2/interface/jaco2_cython.pyx":42
+ *     def __cinit__(self, display_error_level, use_redis=False):
+ *         self.use_redis = use_redis
  *         self.thisptr = new Jaco2(display_error_level)             # <<<<<<<<<<<<<<
  * 
  *     def __dealloc__(self):
  */
-  __pyx_t_2 = __Pyx_PyInt_As_int(__pyx_v_display_error_level); if (unlikely((__pyx_t_2 == (int)-1) && PyErr_Occurred())) __PYX_ERR(0, 48, __pyx_L1_error)
+  __pyx_t_2 = __Pyx_PyInt_As_int(__pyx_v_display_error_level); if (unlikely((__pyx_t_2 == (int)-1) && PyErr_Occurred())) __PYX_ERR(0, 42, __pyx_L1_error)
   __pyx_v_self->thisptr = new Jaco2(__pyx_t_2);
 
-  /* "abr_jaco2/interface/jaco2_cython.pyx":36
+  /* "abr_jaco2/interface/jaco2_cython.pyx":40
  *         pass
  * 
  *     def __cinit__(self, display_error_level, use_redis=False):             # <<<<<<<<<<<<<<
- *         if use_redis:
- *             # try:
+ *         self.use_redis = use_redis
+ *         self.thisptr = new Jaco2(display_error_level)
  */
 
   /* function exit code */
@@ -1663,7 +1644,7 @@ static int __pyx_pf_9abr_jaco2_9interface_11jaco2_rs485_7pyJaco2___cinit__(struc
   return __pyx_r;
 }
 
-/* "abr_jaco2/interface/jaco2_cython.pyx":50
+/* "abr_jaco2/interface/jaco2_cython.pyx":44
  *         self.thisptr = new Jaco2(display_error_level)
  * 
  *     def __dealloc__(self):             # <<<<<<<<<<<<<<
@@ -1686,7 +1667,7 @@ static void __pyx_pf_9abr_jaco2_9interface_11jaco2_rs485_7pyJaco2_2__dealloc__(s
   __Pyx_RefNannyDeclarations
   __Pyx_RefNannySetupContext("__dealloc__", 0);
 
-  /* "abr_jaco2/interface/jaco2_cython.pyx":51
+  /* "abr_jaco2/interface/jaco2_cython.pyx":45
  * 
  *     def __dealloc__(self):
  *         del self.thisptr             # <<<<<<<<<<<<<<
@@ -1695,7 +1676,7 @@ static void __pyx_pf_9abr_jaco2_9interface_11jaco2_rs485_7pyJaco2_2__dealloc__(s
  */
   delete __pyx_v_self->thisptr;
 
-  /* "abr_jaco2/interface/jaco2_cython.pyx":50
+  /* "abr_jaco2/interface/jaco2_cython.pyx":44
  *         self.thisptr = new Jaco2(display_error_level)
  * 
  *     def __dealloc__(self):             # <<<<<<<<<<<<<<
@@ -1707,12 +1688,12 @@ static void __pyx_pf_9abr_jaco2_9interface_11jaco2_rs485_7pyJaco2_2__dealloc__(s
   __Pyx_RefNannyFinishContext();
 }
 
-/* "abr_jaco2/interface/jaco2_cython.pyx":53
+/* "abr_jaco2/interface/jaco2_cython.pyx":47
  *         del self.thisptr
  * 
  *     def Connect(self):             # <<<<<<<<<<<<<<
- *         self.thisptr.Connect()
- * 
+ *         with nogil:
+ *             self.thisptr.Connect()
  */
 
 /* Python wrapper */
@@ -1733,21 +1714,54 @@ static PyObject *__pyx_pf_9abr_jaco2_9interface_11jaco2_rs485_7pyJaco2_4Connect(
   __Pyx_RefNannyDeclarations
   __Pyx_RefNannySetupContext("Connect", 0);
 
-  /* "abr_jaco2/interface/jaco2_cython.pyx":54
+  /* "abr_jaco2/interface/jaco2_cython.pyx":48
  * 
  *     def Connect(self):
- *         self.thisptr.Connect()             # <<<<<<<<<<<<<<
+ *         with nogil:             # <<<<<<<<<<<<<<
+ *             self.thisptr.Connect()
+ * 
+ */
+  {
+      #ifdef WITH_THREAD
+      PyThreadState *_save;
+      Py_UNBLOCK_THREADS
+      #endif
+      /*try:*/ {
+
+        /* "abr_jaco2/interface/jaco2_cython.pyx":49
+ *     def Connect(self):
+ *         with nogil:
+ *             self.thisptr.Connect()             # <<<<<<<<<<<<<<
  * 
  *     def Disconnect(self):
  */
-  __pyx_v_self->thisptr->Connect();
+        __pyx_v_self->thisptr->Connect();
+      }
 
-  /* "abr_jaco2/interface/jaco2_cython.pyx":53
+      /* "abr_jaco2/interface/jaco2_cython.pyx":48
+ * 
+ *     def Connect(self):
+ *         with nogil:             # <<<<<<<<<<<<<<
+ *             self.thisptr.Connect()
+ * 
+ */
+      /*finally:*/ {
+        /*normal exit:*/{
+          #ifdef WITH_THREAD
+          Py_BLOCK_THREADS
+          #endif
+          goto __pyx_L5;
+        }
+        __pyx_L5:;
+      }
+  }
+
+  /* "abr_jaco2/interface/jaco2_cython.pyx":47
  *         del self.thisptr
  * 
  *     def Connect(self):             # <<<<<<<<<<<<<<
- *         self.thisptr.Connect()
- * 
+ *         with nogil:
+ *             self.thisptr.Connect()
  */
 
   /* function exit code */
@@ -1757,12 +1771,12 @@ static PyObject *__pyx_pf_9abr_jaco2_9interface_11jaco2_rs485_7pyJaco2_4Connect(
   return __pyx_r;
 }
 
-/* "abr_jaco2/interface/jaco2_cython.pyx":56
- *         self.thisptr.Connect()
+/* "abr_jaco2/interface/jaco2_cython.pyx":51
+ *             self.thisptr.Connect()
  * 
  *     def Disconnect(self):             # <<<<<<<<<<<<<<
- *         self.thisptr.Disconnect()
- * 
+ *         with nogil:
+ *             self.thisptr.Disconnect()
  */
 
 /* Python wrapper */
@@ -1783,21 +1797,54 @@ static PyObject *__pyx_pf_9abr_jaco2_9interface_11jaco2_rs485_7pyJaco2_6Disconne
   __Pyx_RefNannyDeclarations
   __Pyx_RefNannySetupContext("Disconnect", 0);
 
-  /* "abr_jaco2/interface/jaco2_cython.pyx":57
+  /* "abr_jaco2/interface/jaco2_cython.pyx":52
  * 
  *     def Disconnect(self):
- *         self.thisptr.Disconnect()             # <<<<<<<<<<<<<<
+ *         with nogil:             # <<<<<<<<<<<<<<
+ *             self.thisptr.Disconnect()
+ * 
+ */
+  {
+      #ifdef WITH_THREAD
+      PyThreadState *_save;
+      Py_UNBLOCK_THREADS
+      #endif
+      /*try:*/ {
+
+        /* "abr_jaco2/interface/jaco2_cython.pyx":53
+ *     def Disconnect(self):
+ *         with nogil:
+ *             self.thisptr.Disconnect()             # <<<<<<<<<<<<<<
  * 
  *     def GetFeedback(self):
  */
-  __pyx_v_self->thisptr->Disconnect();
+        __pyx_v_self->thisptr->Disconnect();
+      }
 
-  /* "abr_jaco2/interface/jaco2_cython.pyx":56
- *         self.thisptr.Connect()
+      /* "abr_jaco2/interface/jaco2_cython.pyx":52
  * 
- *     def Disconnect(self):             # <<<<<<<<<<<<<<
- *         self.thisptr.Disconnect()
+ *     def Disconnect(self):
+ *         with nogil:             # <<<<<<<<<<<<<<
+ *             self.thisptr.Disconnect()
  * 
+ */
+      /*finally:*/ {
+        /*normal exit:*/{
+          #ifdef WITH_THREAD
+          Py_BLOCK_THREADS
+          #endif
+          goto __pyx_L5;
+        }
+        __pyx_L5:;
+      }
+  }
+
+  /* "abr_jaco2/interface/jaco2_cython.pyx":51
+ *             self.thisptr.Connect()
+ * 
+ *     def Disconnect(self):             # <<<<<<<<<<<<<<
+ *         with nogil:
+ *             self.thisptr.Disconnect()
  */
 
   /* function exit code */
@@ -1807,8 +1854,8 @@ static PyObject *__pyx_pf_9abr_jaco2_9interface_11jaco2_rs485_7pyJaco2_6Disconne
   return __pyx_r;
 }
 
-/* "abr_jaco2/interface/jaco2_cython.pyx":59
- *         self.thisptr.Disconnect()
+/* "abr_jaco2/interface/jaco2_cython.pyx":55
+ *             self.thisptr.Disconnect()
  * 
  *     def GetFeedback(self):             # <<<<<<<<<<<<<<
  *         return {'q': self.thisptr.pos,
@@ -1835,7 +1882,7 @@ static PyObject *__pyx_pf_9abr_jaco2_9interface_11jaco2_rs485_7pyJaco2_8GetFeedb
   PyObject *__pyx_t_2 = NULL;
   __Pyx_RefNannySetupContext("GetFeedback", 0);
 
-  /* "abr_jaco2/interface/jaco2_cython.pyx":60
+  /* "abr_jaco2/interface/jaco2_cython.pyx":56
  * 
  *     def GetFeedback(self):
  *         return {'q': self.thisptr.pos,             # <<<<<<<<<<<<<<
@@ -1843,30 +1890,30 @@ static PyObject *__pyx_pf_9abr_jaco2_9interface_11jaco2_rs485_7pyJaco2_8GetFeedb
  * 
  */
   __Pyx_XDECREF(__pyx_r);
-  __pyx_t_1 = PyDict_New(); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 60, __pyx_L1_error)
+  __pyx_t_1 = PyDict_New(); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 56, __pyx_L1_error)
   __Pyx_GOTREF(__pyx_t_1);
-  __pyx_t_2 = __Pyx_carray_to_py_float(__pyx_v_self->thisptr->pos, 6); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 60, __pyx_L1_error)
+  __pyx_t_2 = __Pyx_carray_to_py_float(__pyx_v_self->thisptr->pos, 6); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 56, __pyx_L1_error)
   __Pyx_GOTREF(__pyx_t_2);
-  if (PyDict_SetItem(__pyx_t_1, __pyx_n_s_q, __pyx_t_2) < 0) __PYX_ERR(0, 60, __pyx_L1_error)
+  if (PyDict_SetItem(__pyx_t_1, __pyx_n_s_q, __pyx_t_2) < 0) __PYX_ERR(0, 56, __pyx_L1_error)
   __Pyx_DECREF(__pyx_t_2); __pyx_t_2 = 0;
 
-  /* "abr_jaco2/interface/jaco2_cython.pyx":61
+  /* "abr_jaco2/interface/jaco2_cython.pyx":57
  *     def GetFeedback(self):
  *         return {'q': self.thisptr.pos,
  *                 'dq': self.thisptr.vel}             # <<<<<<<<<<<<<<
  * 
- *     def GetTorqueLoad(self):
+ *     def GetFeedbackInto(self, np.ndarray[double, mode="c"] q,
  */
-  __pyx_t_2 = __Pyx_carray_to_py_float(__pyx_v_self->thisptr->vel, 6); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 61, __pyx_L1_error)
+  __pyx_t_2 = __Pyx_carray_to_py_float(__pyx_v_self->thisptr->vel, 6); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 57, __pyx_L1_error)
   __Pyx_GOTREF(__pyx_t_2);
-  if (PyDict_SetItem(__pyx_t_1, __pyx_n_s_dq, __pyx_t_2) < 0) __PYX_ERR(0, 60, __pyx_L1_error)
+  if (PyDict_SetItem(__pyx_t_1, __pyx_n_s_dq, __pyx_t_2) < 0) __PYX_ERR(0, 56, __pyx_L1_error)
   __Pyx_DECREF(__pyx_t_2); __pyx_t_2 = 0;
   __pyx_r = __pyx_t_1;
   __pyx_t_1 = 0;
   goto __pyx_L0;
 
-  /* "abr_jaco2/interface/jaco2_cython.pyx":59
- *         self.thisptr.Disconnect()
+  /* "abr_jaco2/interface/jaco2_cython.pyx":55
+ *             self.thisptr.Disconnect()
  * 
  *     def GetFeedback(self):             # <<<<<<<<<<<<<<
  *         return {'q': self.thisptr.pos,
@@ -1885,35 +1932,258 @@ static PyObject *__pyx_pf_9abr_jaco2_9interface_11jaco2_rs485_7pyJaco2_8GetFeedb
   return __pyx_r;
 }
 
-/* "abr_jaco2/interface/jaco2_cython.pyx":63
+/* "abr_jaco2/interface/jaco2_cython.pyx":59
+ *                 'dq': self.thisptr.vel}
+ * 
+ *     def GetFeedbackInto(self, np.ndarray[double, mode="c"] q,             # <<<<<<<<<<<<<<
+ *                         np.ndarray[double, mode="c"] dq):
+ *         # copy feedback into preallocated arrays, avoids building a dict,
+ */
+
+/* Python wrapper */
+static PyObject *__pyx_pw_9abr_jaco2_9interface_11jaco2_rs485_7pyJaco2_11GetFeedbackInto(PyObject *__pyx_v_self, PyObject *__pyx_args, PyObject *__pyx_kwds); /*proto*/
+static PyObject *__pyx_pw_9abr_jaco2_9interface_11jaco2_rs485_7pyJaco2_11GetFeedbackInto(PyObject *__pyx_v_self, PyObject *__pyx_args, PyObject *__pyx_kwds) {
+  PyArrayObject *__pyx_v_q = 0;
+  PyArrayObject *__pyx_v_dq = 0;
+  PyObject *__pyx_r = 0;
+  __Pyx_RefNannyDeclarations
+  __Pyx_RefNannySetupContext("GetFeedbackInto (wrapper)", 0);
+  {
+    static PyObject **__pyx_pyargnames[] = {&__pyx_n_s_q,&__pyx_n_s_dq,0};
+    PyObject* values[2] = {0,0};
+    if (unlikely(__pyx_kwds)) {
+      Py_ssize_t kw_args;
+      const Py_ssize_t pos_args = PyTuple_GET_SIZE(__pyx_args);
+      switch (pos_args) {
+        case  2: values[1] = PyTuple_GET_ITEM(__pyx_args, 1);
+        case  1: values[0] = PyTuple_GET_ITEM(__pyx_args, 0);
+        case  0: break;
+        default: goto __pyx_L5_argtuple_error;
+      }
+      kw_args = PyDict_Size(__pyx_kwds);
+      switch (pos_args) {
+        case  0:
+        if (likely((values[0] = PyDict_GetItem(__pyx_kwds, __pyx_n_s_q)) != 0)) kw_args--;
+        else goto __pyx_L5_argtuple_error;
+        case  1:
+        if (likely((values[1] = PyDict_GetItem(__pyx_kwds, __pyx_n_s_dq)) != 0)) kw_args--;
+        else {
+          __Pyx_RaiseArgtupleInvalid("GetFeedbackInto", 1, 2, 2, 1); __PYX_ERR(0, 59, __pyx_L3_error)
+        }
+      }
+      if (unlikely(kw_args > 0)) {
+        if (unlikely(__Pyx_ParseOptionalKeywords(__pyx_kwds, __pyx_pyargnames, 0, values, pos_args, "GetFeedbackInto") < 0)) __PYX_ERR(0, 59, __pyx_L3_error)
+      }
+    } else if (PyTuple_GET_SIZE(__pyx_args) != 2) {
+      goto __pyx_L5_argtuple_error;
+    } else {
+      values[0] = PyTuple_GET_ITEM(__pyx_args, 0);
+      values[1] = PyTuple_GET_ITEM(__pyx_args, 1);
+    }
+    __pyx_v_q = ((PyArrayObject *)values[0]);
+    __pyx_v_dq = ((PyArrayObject *)values[1]);
+  }
+  goto __pyx_L4_argument_unpacking_done;
+  __pyx_L5_argtuple_error:;
+  __Pyx_RaiseArgtupleInvalid("GetFeedbackInto", 1, 2, 2, PyTuple_GET_SIZE(__pyx_args)); __PYX_ERR(0, 59, __pyx_L3_error)
+  __pyx_L3_error:;
+  __Pyx_AddTraceback("abr_jaco2.interface.jaco2_rs485.pyJaco2.GetFeedbackInto", __pyx_clineno, __pyx_lineno, __pyx_filename);
+  __Pyx_RefNannyFinishContext();
+  return NULL;
+  __pyx_L4_argument_unpacking_done:;
+  if (unlikely(!__Pyx_ArgTypeTest(((PyObject *)__pyx_v_q), __pyx_ptype_5numpy_ndarray, 1, "q", 0))) __PYX_ERR(0, 59, __pyx_L1_error)
+  if (unlikely(!__Pyx_ArgTypeTest(((PyObject *)__pyx_v_dq), __pyx_ptype_5numpy_ndarray, 1, "dq", 0))) __PYX_ERR(0, 60, __pyx_L1_error)
+  __pyx_r = __pyx_pf_9abr_jaco2_9interface_11jaco2_rs485_7pyJaco2_10GetFeedbackInto(((struct __pyx_obj_9abr_jaco2_9interface_11jaco2_rs485_pyJaco2 *)__pyx_v_self), __pyx_v_q, __pyx_v_dq);
+
+  /* function exit code */
+  goto __pyx_L0;
+  __pyx_L1_error:;
+  __pyx_r = NULL;
+  __pyx_L0:;
+  __Pyx_RefNannyFinishContext();
+  return __pyx_r;
+}
+
+static PyObject *__pyx_pf_9abr_jaco2_9interface_11jaco2_rs485_7pyJaco2_10GetFeedbackInto(struct __pyx_obj_9abr_jaco2_9interface_11jaco2_rs485_pyJaco2 *__pyx_v_self, PyArrayObject *__pyx_v_q, PyArrayObject *__pyx_v_dq) {
+  int __pyx_v_ii;
+  double __pyx_v_q_rad;
+  __Pyx_LocalBuf_ND __pyx_pybuffernd_dq;
+  __Pyx_Buffer __pyx_pybuffer_dq;
+  __Pyx_LocalBuf_ND __pyx_pybuffernd_q;
+  __Pyx_Buffer __pyx_pybuffer_q;
+  PyObject *__pyx_r = NULL;
+  __Pyx_RefNannyDeclarations
+  int __pyx_t_1;
+  int __pyx_t_2;
+  Py_ssize_t __pyx_t_3;
+  int __pyx_t_4;
+  Py_ssize_t __pyx_t_5;
+  __Pyx_RefNannySetupContext("GetFeedbackInto", 0);
+  __pyx_pybuffer_q.pybuffer.buf = NULL;
+  __pyx_pybuffer_q.refcount = 0;
+  __pyx_pybuffernd_q.data = NULL;
+  __pyx_pybuffernd_q.rcbuffer = &__pyx_pybuffer_q;
+  __pyx_pybuffer_dq.pybuffer.buf = NULL;
+  __pyx_pybuffer_dq.refcount = 0;
+  __pyx_pybuffernd_dq.data = NULL;
+  __pyx_pybuffernd_dq.rcbuffer = &__pyx_pybuffer_dq;
+  {
+    __Pyx_BufFmt_StackElem __pyx_stack[1];
+    if (unlikely(__Pyx_GetBufferAndValidate(&__pyx_pybuffernd_q.rcbuffer->pybuffer, (PyObject*)__pyx_v_q, &__Pyx_TypeInfo_double, PyBUF_FORMAT| PyBUF_C_CONTIGUOUS| PyBUF_WRITABLE, 1, 0, __pyx_stack) == -1)) __PYX_ERR(0, 59, __pyx_L1_error)
+  }
+  __pyx_pybuffernd_q.diminfo[0].strides = __pyx_pybuffernd_q.rcbuffer->pybuffer.strides[0]; __pyx_pybuffernd_q.diminfo[0].shape = __pyx_pybuffernd_q.rcbuffer->pybuffer.shape[0];
+  {
+    __Pyx_BufFmt_StackElem __pyx_stack[1];
+    if (unlikely(__Pyx_GetBufferAndValidate(&__pyx_pybuffernd_dq.rcbuffer->pybuffer, (PyObject*)__pyx_v_dq, &__Pyx_TypeInfo_double, PyBUF_FORMAT| PyBUF_C_CONTIGUOUS| PyBUF_WRITABLE, 1, 0, __pyx_stack) == -1)) __PYX_ERR(0, 59, __pyx_L1_error)
+  }
+  __pyx_pybuffernd_dq.diminfo[0].strides = __pyx_pybuffernd_dq.rcbuffer->pybuffer.strides[0]; __pyx_pybuffernd_dq.diminfo[0].shape = __pyx_pybuffernd_dq.rcbuffer->pybuffer.shape[0];
+
+  /* "abr_jaco2/interface/jaco2_cython.pyx":65
+ *         cdef int ii
+ *         cdef double q_rad
+ *         for ii in range(6):             # <<<<<<<<<<<<<<
+ *             q_rad = fmod(self.thisptr.pos[ii] * DEG2RAD, TWO_PI)
+ *             if q_rad < 0:
+ */
+  for (__pyx_t_1 = 0; __pyx_t_1 < 6; __pyx_t_1+=1) {
+    __pyx_v_ii = __pyx_t_1;
+
+    /* "abr_jaco2/interface/jaco2_cython.pyx":66
+ *         cdef double q_rad
+ *         for ii in range(6):
+ *             q_rad = fmod(self.thisptr.pos[ii] * DEG2RAD, TWO_PI)             # <<<<<<<<<<<<<<
+ *             if q_rad < 0:
+ *                 q_rad += TWO_PI
+ */
+    __pyx_v_q_rad = fmod(((__pyx_v_self->thisptr->pos[__pyx_v_ii]) * __pyx_v_9abr_jaco2_9interface_11jaco2_rs485_DEG2RAD), __pyx_v_9abr_jaco2_9interface_11jaco2_rs485_TWO_PI);
+
+    /* "abr_jaco2/interface/jaco2_cython.pyx":67
+ *         for ii in range(6):
+ *             q_rad = fmod(self.thisptr.pos[ii] * DEG2RAD, TWO_PI)
+ *             if q_rad < 0:             # <<<<<<<<<<<<<<
+ *                 q_rad += TWO_PI
+ *             q[ii] = q_rad
+ */
+    __pyx_t_2 = ((__pyx_v_q_rad < 0.0) != 0);
+    if (__pyx_t_2) {
+
+      /* "abr_jaco2/interface/jaco2_cython.pyx":68
+ *             q_rad = fmod(self.thisptr.pos[ii] * DEG2RAD, TWO_PI)
+ *             if q_rad < 0:
+ *                 q_rad += TWO_PI             # <<<<<<<<<<<<<<
+ *             q[ii] = q_rad
+ *             dq[ii] = self.thisptr.vel[ii] * DEG2RAD
+ */
+      __pyx_v_q_rad = (__pyx_v_q_rad + __pyx_v_9abr_jaco2_9interface_11jaco2_rs485_TWO_PI);
+
+      /* "abr_jaco2/interface/jaco2_cython.pyx":67
+ *         for ii in range(6):
+ *             q_rad = fmod(self.thisptr.pos[ii] * DEG2RAD, TWO_PI)
+ *             if q_rad < 0:             # <<<<<<<<<<<<<<
+ *                 q_rad += TWO_PI
+ *             q[ii] = q_rad
+ */
+    }
+
+    /* "abr_jaco2/interface/jaco2_cython.pyx":69
+ *             if q_rad < 0:
+ *                 q_rad += TWO_PI
+ *             q[ii] = q_rad             # <<<<<<<<<<<<<<
+ *             dq[ii] = self.thisptr.vel[ii] * DEG2RAD
+ * 
+ */
+    __pyx_t_3 = __pyx_v_ii;
+    __pyx_t_4 = -1;
+    if (__pyx_t_3 < 0) {
+      __pyx_t_3 += __pyx_pybuffernd_q.diminfo[0].shape;
+      if (unlikely(__pyx_t_3 < 0)) __pyx_t_4 = 0;
+    } else if (unlikely(__pyx_t_3 >= __pyx_pybuffernd_q.diminfo[0].shape)) __pyx_t_4 = 0;
+    if (unlikely(__pyx_t_4 != -1)) {
+      __Pyx_RaiseBufferIndexError(__pyx_t_4);
+      __PYX_ERR(0, 69, __pyx_L1_error)
+    }
+    *__Pyx_BufPtrCContig1d(double *, __pyx_pybuffernd_q.rcbuffer->pybuffer.buf, __pyx_t_3, __pyx_pybuffernd_q.diminfo[0].strides) = __pyx_v_q_rad;
+
+    /* "abr_jaco2/interface/jaco2_cython.pyx":70
+ *                 q_rad += TWO_PI
+ *             q[ii] = q_rad
+ *             dq[ii] = self.thisptr.vel[ii] * DEG2RAD             # <<<<<<<<<<<<<<
+ * 
+ *     def GetTorqueLoad(self):
+ */
+    __pyx_t_5 = __pyx_v_ii;
+    __pyx_t_4 = -1;
+    if (__pyx_t_5 < 0) {
+      __pyx_t_5 += __pyx_pybuffernd_dq.diminfo[0].shape;
+      if (unlikely(__pyx_t_5 < 0)) __pyx_t_4 = 0;
+    } else if (unlikely(__pyx_t_5 >= __pyx_pybuffernd_dq.diminfo[0].shape)) __pyx_t_4 = 0;
+    if (unlikely(__pyx_t_4 != -1)) {
+      __Pyx_RaiseBufferIndexError(__pyx_t_4);
+      __PYX_ERR(0, 70, __pyx_L1_error)
+    }
+    *__Pyx_BufPtrCContig1d(double *, __pyx_pybuffernd_dq.rcbuffer->pybuffer.buf, __pyx_t_5, __pyx_pybuffernd_dq.diminfo[0].strides) = ((__pyx_v_self->thisptr->vel[__pyx_v_ii]) * __pyx_v_9abr_jaco2_9interface_11jaco2_rs485_DEG2RAD);
+  }
+
+  /* "abr_jaco2/interface/jaco2_cython.pyx":59
  *                 'dq': self.thisptr.vel}
  * 
+ *     def GetFeedbackInto(self, np.ndarray[double, mode="c"] q,             # <<<<<<<<<<<<<<
+ *                         np.ndarray[double, mode="c"] dq):
+ *         # copy feedback into preallocated arrays, avoids building a dict,
+ */
+
+  /* function exit code */
+  __pyx_r = Py_None; __Pyx_INCREF(Py_None);
+  goto __pyx_L0;
+  __pyx_L1_error:;
+  { PyObject *__pyx_type, *__pyx_value, *__pyx_tb;
+    __Pyx_PyThreadState_declare
+    __Pyx_PyThreadState_assign
+    __Pyx_ErrFetch(&__pyx_type, &__pyx_value, &__pyx_tb);
+    __Pyx_SafeReleaseBuffer(&__pyx_pybuffernd_dq.rcbuffer->pybuffer);
+    __Pyx_SafeReleaseBuffer(&__pyx_pybuffernd_q.rcbuffer->pybuffer);
+  __Pyx_ErrRestore(__pyx_type, __pyx_value, __pyx_tb);}
+  __Pyx_AddTraceback("abr_jaco2.interface.jaco2_rs485.pyJaco2.GetFeedbackInto", __pyx_clineno, __pyx_lineno, __pyx_filename);
+  __pyx_r = NULL;
+  goto __pyx_L2;
+  __pyx_L0:;
+  __Pyx_SafeReleaseBuffer(&__pyx_pybuffernd_dq.rcbuffer->pybuffer);
+  __Pyx_SafeReleaseBuffer(&__pyx_pybuffernd_q.rcbuffer->pybuffer);
+  __pyx_L2:;
+  __Pyx_XGIVEREF(__pyx_r);
+  __Pyx_RefNannyFinishContext();
+  return __pyx_r;
+}
+
+/* "abr_jaco2/interface/jaco2_cython.pyx":72
+ *             dq[ii] = self.thisptr.vel[ii] * DEG2RAD
+ * 
  *     def GetTorqueLoad(self):             # <<<<<<<<<<<<<<
  *         # TODO: doesn't work returning self.thisptr.torque_load
  *         return {'torque_load' : self.thisptr.torque_load}
  */
 
 /* Python wrapper */
-static PyObject *__pyx_pw_9abr_jaco2_9interface_11jaco2_rs485_7pyJaco2_11GetTorqueLoad(PyObject *__pyx_v_self, CYTHON_UNUSED PyObject *unused); /*proto*/
-static PyObject *__pyx_pw_9abr_jaco2_9interface_11jaco2_rs485_7pyJaco2_11GetTorqueLoad(PyObject *__pyx_v_self, CYTHON_UNUSED PyObject *unused) {
+static PyObject *__pyx_pw_9abr_jaco2_9interface_11jaco2_rs485_7pyJaco2_13GetTorqueLoad(PyObject *__pyx_v_self, CYTHON_UNUSED PyObject *unused); /*proto*/
+static PyObject *__pyx_pw_9abr_jaco2_9interface_11jaco2_rs485_7pyJaco2_13GetTorqueLoad(PyObject *__pyx_v_self, CYTHON_UNUSED PyObject *unused) {
   PyObject *__pyx_r = 0;
   __Pyx_RefNannyDeclarations
   __Pyx_RefNannySetupContext("GetTorqueLoad (wrapper)", 0);
-  __pyx_r = __pyx_pf_9abr_jaco2_9interface_11jaco2_rs485_7pyJaco2_10GetTorqueLoad(((struct __pyx_obj_9abr_jaco2_9interface_11jaco2_rs485_pyJaco2 *)__pyx_v_self));
+  __pyx_r = __pyx_pf_9abr_jaco2_9interface_11jaco2_rs485_7pyJaco2_12GetTorqueLoad(((struct __pyx_obj_9abr_jaco2_9interface_11jaco2_rs485_pyJaco2 *)__pyx_v_self));
 
   /* function exit code */
   __Pyx_RefNannyFinishContext();
   return __pyx_r;
 }
 
-static PyObject *__pyx_pf_9abr_jaco2_9interface_11jaco2_rs485_7pyJaco2_10GetTorqueLoad(struct __pyx_obj_9abr_jaco2_9interface_11jaco2_rs485_pyJaco2 *__pyx_v_self) {
+static PyObject *__pyx_pf_9abr_jaco2_9interface_11jaco2_rs485_7pyJaco2_12GetTorqueLoad(struct __pyx_obj_9abr_jaco2_9interface_11jaco2_rs485_pyJaco2 *__pyx_v_self) {
   PyObject *__pyx_r = NULL;
   __Pyx_RefNannyDeclarations
   PyObject *__pyx_t_1 = NULL;
   PyObject *__pyx_t_2 = NULL;
   __Pyx_RefNannySetupContext("GetTorqueLoad", 0);
 
-  /* "abr_jaco2/interface/jaco2_cython.pyx":65
+  /* "abr_jaco2/interface/jaco2_cython.pyx":74
  *     def GetTorqueLoad(self):
  *         # TODO: doesn't work returning self.thisptr.torque_load
  *         return {'torque_load' : self.thisptr.torque_load}             # <<<<<<<<<<<<<<
@@ -1921,18 +2191,18 @@ static PyObject *__pyx_pf_9abr_jaco2_9interface_11jaco2_rs485_7pyJaco2_10GetTorq
  *     def InitForceMode(self):
  */
   __Pyx_XDECREF(__pyx_r);
-  __pyx_t_1 = PyDict_New(); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 65, __pyx_L1_error)
+  __pyx_t_1 = PyDict_New(); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 74, __pyx_L1_error)
   __Pyx_GOTREF(__pyx_t_1);
-  __pyx_t_2 = __Pyx_carray_to_py_float(__pyx_v_self->thisptr->torque_load, 6); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 65, __pyx_L1_error)
+  __pyx_t_2 = __Pyx_carray_to_py_float(__pyx_v_self->thisptr->torque_load, 6); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 74, __pyx_L1_error)
   __Pyx_GOTREF(__pyx_t_2);
-  if (PyDict_SetItem(__pyx_t_1, __pyx_n_s_torque_load, __pyx_t_2) < 0) __PYX_ERR(0, 65, __pyx_L1_error)
+  if (PyDict_SetItem(__pyx_t_1, __pyx_n_s_torque_load, __pyx_t_2) < 0) __PYX_ERR(0, 74, __pyx_L1_error)
   __Pyx_DECREF(__pyx_t_2); __pyx_t_2 = 0;
   __pyx_r = __pyx_t_1;
   __pyx_t_1 = 0;
   goto __pyx_L0;
 
-  /* "abr_jaco2/interface/jaco2_cython.pyx":63
- *                 'dq': self.thisptr.vel}
+  /* "abr_jaco2/interface/jaco2_cython.pyx":72
+ *             dq[ii] = self.thisptr.vel[ii] * DEG2RAD
  * 
  *     def GetTorqueLoad(self):             # <<<<<<<<<<<<<<
  *         # TODO: doesn't work returning self.thisptr.torque_load
@@ -1951,47 +2221,80 @@ static PyObject *__pyx_pf_9abr_jaco2_9interface_11jaco2_rs485_7pyJaco2_10GetTorq
   return __pyx_r;
 }
 
-/* "abr_jaco2/interface/jaco2_cython.pyx":67
+/* "abr_jaco2/interface/jaco2_cython.pyx":76
  *         return {'torque_load' : self.thisptr.torque_load}
  * 
  *     def InitForceMode(self):             # <<<<<<<<<<<<<<
- *         self.thisptr.InitForceMode()
- * 
+ *         with nogil:
+ *             self.thisptr.InitForceMode()
  */
 
 /* Python wrapper */
-static PyObject *__pyx_pw_9abr_jaco2_9interface_11jaco2_rs485_7pyJaco2_13InitForceMode(PyObject *__pyx_v_self, CYTHON_UNUSED PyObject *unused); /*proto*/
-static PyObject *__pyx_pw_9abr_jaco2_9interface_11jaco2_rs485_7pyJaco2_13InitForceMode(PyObject *__pyx_v_self, CYTHON_UNUSED PyObject *unused) {
+static PyObject *__pyx_pw_9abr_jaco2_9interface_11jaco2_rs485_7pyJaco2_15InitForceMode(PyObject *__pyx_v_self, CYTHON_UNUSED PyObject *unused); /*proto*/
+static PyObject *__pyx_pw_9abr_jaco2_9interface_11jaco2_rs485_7pyJaco2_15InitForceMode(PyObject *__pyx_v_self, CYTHON_UNUSED PyObject *unused) {
   PyObject *__pyx_r = 0;
   __Pyx_RefNannyDeclarations
   __Pyx_RefNannySetupContext("InitForceMode (wrapper)", 0);
-  __pyx_r = __pyx_pf_9abr_jaco2_9interface_11jaco2_rs485_7pyJaco2_12InitForceMode(((struct __pyx_obj_9abr_jaco2_9interface_11jaco2_rs485_pyJaco2 *)__pyx_v_self));
+  __pyx_r = __pyx_pf_9abr_jaco2_9interface_11jaco2_rs485_7pyJaco2_14InitForceMode(((struct __pyx_obj_9abr_jaco2_9interface_11jaco2_rs485_pyJaco2 *)__pyx_v_self));
 
   /* function exit code */
   __Pyx_RefNannyFinishContext();
   return __pyx_r;
 }
 
-static PyObject *__pyx_pf_9abr_jaco2_9interface_11jaco2_rs485_7pyJaco2_12InitForceMode(struct __pyx_obj_9abr_jaco2_9interface_11jaco2_rs485_pyJaco2 *__pyx_v_self) {
+static PyObject *__pyx_pf_9abr_jaco2_9interface_11jaco2_rs485_7pyJaco2_14InitForceMode(struct __pyx_obj_9abr_jaco2_9interface_11jaco2_rs485_pyJaco2 *__pyx_v_self) {
   PyObject *__pyx_r = NULL;
   __Pyx_RefNannyDeclarations
   __Pyx_RefNannySetupContext("InitForceMode", 0);
 
-  /* "abr_jaco2/interface/jaco2_cython.pyx":68
+  /* "abr_jaco2/interface/jaco2_cython.pyx":77
  * 
  *     def InitForceMode(self):
- *         self.thisptr.InitForceMode()             # <<<<<<<<<<<<<<
+ *         with nogil:             # <<<<<<<<<<<<<<
+ *             self.thisptr.InitForceMode()
+ * 
+ */
+  {
+      #ifdef WITH_THREAD
+      PyThreadState *_save;
+      Py_UNBLOCK_THREADS
+      #endif
+      /*try:*/ {
+
+        /* "abr_jaco2/interface/jaco2_cython.pyx":78
+ *     def InitForceMode(self):
+ *         with nogil:
+ *             self.thisptr.InitForceMode()             # <<<<<<<<<<<<<<
  * 
  *     def InitPositionMode(self):
  */
-  __pyx_v_self->thisptr->InitForceMode();
+        __pyx_v_self->thisptr->InitForceMode();
+      }
+
+      /* "abr_jaco2/interface/jaco2_cython.pyx":77
+ * 
+ *     def InitForceMode(self):
+ *         with nogil:             # <<<<<<<<<<<<<<
+ *             self.thisptr.InitForceMode()
+ * 
+ */
+      /*finally:*/ {
+        /*normal exit:*/{
+          #ifdef WITH_THREAD
+          Py_BLOCK_THREADS
+          #endif
+          goto __pyx_L5;
+        }
+        __pyx_L5:;
+      }
+  }
 
-  /* "abr_jaco2/interface/jaco2_cython.pyx":67
+  /* "abr_jaco2/interface/jaco2_cython.pyx":76
  *         return {'torque_load' : self.thisptr.torque_load}
  * 
  *     def InitForceMode(self):             # <<<<<<<<<<<<<<
- *         self.thisptr.InitForceMode()
- * 
+ *         with nogil:
+ *             self.thisptr.InitForceMode()
  */
 
   /* function exit code */
@@ -2001,47 +2304,80 @@ static PyObject *__pyx_pf_9abr_jaco2_9interface_11jaco2_rs485_7pyJaco2_12InitFor
   return __pyx_r;
 }
 
-/* "abr_jaco2/interface/jaco2_cython.pyx":70
- *         self.thisptr.InitForceMode()
+/* "abr_jaco2/interface/jaco2_cython.pyx":80
+ *             self.thisptr.InitForceMode()
  * 
  *     def InitPositionMode(self):             # <<<<<<<<<<<<<<
- *         self.thisptr.InitPositionMode()
- * 
+ *         with nogil:
+ *             self.thisptr.InitPositionMode()
  */
 
 /* Python wrapper */
-static PyObject *__pyx_pw_9abr_jaco2_9interface_11jaco2_rs485_7pyJaco2_15InitPositionMode(PyObject *__pyx_v_self, CYTHON_UNUSED PyObject *unused); /*proto*/
-static PyObject *__pyx_pw_9abr_jaco2_9interface_11jaco2_rs485_7pyJaco2_15InitPositionMode(PyObject *__pyx_v_self, CYTHON_UNUSED PyObject *unused) {
+static PyObject *__pyx_pw_9abr_jaco2_9interface_11jaco2_rs485_7pyJaco2_17InitPositionMode(PyObject *__pyx_v_self, CYTHON_UNUSED PyObject *unused); /*proto*/
+static PyObject *__pyx_pw_9abr_jaco2_9interface_11jaco2_rs485_7pyJaco2_17InitPositionMode(PyObject *__pyx_v_self, CYTHON_UNUSED PyObject *unused) {
   PyObject *__pyx_r = 0;
   __Pyx_RefNannyDeclarations
   __Pyx_RefNannySetupContext("InitPositionMode (wrapper)", 0);
-  __pyx_r = __pyx_pf_9abr_jaco2_9interface_11jaco2_rs485_7pyJaco2_14InitPositionMode(((struct __pyx_obj_9abr_jaco2_9interface_11jaco2_rs485_pyJaco2 *)__pyx_v_self));
+  __pyx_r = __pyx_pf_9abr_jaco2_9interface_11jaco2_rs485_7pyJaco2_16InitPositionMode(((struct __pyx_obj_9abr_jaco2_9interface_11jaco2_rs485_pyJaco2 *)__pyx_v_self));
 
   /* function exit code */
   __Pyx_RefNannyFinishContext();
   return __pyx_r;
 }
 
-static PyObject *__pyx_pf_9abr_jaco2_9interface_11jaco2_rs485_7pyJaco2_14InitPositionMode(struct __pyx_obj_9abr_jaco2_9interface_11jaco2_rs485_pyJaco2 *__pyx_v_self) {
+static PyObject *__pyx_pf_9abr_jaco2_9interface_11jaco2_rs485_7pyJaco2_16InitPositionMode(struct __pyx_obj_9abr_jaco2_9interface_11jaco2_rs485_pyJaco2 *__pyx_v_self) {
   PyObject *__pyx_r = NULL;
   __Pyx_RefNannyDeclarations
   __Pyx_RefNannySetupContext("InitPositionMode", 0);
 
-  /* "abr_jaco2/interface/jaco2_cython.pyx":71
+  /* "abr_jaco2/interface/jaco2_cython.pyx":81
+ * 
+ *     def InitPositionMode(self):
+ *         with nogil:             # <<<<<<<<<<<<<<
+ *             self.thisptr.InitPositionMode()
  * 
+ */
+  {
+      #ifdef WITH_THREAD
+      PyThreadState *_save;
+      Py_UNBLOCK_THREADS
+      #endif
+      /*try:*/ {
+
+        /* "abr_jaco2/interface/jaco2_cython.pyx":82
  *     def InitPositionMode(self):
- *         self.thisptr.InitPositionMode()             # <<<<<<<<<<<<<<
+ *         with nogil:
+ *             self.thisptr.InitPositionMode()             # <<<<<<<<<<<<<<
  * 
  *     def SendForces(self, np.ndarray[float, mode="c"] u):
  */
-  __pyx_v_self->thisptr->InitPositionMode();
+        __pyx_v_self->thisptr->InitPositionMode();
+      }
 
-  /* "abr_jaco2/interface/jaco2_cython.pyx":70
- *         self.thisptr.InitForceMode()
+      /* "abr_jaco2/interface/jaco2_cython.pyx":81
  * 
- *     def InitPositionMode(self):             # <<<<<<<<<<<<<<
- *         self.thisptr.InitPositionMode()
+ *     def InitPositionMode(self):
+ *         with nogil:             # <<<<<<<<<<<<<<
+ *             self.thisptr.InitPositionMode()
+ * 
+ */
+      /*finally:*/ {
+        /*normal exit:*/{
+          #ifdef WITH_THREAD
+          Py_BLOCK_THREADS
+          #endif
+          goto __pyx_L5;
+        }
+        __pyx_L5:;
+      }
+  }
+
+  /* "abr_jaco2/interface/jaco2_cython.pyx":80
+ *             self.thisptr.InitForceMode()
  * 
+ *     def InitPositionMode(self):             # <<<<<<<<<<<<<<
+ *         with nogil:
+ *             self.thisptr.InitPositionMode()
  */
 
   /* function exit code */
@@ -2051,22 +2387,22 @@ static PyObject *__pyx_pf_9abr_jaco2_9interface_11jaco2_rs485_7pyJaco2_14InitPos
   return __pyx_r;
 }
 
-/* "abr_jaco2/interface/jaco2_cython.pyx":73
- *         self.thisptr.InitPositionMode()
+/* "abr_jaco2/interface/jaco2_cython.pyx":84
+ *             self.thisptr.InitPositionMode()
  * 
  *     def SendForces(self, np.ndarray[float, mode="c"] u):             # <<<<<<<<<<<<<<
- *         self.thisptr.SendForces(&u[0])
- * 
+ *         cdef float* u_ptr = &u[0]
+ *         with nogil:
  */
 
 /* Python wrapper */
-static PyObject *__pyx_pw_9abr_jaco2_9interface_11jaco2_rs485_7pyJaco2_17SendForces(PyObject *__pyx_v_self, PyObject *__pyx_v_u); /*proto*/
-static PyObject *__pyx_pw_9abr_jaco2_9interface_11jaco2_rs485_7pyJaco2_17SendForces(PyObject *__pyx_v_self, PyObject *__pyx_v_u) {
+static PyObject *__pyx_pw_9abr_jaco2_9interface_11jaco2_rs485_7pyJaco2_19SendForces(PyObject *__pyx_v_self, PyObject *__pyx_v_u); /*proto*/
+static PyObject *__pyx_pw_9abr_jaco2_9interface_11jaco2_rs485_7pyJaco2_19SendForces(PyObject *__pyx_v_self, PyObject *__pyx_v_u) {
   PyObject *__pyx_r = 0;
   __Pyx_RefNannyDeclarations
   __Pyx_RefNannySetupContext("SendForces (wrapper)", 0);
-  if (unlikely(!__Pyx_ArgTypeTest(((PyObject *)__pyx_v_u), __pyx_ptype_5numpy_ndarray, 1, "u", 0))) __PYX_ERR(0, 73, __pyx_L1_error)
-  __pyx_r = __pyx_pf_9abr_jaco2_9interface_11jaco2_rs485_7pyJaco2_16SendForces(((struct __pyx_obj_9abr_jaco2_9interface_11jaco2_rs485_pyJaco2 *)__pyx_v_self), ((PyArrayObject *)__pyx_v_u));
+  if (unlikely(!__Pyx_ArgTypeTest(((PyObject *)__pyx_v_u), __pyx_ptype_5numpy_ndarray, 1, "u", 0))) __PYX_ERR(0, 84, __pyx_L1_error)
+  __pyx_r = __pyx_pf_9abr_jaco2_9interface_11jaco2_rs485_7pyJaco2_18SendForces(((struct __pyx_obj_9abr_jaco2_9interface_11jaco2_rs485_pyJaco2 *)__pyx_v_self), ((PyArrayObject *)__pyx_v_u));
 
   /* function exit code */
   goto __pyx_L0;
@@ -2077,7 +2413,8 @@ static PyObject *__pyx_pw_9abr_jaco2_9interface_11jaco2_rs485_7pyJaco2_17SendFor
   return __pyx_r;
 }
 
-static PyObject *__pyx_pf_9abr_jaco2_9interface_11jaco2_rs485_7pyJaco2_16SendForces(struct __pyx_obj_9abr_jaco2_9interface_11jaco2_rs485_pyJaco2 *__pyx_v_self, PyArrayObject *__pyx_v_u) {
+static PyObject *__pyx_pf_9abr_jaco2_9interface_11jaco2_rs485_7pyJaco2_18SendForces(struct __pyx_obj_9abr_jaco2_9interface_11jaco2_rs485_pyJaco2 *__pyx_v_self, PyArrayObject *__pyx_v_u) {
+  float *__pyx_v_u_ptr;
   __Pyx_LocalBuf_ND __pyx_pybuffernd_u;
   __Pyx_Buffer __pyx_pybuffer_u;
   PyObject *__pyx_r = NULL;
@@ -2091,16 +2428,16 @@ static PyObject *__pyx_pf_9abr_jaco2_9interface_11jaco2_rs485_7pyJaco2_16SendFor
   __pyx_pybuffernd_u.rcbuffer = &__pyx_pybuffer_u;
   {
     __Pyx_BufFmt_StackElem __pyx_stack[1];
-    if (unlikely(__Pyx_GetBufferAndValidate(&__pyx_pybuffernd_u.rcbuffer->pybuffer, (PyObject*)__pyx_v_u, &__Pyx_TypeInfo_float, PyBUF_FORMAT| PyBUF_C_CONTIGUOUS, 1, 0, __pyx_stack) == -1)) __PYX_ERR(0, 73, __pyx_L1_error)
+    if (unlikely(__Pyx_GetBufferAndValidate(&__pyx_pybuffernd_u.rcbuffer->pybuffer, (PyObject*)__pyx_v_u, &__Pyx_TypeInfo_float, PyBUF_FORMAT| PyBUF_C_CONTIGUOUS, 1, 0, __pyx_stack) == -1)) __PYX_ERR(0, 84, __pyx_L1_error)
   }
   __pyx_pybuffernd_u.diminfo[0].strides = __pyx_pybuffernd_u.rcbuffer->pybuffer.strides[0]; __pyx_pybuffernd_u.diminfo[0].shape = __pyx_pybuffernd_u.rcbuffer->pybuffer.shape[0];
 
-  /* "abr_jaco2/interface/jaco2_cython.pyx":74
+  /* "abr_jaco2/interface/jaco2_cython.pyx":85
  * 
  *     def SendForces(self, np.ndarray[float, mode="c"] u):
- *         self.thisptr.SendForces(&u[0])             # <<<<<<<<<<<<<<
- * 
- *     def SendTargetAngles(self, np.ndarray[float, mode="c"] q_target):
+ *         cdef float* u_ptr = &u[0]             # <<<<<<<<<<<<<<
+ *         with nogil:
+ *             self.thisptr.SendForces(u_ptr)
  */
   __pyx_t_1 = 0;
   __pyx_t_2 = -1;
@@ -2110,16 +2447,58 @@ static PyObject *__pyx_pf_9abr_jaco2_9interface_11jaco2_rs485_7pyJaco2_16SendFor
   } else if (unlikely(__pyx_t_1 >= __pyx_pybuffernd_u.diminfo[0].shape)) __pyx_t_2 = 0;
   if (unlikely(__pyx_t_2 != -1)) {
     __Pyx_RaiseBufferIndexError(__pyx_t_2);
-    __PYX_ERR(0, 74, __pyx_L1_error)
+    __PYX_ERR(0, 85, __pyx_L1_error)
   }
-  __pyx_v_self->thisptr->SendForces((&(*__Pyx_BufPtrCContig1d(float *, __pyx_pybuffernd_u.rcbuffer->pybuffer.buf, __pyx_t_1, __pyx_pybuffernd_u.diminfo[0].strides))));
+  __pyx_v_u_ptr = (&(*__Pyx_BufPtrCContig1d(float *, __pyx_pybuffernd_u.rcbuffer->pybuffer.buf, __pyx_t_1, __pyx_pybuffernd_u.diminfo[0].strides)));
 
-  /* "abr_jaco2/interface/jaco2_cython.pyx":73
- *         self.thisptr.InitPositionMode()
+  /* "abr_jaco2/interface/jaco2_cython.pyx":86
+ *     def SendForces(self, np.ndarray[float, mode="c"] u):
+ *         cdef float* u_ptr = &u[0]
+ *         with nogil:             # <<<<<<<<<<<<<<
+ *             self.thisptr.SendForces(u_ptr)
  * 
- *     def SendForces(self, np.ndarray[float, mode="c"] u):             # <<<<<<<<<<<<<<
- *         self.thisptr.SendForces(&u[0])
+ */
+  {
+      #ifdef WITH_THREAD
+      PyThreadState *_save;
+      Py_UNBLOCK_THREADS
+      #endif
+      /*try:*/ {
+
+        /* "abr_jaco2/interface/jaco2_cython.pyx":87
+ *         cdef float* u_ptr = &u[0]
+ *         with nogil:
+ *             self.thisptr.SendForces(u_ptr)             # <<<<<<<<<<<<<<
+ * 
+ *     def SendTargetAngles(self, np.ndarray[float, mode="c"] q_target):
+ */
+        __pyx_v_self->thisptr->SendForces(__pyx_v_u_ptr);
+      }
+
+      /* "abr_jaco2/interface/jaco2_cython.pyx":86
+ *     def SendForces(self, np.ndarray[float, mode="c"] u):
+ *         cdef float* u_ptr = &u[0]
+ *         with nogil:             # <<<<<<<<<<<<<<
+ *             self.thisptr.SendForces(u_ptr)
+ * 
+ */
+      /*finally:*/ {
+        /*normal exit:*/{
+          #ifdef WITH_THREAD
+          Py_BLOCK_THREADS
+          #endif
+          goto __pyx_L5;
+        }
+        __pyx_L5:;
+      }
+  }
+
+  /* "abr_jaco2/interface/jaco2_cython.pyx":84
+ *             self.thisptr.InitPositionMode()
  * 
+ *     def SendForces(self, np.ndarray[float, mode="c"] u):             # <<<<<<<<<<<<<<
+ *         cdef float* u_ptr = &u[0]
+ *         with nogil:
  */
 
   /* function exit code */
@@ -2143,22 +2522,22 @@ static PyObject *__pyx_pf_9abr_jaco2_9interface_11jaco2_rs485_7pyJaco2_16SendFor
   return __pyx_r;
 }
 
-/* "abr_jaco2/interface/jaco2_cython.pyx":76
- *         self.thisptr.SendForces(&u[0])
+/* "abr_jaco2/interface/jaco2_cython.pyx":89
+ *             self.thisptr.SendForces(u_ptr)
  * 
  *     def SendTargetAngles(self, np.ndarray[float, mode="c"] q_target):             # <<<<<<<<<<<<<<
- *         target_reached = 0
- *         self.thisptr.SendTargetAnglesSetup()
+ *         cdef int target_reached = 0
+ *         cdef float* q_target_ptr = &q_target[0]
  */
 
 /* Python wrapper */
-static PyObject *__pyx_pw_9abr_jaco2_9interface_11jaco2_rs485_7pyJaco2_19SendTargetAngles(PyObject *__pyx_v_self, PyObject *__pyx_v_q_target); /*proto*/
-static PyObject *__pyx_pw_9abr_jaco2_9interface_11jaco2_rs485_7pyJaco2_19SendTargetAngles(PyObject *__pyx_v_self, PyObject *__pyx_v_q_target) {
+static PyObject *__pyx_pw_9abr_jaco2_9interface_11jaco2_rs485_7pyJaco2_21SendTargetAngles(PyObject *__pyx_v_self, PyObject *__pyx_v_q_target); /*proto*/
+static PyObject *__pyx_pw_9abr_jaco2_9interface_11jaco2_rs485_7pyJaco2_21SendTargetAngles(PyObject *__pyx_v_self, PyObject *__pyx_v_q_target) {
   PyObject *__pyx_r = 0;
   __Pyx_RefNannyDeclarations
   __Pyx_RefNannySetupContext("SendTargetAngles (wrapper)", 0);
-  if (unlikely(!__Pyx_ArgTypeTest(((PyObject *)__pyx_v_q_target), __pyx_ptype_5numpy_ndarray, 1, "q_target", 0))) __PYX_ERR(0, 76, __pyx_L1_error)
-  __pyx_r = __pyx_pf_9abr_jaco2_9interface_11jaco2_rs485_7pyJaco2_18SendTargetAngles(((struct __pyx_obj_9abr_jaco2_9interface_11jaco2_rs485_pyJaco2 *)__pyx_v_self), ((PyArrayObject *)__pyx_v_q_target));
+  if (unlikely(!__Pyx_ArgTypeTest(((PyObject *)__pyx_v_q_target), __pyx_ptype_5numpy_ndarray, 1, "q_target", 0))) __PYX_ERR(0, 89, __pyx_L1_error)
+  __pyx_r = __pyx_pf_9abr_jaco2_9interface_11jaco2_rs485_7pyJaco2_20SendTargetAngles(((struct __pyx_obj_9abr_jaco2_9interface_11jaco2_rs485_pyJaco2 *)__pyx_v_self), ((PyArrayObject *)__pyx_v_q_target));
 
   /* function exit code */
   goto __pyx_L0;
@@ -2169,14 +2548,15 @@ static PyObject *__pyx_pw_9abr_jaco2_9interface_11jaco2_rs485_7pyJaco2_19SendTar
   return __pyx_r;
 }
 
-static PyObject *__pyx_pf_9abr_jaco2_9interface_11jaco2_rs485_7pyJaco2_18SendTargetAngles(struct __pyx_obj_9abr_jaco2_9interface_11jaco2_rs485_pyJaco2 *__pyx_v_self, PyArrayObject *__pyx_v_q_target) {
-  long __pyx_v_target_reached;
+static PyObject *__pyx_pf_9abr_jaco2_9interface_11jaco2_rs485_7pyJaco2_20SendTargetAngles(struct __pyx_obj_9abr_jaco2_9interface_11jaco2_rs485_pyJaco2 *__pyx_v_self, PyArrayObject *__pyx_v_q_target) {
+  int __pyx_v_target_reached;
+  float *__pyx_v_q_target_ptr;
   __Pyx_LocalBuf_ND __pyx_pybuffernd_q_target;
   __Pyx_Buffer __pyx_pybuffer_q_target;
   PyObject *__pyx_r = NULL;
   __Pyx_RefNannyDeclarations
-  int __pyx_t_1;
-  Py_ssize_t __pyx_t_2;
+  Py_ssize_t __pyx_t_1;
+  int __pyx_t_2;
   int __pyx_t_3;
   PyObject *__pyx_t_4 = NULL;
   PyObject *__pyx_t_5 = NULL;
@@ -2190,106 +2570,181 @@ static PyObject *__pyx_pf_9abr_jaco2_9interface_11jaco2_rs485_7pyJaco2_18SendTar
   __pyx_pybuffernd_q_target.rcbuffer = &__pyx_pybuffer_q_target;
   {
     __Pyx_BufFmt_StackElem __pyx_stack[1];
-    if (unlikely(__Pyx_GetBufferAndValidate(&__pyx_pybuffernd_q_target.rcbuffer->pybuffer, (PyObject*)__pyx_v_q_target, &__Pyx_TypeInfo_float, PyBUF_FORMAT| PyBUF_C_CONTIGUOUS, 1, 0, __pyx_stack) == -1)) __PYX_ERR(0, 76, __pyx_L1_error)
+    if (unlikely(__Pyx_GetBufferAndValidate(&__pyx_pybuffernd_q_target.rcbuffer->pybuffer, (PyObject*)__pyx_v_q_target, &__Pyx_TypeInfo_float, PyBUF_FORMAT| PyBUF_C_CONTIGUOUS, 1, 0, __pyx_stack) == -1)) __PYX_ERR(0, 89, __pyx_L1_error)
   }
   __pyx_pybuffernd_q_target.diminfo[0].strides = __pyx_pybuffernd_q_target.rcbuffer->pybuffer.strides[0]; __pyx_pybuffernd_q_target.diminfo[0].shape = __pyx_pybuffernd_q_target.rcbuffer->pybuffer.shape[0];
 
-  /* "abr_jaco2/interface/jaco2_cython.pyx":77
+  /* "abr_jaco2/interface/jaco2_cython.pyx":90
  * 
  *     def SendTargetAngles(self, np.ndarray[float, mode="c"] q_target):
- *         target_reached = 0             # <<<<<<<<<<<<<<
- *         self.thisptr.SendTargetAnglesSetup()
- *         while target_reached < 6:
+ *         cdef int target_reached = 0             # <<<<<<<<<<<<<<
+ *         cdef float* q_target_ptr = &q_target[0]
+ *         with nogil:
  */
   __pyx_v_target_reached = 0;
 
-  /* "abr_jaco2/interface/jaco2_cython.pyx":78
+  /* "abr_jaco2/interface/jaco2_cython.pyx":91
  *     def SendTargetAngles(self, np.ndarray[float, mode="c"] q_target):
- *         target_reached = 0
- *         self.thisptr.SendTargetAnglesSetup()             # <<<<<<<<<<<<<<
+ *         cdef int target_reached = 0
+ *         cdef float* q_target_ptr = &q_target[0]             # <<<<<<<<<<<<<<
+ *         with nogil:
+ *             self.thisptr.SendTargetAnglesSetup()
+ */
+  __pyx_t_1 = 0;
+  __pyx_t_2 = -1;
+  if (__pyx_t_1 < 0) {
+    __pyx_t_1 += __pyx_pybuffernd_q_target.diminfo[0].shape;
+    if (unlikely(__pyx_t_1 < 0)) __pyx_t_2 = 0;
+  } else if (unlikely(__pyx_t_1 >= __pyx_pybuffernd_q_target.diminfo[0].shape)) __pyx_t_2 = 0;
+  if (unlikely(__pyx_t_2 != -1)) {
+    __Pyx_RaiseBufferIndexError(__pyx_t_2);
+    __PYX_ERR(0, 91, __pyx_L1_error)
+  }
+  __pyx_v_q_target_ptr = (&(*__Pyx_BufPtrCContig1d(float *, __pyx_pybuffernd_q_target.rcbuffer->pybuffer.buf, __pyx_t_1, __pyx_pybuffernd_q_target.diminfo[0].strides)));
+
+  /* "abr_jaco2/interface/jaco2_cython.pyx":92
+ *         cdef int target_reached = 0
+ *         cdef float* q_target_ptr = &q_target[0]
+ *         with nogil:             # <<<<<<<<<<<<<<
+ *             self.thisptr.SendTargetAnglesSetup()
+ *         while target_reached < 6:
+ */
+  {
+      #ifdef WITH_THREAD
+      PyThreadState *_save;
+      Py_UNBLOCK_THREADS
+      #endif
+      /*try:*/ {
+
+        /* "abr_jaco2/interface/jaco2_cython.pyx":93
+ *         cdef float* q_target_ptr = &q_target[0]
+ *         with nogil:
+ *             self.thisptr.SendTargetAnglesSetup()             # <<<<<<<<<<<<<<
+ *         while target_reached < 6:
+ *             with nogil:
+ */
+        __pyx_v_self->thisptr->SendTargetAnglesSetup();
+      }
+
+      /* "abr_jaco2/interface/jaco2_cython.pyx":92
+ *         cdef int target_reached = 0
+ *         cdef float* q_target_ptr = &q_target[0]
+ *         with nogil:             # <<<<<<<<<<<<<<
+ *             self.thisptr.SendTargetAnglesSetup()
  *         while target_reached < 6:
- *             target_reached = self.thisptr.SendTargetAngles(&q_target[0])
  */
-  __pyx_v_self->thisptr->SendTargetAnglesSetup();
+      /*finally:*/ {
+        /*normal exit:*/{
+          #ifdef WITH_THREAD
+          Py_BLOCK_THREADS
+          #endif
+          goto __pyx_L5;
+        }
+        __pyx_L5:;
+      }
+  }
 
-  /* "abr_jaco2/interface/jaco2_cython.pyx":79
- *         target_reached = 0
- *         self.thisptr.SendTargetAnglesSetup()
+  /* "abr_jaco2/interface/jaco2_cython.pyx":94
+ *         with nogil:
+ *             self.thisptr.SendTargetAnglesSetup()
  *         while target_reached < 6:             # <<<<<<<<<<<<<<
- *             target_reached = self.thisptr.SendTargetAngles(&q_target[0])
- *             if self.use_redis:
+ *             with nogil:
+ *                 target_reached = self.thisptr.SendTargetAngles(q_target_ptr)
  */
   while (1) {
-    __pyx_t_1 = ((__pyx_v_target_reached < 6) != 0);
-    if (!__pyx_t_1) break;
+    __pyx_t_3 = ((__pyx_v_target_reached < 6) != 0);
+    if (!__pyx_t_3) break;
 
-    /* "abr_jaco2/interface/jaco2_cython.pyx":80
- *         self.thisptr.SendTargetAnglesSetup()
+    /* "abr_jaco2/interface/jaco2_cython.pyx":95
+ *             self.thisptr.SendTargetAnglesSetup()
  *         while target_reached < 6:
- *             target_reached = self.thisptr.SendTargetAngles(&q_target[0])             # <<<<<<<<<<<<<<
+ *             with nogil:             # <<<<<<<<<<<<<<
+ *                 target_reached = self.thisptr.SendTargetAngles(q_target_ptr)
+ *             if self.use_redis:
+ */
+    {
+        #ifdef WITH_THREAD
+        PyThreadState *_save;
+        Py_UNBLOCK_THREADS
+        #endif
+        /*try:*/ {
+
+          /* "abr_jaco2/interface/jaco2_cython.pyx":96
+ *         while target_reached < 6:
+ *             with nogil:
+ *                 target_reached = self.thisptr.SendTargetAngles(q_target_ptr)             # <<<<<<<<<<<<<<
  *             if self.use_redis:
  *                 self.r.set('q', '%.3f %.3f %.3f %.3f %.3f %.3f' %
  */
-    __pyx_t_2 = 0;
-    __pyx_t_3 = -1;
-    if (__pyx_t_2 < 0) {
-      __pyx_t_2 += __pyx_pybuffernd_q_target.diminfo[0].shape;
-      if (unlikely(__pyx_t_2 < 0)) __pyx_t_3 = 0;
-    } else if (unlikely(__pyx_t_2 >= __pyx_pybuffernd_q_target.diminfo[0].shape)) __pyx_t_3 = 0;
-    if (unlikely(__pyx_t_3 != -1)) {
-      __Pyx_RaiseBufferIndexError(__pyx_t_3);
-      __PYX_ERR(0, 80, __pyx_L1_error)
-    }
-    __pyx_v_target_reached = __pyx_v_self->thisptr->SendTargetAngles((&(*__Pyx_BufPtrCContig1d(float *, __pyx_pybuffernd_q_target.rcbuffer->pybuffer.buf, __pyx_t_2, __pyx_pybuffernd_q_target.diminfo[0].strides))));
+          __pyx_v_target_reached = __pyx_v_self->thisptr->SendTargetAngles(__pyx_v_q_target_ptr);
+        }
 
-    /* "abr_jaco2/interface/jaco2_cython.pyx":81
+        /* "abr_jaco2/interface/jaco2_cython.pyx":95
+ *             self.thisptr.SendTargetAnglesSetup()
  *         while target_reached < 6:
- *             target_reached = self.thisptr.SendTargetAngles(&q_target[0])
+ *             with nogil:             # <<<<<<<<<<<<<<
+ *                 target_reached = self.thisptr.SendTargetAngles(q_target_ptr)
+ *             if self.use_redis:
+ */
+        /*finally:*/ {
+          /*normal exit:*/{
+            #ifdef WITH_THREAD
+            Py_BLOCK_THREADS
+            #endif
+            goto __pyx_L12;
+          }
+          __pyx_L12:;
+        }
+    }
+
+    /* "abr_jaco2/interface/jaco2_cython.pyx":97
+ *             with nogil:
+ *                 target_reached = self.thisptr.SendTargetAngles(q_target_ptr)
  *             if self.use_redis:             # <<<<<<<<<<<<<<
  *                 self.r.set('q', '%.3f %.3f %.3f %.3f %.3f %.3f' %
  *                       tuple(self.thisptr.pos_rad))
  */
-    __pyx_t_1 = (__pyx_v_self->use_redis != 0);
-    if (__pyx_t_1) {
+    __pyx_t_3 = (__pyx_v_self->use_redis != 0);
+    if (__pyx_t_3) {
 
-      /* "abr_jaco2/interface/jaco2_cython.pyx":82
- *             target_reached = self.thisptr.SendTargetAngles(&q_target[0])
+      /* "abr_jaco2/interface/jaco2_cython.pyx":98
+ *                 target_reached = self.thisptr.SendTargetAngles(q_target_ptr)
  *             if self.use_redis:
  *                 self.r.set('q', '%.3f %.3f %.3f %.3f %.3f %.3f' %             # <<<<<<<<<<<<<<
  *                       tuple(self.thisptr.pos_rad))
  * 
  */
-      __pyx_t_5 = __Pyx_PyObject_GetAttrStr(((PyObject *)__pyx_v_self), __pyx_n_s_r); if (unlikely(!__pyx_t_5)) __PYX_ERR(0, 82, __pyx_L1_error)
+      __pyx_t_5 = __Pyx_PyObject_GetAttrStr(((PyObject *)__pyx_v_self), __pyx_n_s_r); if (unlikely(!__pyx_t_5)) __PYX_ERR(0, 98, __pyx_L1_error)
       __Pyx_GOTREF(__pyx_t_5);
-      __pyx_t_6 = __Pyx_PyObject_GetAttrStr(__pyx_t_5, __pyx_n_s_set); if (unlikely(!__pyx_t_6)) __PYX_ERR(0, 82, __pyx_L1_error)
+      __pyx_t_6 = __Pyx_PyObject_GetAttrStr(__pyx_t_5, __pyx_n_s_set); if (unlikely(!__pyx_t_6)) __PYX_ERR(0, 98, __pyx_L1_error)
       __Pyx_GOTREF(__pyx_t_6);
       __Pyx_DECREF(__pyx_t_5); __pyx_t_5 = 0;
 
-      /* "abr_jaco2/interface/jaco2_cython.pyx":83
+      /* "abr_jaco2/interface/jaco2_cython.pyx":99
  *             if self.use_redis:
  *                 self.r.set('q', '%.3f %.3f %.3f %.3f %.3f %.3f' %
  *                       tuple(self.thisptr.pos_rad))             # <<<<<<<<<<<<<<
  * 
  *     def SendTargetAnglesHand(self, bool open):
  */
-      __pyx_t_5 = __Pyx_carray_to_py_float(__pyx_v_self->thisptr->pos_rad, 6); if (unlikely(!__pyx_t_5)) __PYX_ERR(0, 83, __pyx_L1_error)
+      __pyx_t_5 = __Pyx_carray_to_py_float(__pyx_v_self->thisptr->pos_rad, 6); if (unlikely(!__pyx_t_5)) __PYX_ERR(0, 99, __pyx_L1_error)
       __Pyx_GOTREF(__pyx_t_5);
-      __pyx_t_7 = PySequence_Tuple(__pyx_t_5); if (unlikely(!__pyx_t_7)) __PYX_ERR(0, 83, __pyx_L1_error)
+      __pyx_t_7 = PySequence_Tuple(__pyx_t_5); if (unlikely(!__pyx_t_7)) __PYX_ERR(0, 99, __pyx_L1_error)
       __Pyx_GOTREF(__pyx_t_7);
       __Pyx_DECREF(__pyx_t_5); __pyx_t_5 = 0;
 
-      /* "abr_jaco2/interface/jaco2_cython.pyx":82
- *             target_reached = self.thisptr.SendTargetAngles(&q_target[0])
+      /* "abr_jaco2/interface/jaco2_cython.pyx":98
+ *                 target_reached = self.thisptr.SendTargetAngles(q_target_ptr)
  *             if self.use_redis:
  *                 self.r.set('q', '%.3f %.3f %.3f %.3f %.3f %.3f' %             # <<<<<<<<<<<<<<
  *                       tuple(self.thisptr.pos_rad))
  * 
  */
-      __pyx_t_5 = __Pyx_PyString_Format(__pyx_kp_s_3f_3f_3f_3f_3f_3f, __pyx_t_7); if (unlikely(!__pyx_t_5)) __PYX_ERR(0, 82, __pyx_L1_error)
+      __pyx_t_5 = __Pyx_PyString_Format(__pyx_kp_s_3f_3f_3f_3f_3f_3f, __pyx_t_7); if (unlikely(!__pyx_t_5)) __PYX_ERR(0, 98, __pyx_L1_error)
       __Pyx_GOTREF(__pyx_t_5);
       __Pyx_DECREF(__pyx_t_7); __pyx_t_7 = 0;
       __pyx_t_7 = NULL;
-      __pyx_t_3 = 0;
+      __pyx_t_2 = 0;
       if (CYTHON_UNPACK_METHODS && likely(PyMethod_Check(__pyx_t_6))) {
         __pyx_t_7 = PyMethod_GET_SELF(__pyx_t_6);
         if (likely(__pyx_t_7)) {
@@ -2297,13 +2752,13 @@ static PyObject *__pyx_pf_9abr_jaco2_9interface_11jaco2_rs485_7pyJaco2_18SendTar
           __Pyx_INCREF(__pyx_t_7);
           __Pyx_INCREF(function);
           __Pyx_DECREF_SET(__pyx_t_6, function);
-          __pyx_t_3 = 1;
+          __pyx_t_2 = 1;
         }
       }
       #if CYTHON_FAST_PYCALL
       if (PyFunction_Check(__pyx_t_6)) {
         PyObject *__pyx_temp[3] = {__pyx_t_7, __pyx_n_s_q, __pyx_t_5};
-        __pyx_t_4 = __Pyx_PyFunction_FastCall(__pyx_t_6, __pyx_temp+1-__pyx_t_3, 2+__pyx_t_3); if (unlikely(!__pyx_t_4)) __PYX_ERR(0, 82, __pyx_L1_error)
+        __pyx_t_4 = __Pyx_PyFunction_FastCall(__pyx_t_6, __pyx_temp+1-__pyx_t_2, 2+__pyx_t_2); if (unlikely(!__pyx_t_4)) __PYX_ERR(0, 98, __pyx_L1_error)
         __Pyx_XDECREF(__pyx_t_7); __pyx_t_7 = 0;
         __Pyx_GOTREF(__pyx_t_4);
         __Pyx_DECREF(__pyx_t_5); __pyx_t_5 = 0;
@@ -2312,34 +2767,34 @@ static PyObject *__pyx_pf_9abr_jaco2_9interface_11jaco2_rs485_7pyJaco2_18SendTar
       #if CYTHON_FAST_PYCCALL
       if (__Pyx_PyFastCFunction_Check(__pyx_t_6)) {
         PyObject *__pyx_temp[3] = {__pyx_t_7, __pyx_n_s_q, __pyx_t_5};
-        __pyx_t_4 = __Pyx_PyCFunction_FastCall(__pyx_t_6, __pyx_temp+1-__pyx_t_3, 2+__pyx_t_3); if (unlikely(!__pyx_t_4)) __PYX_ERR(0, 82, __pyx_L1_error)
+        __pyx_t_4 = __Pyx_PyCFunction_FastCall(__pyx_t_6, __pyx_temp+1-__pyx_t_2, 2+__pyx_t_2); if (unlikely(!__pyx_t_4)) __PYX_ERR(0, 98, __pyx_L1_error)
         __Pyx_XDECREF(__pyx_t_7); __pyx_t_7 = 0;
         __Pyx_GOTREF(__pyx_t_4);
         __Pyx_DECREF(__pyx_t_5); __pyx_t_5 = 0;
       } else
       #endif
       {
-        __pyx_t_8 = PyTuple_New(2+__pyx_t_3); if (unlikely(!__pyx_t_8)) __PYX_ERR(0, 82, __pyx_L1_error)
+        __pyx_t_8 = PyTuple_New(2+__pyx_t_2); if (unlikely(!__pyx_t_8)) __PYX_ERR(0, 98, __pyx_L1_error)
         __Pyx_GOTREF(__pyx_t_8);
         if (__pyx_t_7) {
           __Pyx_GIVEREF(__pyx_t_7); PyTuple_SET_ITEM(__pyx_t_8, 0, __pyx_t_7); __pyx_t_7 = NULL;
         }
         __Pyx_INCREF(__pyx_n_s_q);
         __Pyx_GIVEREF(__pyx_n_s_q);
-        PyTuple_SET_ITEM(__pyx_t_8, 0+__pyx_t_3, __pyx_n_s_q);
+        PyTuple_SET_ITEM(__pyx_t_8, 0+__pyx_t_2, __pyx_n_s_q);
         __Pyx_GIVEREF(__pyx_t_5);
-        PyTuple_SET_ITEM(__pyx_t_8, 1+__pyx_t_3, __pyx_t_5);
+        PyTuple_SET_ITEM(__pyx_t_8, 1+__pyx_t_2, __pyx_t_5);
         __pyx_t_5 = 0;
-        __pyx_t_4 = __Pyx_PyObject_Call(__pyx_t_6, __pyx_t_8, NULL); if (unlikely(!__pyx_t_4)) __PYX_ERR(0, 82, __pyx_L1_error)
+        __pyx_t_4 = __Pyx_PyObject_Call(__pyx_t_6, __pyx_t_8, NULL); if (unlikely(!__pyx_t_4)) __PYX_ERR(0, 98, __pyx_L1_error)
         __Pyx_GOTREF(__pyx_t_4);
         __Pyx_DECREF(__pyx_t_8); __pyx_t_8 = 0;
       }
       __Pyx_DECREF(__pyx_t_6); __pyx_t_6 = 0;
       __Pyx_DECREF(__pyx_t_4); __pyx_t_4 = 0;
 
-      /* "abr_jaco2/interface/jaco2_cython.pyx":81
- *         while target_reached < 6:
- *             target_reached = self.thisptr.SendTargetAngles(&q_target[0])
+      /* "abr_jaco2/interface/jaco2_cython.pyx":97
+ *             with nogil:
+ *                 target_reached = self.thisptr.SendTargetAngles(q_target_ptr)
  *             if self.use_redis:             # <<<<<<<<<<<<<<
  *                 self.r.set('q', '%.3f %.3f %.3f %.3f %.3f %.3f' %
  *                       tuple(self.thisptr.pos_rad))
@@ -2347,12 +2802,12 @@ static PyObject *__pyx_pf_9abr_jaco2_9interface_11jaco2_rs485_7pyJaco2_18SendTar
     }
   }
 
-  /* "abr_jaco2/interface/jaco2_cython.pyx":76
- *         self.thisptr.SendForces(&u[0])
+  /* "abr_jaco2/interface/jaco2_cython.pyx":89
+ *             self.thisptr.SendForces(u_ptr)
  * 
  *     def SendTargetAngles(self, np.ndarray[float, mode="c"] q_target):             # <<<<<<<<<<<<<<
- *         target_reached = 0
- *         self.thisptr.SendTargetAnglesSetup()
+ *         cdef int target_reached = 0
+ *         cdef float* q_target_ptr = &q_target[0]
  */
 
   /* function exit code */
@@ -2381,22 +2836,23 @@ static PyObject *__pyx_pf_9abr_jaco2_9interface_11jaco2_rs485_7pyJaco2_18SendTar
   return __pyx_r;
 }
 
-/* "abr_jaco2/interface/jaco2_cython.pyx":85
+/* "abr_jaco2/interface/jaco2_cython.pyx":101
  *                       tuple(self.thisptr.pos_rad))
  * 
  *     def SendTargetAnglesHand(self, bool open):             # <<<<<<<<<<<<<<
- *         self.thisptr.SendTargetAnglesHand(open)
+ *         with nogil:
+ *             self.thisptr.SendTargetAnglesHand(open)
  */
 
 /* Python wrapper */
-static PyObject *__pyx_pw_9abr_jaco2_9interface_11jaco2_rs485_7pyJaco2_21SendTargetAnglesHand(PyObject *__pyx_v_self, PyObject *__pyx_arg_open); /*proto*/
-static PyObject *__pyx_pw_9abr_jaco2_9interface_11jaco2_rs485_7pyJaco2_21SendTargetAnglesHand(PyObject *__pyx_v_self, PyObject *__pyx_arg_open) {
+static PyObject *__pyx_pw_9abr_jaco2_9interface_11jaco2_rs485_7pyJaco2_23SendTargetAnglesHand(PyObject *__pyx_v_self, PyObject *__pyx_arg_open); /*proto*/
+static PyObject *__pyx_pw_9abr_jaco2_9interface_11jaco2_rs485_7pyJaco2_23SendTargetAnglesHand(PyObject *__pyx_v_self, PyObject *__pyx_arg_open) {
   bool __pyx_v_open;
   PyObject *__pyx_r = 0;
   __Pyx_RefNannyDeclarations
   __Pyx_RefNannySetupContext("SendTargetAnglesHand (wrapper)", 0);
   assert(__pyx_arg_open); {
-    __pyx_v_open = __Pyx_PyObject_IsTrue(__pyx_arg_open); if (unlikely((__pyx_v_open == ((bool)-1)) && PyErr_Occurred())) __PYX_ERR(0, 85, __pyx_L3_error)
+    __pyx_v_open = __Pyx_PyObject_IsTrue(__pyx_arg_open); if (unlikely((__pyx_v_open == ((bool)-1)) && PyErr_Occurred())) __PYX_ERR(0, 101, __pyx_L3_error)
   }
   goto __pyx_L4_argument_unpacking_done;
   __pyx_L3_error:;
@@ -2404,30 +2860,62 @@ static PyObject *__pyx_pw_9abr_jaco2_9interface_11jaco2_rs485_7pyJaco2_21SendTar
   __Pyx_RefNannyFinishContext();
   return NULL;
   __pyx_L4_argument_unpacking_done:;
-  __pyx_r = __pyx_pf_9abr_jaco2_9interface_11jaco2_rs485_7pyJaco2_20SendTargetAnglesHand(((struct __pyx_obj_9abr_jaco2_9interface_11jaco2_rs485_pyJaco2 *)__pyx_v_self), ((bool)__pyx_v_open));
+  __pyx_r = __pyx_pf_9abr_jaco2_9interface_11jaco2_rs485_7pyJaco2_22SendTargetAnglesHand(((struct __pyx_obj_9abr_jaco2_9interface_11jaco2_rs485_pyJaco2 *)__pyx_v_self), ((bool)__pyx_v_open));
 
   /* function exit code */
   __Pyx_RefNannyFinishContext();
   return __pyx_r;
 }
 
-static PyObject *__pyx_pf_9abr_jaco2_9interface_11jaco2_rs485_7pyJaco2_20SendTargetAnglesHand(struct __pyx_obj_9abr_jaco2_9interface_11jaco2_rs485_pyJaco2 *__pyx_v_self, bool __pyx_v_open) {
+static PyObject *__pyx_pf_9abr_jaco2_9interface_11jaco2_rs485_7pyJaco2_22SendTargetAnglesHand(struct __pyx_obj_9abr_jaco2_9interface_11jaco2_rs485_pyJaco2 *__pyx_v_self, bool __pyx_v_open) {
   PyObject *__pyx_r = NULL;
   __Pyx_RefNannyDeclarations
   __Pyx_RefNannySetupContext("SendTargetAnglesHand", 0);
 
-  /* "abr_jaco2/interface/jaco2_cython.pyx":86
+  /* "abr_jaco2/interface/jaco2_cython.pyx":102
  * 
  *     def SendTargetAnglesHand(self, bool open):
- *         self.thisptr.SendTargetAnglesHand(open)             # <<<<<<<<<<<<<<
+ *         with nogil:             # <<<<<<<<<<<<<<
+ *             self.thisptr.SendTargetAnglesHand(open)
  */
-  __pyx_v_self->thisptr->SendTargetAnglesHand(__pyx_v_open);
+  {
+      #ifdef WITH_THREAD
+      PyThreadState *_save;
+      Py_UNBLOCK_THREADS
+      #endif
+      /*try:*/ {
 
-  /* "abr_jaco2/interface/jaco2_cython.pyx":85
+        /* "abr_jaco2/interface/jaco2_cython.pyx":103
+ *     def SendTargetAnglesHand(self, bool open):
+ *         with nogil:
+ *             self.thisptr.SendTargetAnglesHand(open)             # <<<<<<<<<<<<<<
+ */
+        __pyx_v_self->thisptr->SendTargetAnglesHand(__pyx_v_open);
+      }
+
+      /* "abr_jaco2/interface/jaco2_cython.pyx":102
+ * 
+ *     def SendTargetAnglesHand(self, bool open):
+ *         with nogil:             # <<<<<<<<<<<<<<
+ *             self.thisptr.SendTargetAnglesHand(open)
+ */
+      /*finally:*/ {
+        /*normal exit:*/{
+          #ifdef WITH_THREAD
+          Py_BLOCK_THREADS
+          #endif
+          goto __pyx_L5;
+        }
+        __pyx_L5:;
+      }
+  }
+
+  /* "abr_jaco2/interface/jaco2_cython.pyx":101
  *                       tuple(self.thisptr.pos_rad))
  * 
  *     def SendTargetAnglesHand(self, bool open):             # <<<<<<<<<<<<<<
- *         self.thisptr.SendTargetAnglesHand(open)
+ *         with nogil:
+ *             self.thisptr.SendTargetAnglesHand(open)
  */
 
   /* function exit code */
@@ -2437,7 +2925,7 @@ static PyObject *__pyx_pf_9abr_jaco2_9interface_11jaco2_rs485_7pyJaco2_20SendTar
   return __pyx_r;
 }
 
-/* "../../../anaconda3/envs/control/lib/python3.4/site-packages/Cython/Includes/numpy/__init__.pxd":197
+/* "../../tmp/cy/Cython-0.25.2/Cython/Includes/numpy/__init__.pxd":197
  *         # experimental exception made for __getbuffer__ and __releasebuffer__
  *         # -- the details of this may change.
  *         def __getbuffer__(ndarray self, Py_buffer* info, int flags):             # <<<<<<<<<<<<<<
@@ -2484,7 +2972,7 @@ static int __pyx_pf_5numpy_7ndarray___getbuffer__(PyArrayObject *__pyx_v_self, P
     __Pyx_GIVEREF(__pyx_v_info->obj);
   }
 
-  /* "../../../anaconda3/envs/control/lib/python3.4/site-packages/Cython/Includes/numpy/__init__.pxd":203
+  /* "../../tmp/cy/Cython-0.25.2/Cython/Includes/numpy/__init__.pxd":203
  *             # of flags
  * 
  *             if info == NULL: return             # <<<<<<<<<<<<<<
@@ -2497,7 +2985,7 @@ static int __pyx_pf_5numpy_7ndarray___getbuffer__(PyArrayObject *__pyx_v_self, P
     goto __pyx_L0;
   }
 
-  /* "../../../anaconda3/envs/control/lib/python3.4/site-packages/Cython/Includes/numpy/__init__.pxd":206
+  /* "../../tmp/cy/Cython-0.25.2/Cython/Includes/numpy/__init__.pxd":206
  * 
  *             cdef int copy_shape, i, ndim
  *             cdef int endian_detector = 1             # <<<<<<<<<<<<<<
@@ -2506,7 +2994,7 @@ static int __pyx_pf_5numpy_7ndarray___getbuffer__(PyArrayObject *__pyx_v_self, P
  */
   __pyx_v_endian_detector = 1;
 
-  /* "../../../anaconda3/envs/control/lib/python3.4/site-packages/Cython/Includes/numpy/__init__.pxd":207
+  /* "../../tmp/cy/Cython-0.25.2/Cython/Includes/numpy/__init__.pxd":207
  *             cdef int copy_shape, i, ndim
  *             cdef int endian_detector = 1
  *             cdef bint little_endian = ((<char*>&endian_detector)[0] != 0)             # <<<<<<<<<<<<<<
@@ -2515,7 +3003,7 @@ static int __pyx_pf_5numpy_7ndarray___getbuffer__(PyArrayObject *__pyx_v_self, P
  */
   __pyx_v_little_endian = ((((char *)(&__pyx_v_endian_detector))[0]) != 0);
 
-  /* "../../../anaconda3/envs/control/lib/python3.4/site-packages/Cython/Includes/numpy/__init__.pxd":209
+  /* "../../tmp/cy/Cython-0.25.2/Cython/Includes/numpy/__init__.pxd":209
  *             cdef bint little_endian = ((<char*>&endian_detector)[0] != 0)
  * 
  *             ndim = PyArray_NDIM(self)             # <<<<<<<<<<<<<<
@@ -2524,7 +3012,7 @@ static int __pyx_pf_5numpy_7ndarray___getbuffer__(PyArrayObject *__pyx_v_self, P
  */
   __pyx_v_ndim = PyArray_NDIM(__pyx_v_self);
 
-  /* "../../../anaconda3/envs/control/lib/python3.4/site-packages/Cython/Includes/numpy/__init__.pxd":211
+  /* "../../tmp/cy/Cython-0.25.2/Cython/Includes/numpy/__init__.pxd":211
  *             ndim = PyArray_NDIM(self)
  * 
  *             if sizeof(npy_intp) != sizeof(Py_ssize_t):             # <<<<<<<<<<<<<<
@@ -2534,7 +3022,7 @@ static int __pyx_pf_5numpy_7ndarray___getbuffer__(PyArrayObject *__pyx_v_self, P
   __pyx_t_1 = (((sizeof(npy_intp)) != (sizeof(Py_ssize_t))) != 0);
   if (__pyx_t_1) {
 
-    /* "../../../anaconda3/envs/control/lib/python3.4/site-packages/Cython/Includes/numpy/__init__.pxd":212
+    /* "../../tmp/cy/Cython-0.25.2/Cython/Includes/numpy/__init__.pxd":212
  * 
  *             if sizeof(npy_intp) != sizeof(Py_ssize_t):
  *                 copy_shape = 1             # <<<<<<<<<<<<<<
@@ -2543,7 +3031,7 @@ static int __pyx_pf_5numpy_7ndarray___getbuffer__(PyArrayObject *__pyx_v_self, P
  */
     __pyx_v_copy_shape = 1;
 
-    /* "../../../anaconda3/envs/control/lib/python3.4/site-packages/Cython/Includes/numpy/__init__.pxd":211
+    /* "../../tmp/cy/Cython-0.25.2/Cython/Includes/numpy/__init__.pxd":211
  *             ndim = PyArray_NDIM(self)
  * 
  *             if sizeof(npy_intp) != sizeof(Py_ssize_t):             # <<<<<<<<<<<<<<
@@ -2553,7 +3041,7 @@ static int __pyx_pf_5numpy_7ndarray___getbuffer__(PyArrayObject *__pyx_v_self, P
     goto __pyx_L4;
   }
 
-  /* "../../../anaconda3/envs/control/lib/python3.4/site-packages/Cython/Includes/numpy/__init__.pxd":214
+  /* "../../tmp/cy/Cython-0.25.2/Cython/Includes/numpy/__init__.pxd":214
  *                 copy_shape = 1
  *             else:
  *                 copy_shape = 0             # <<<<<<<<<<<<<<
@@ -2565,7 +3053,7 @@ static int __pyx_pf_5numpy_7ndarray___getbuffer__(PyArrayObject *__pyx_v_self, P
   }
   __pyx_L4:;
 
-  /* "../../../anaconda3/envs/control/lib/python3.4/site-packages/Cython/Includes/numpy/__init__.pxd":216
+  /* "../../tmp/cy/Cython-0.25.2/Cython/Includes/numpy/__init__.pxd":216
  *                 copy_shape = 0
  * 
  *             if ((flags & pybuf.PyBUF_C_CONTIGUOUS == pybuf.PyBUF_C_CONTIGUOUS)             # <<<<<<<<<<<<<<
@@ -2579,7 +3067,7 @@ static int __pyx_pf_5numpy_7ndarray___getbuffer__(PyArrayObject *__pyx_v_self, P
     goto __pyx_L6_bool_binop_done;
   }
 
-  /* "../../../anaconda3/envs/control/lib/python3.4/site-packages/Cython/Includes/numpy/__init__.pxd":217
+  /* "../../tmp/cy/Cython-0.25.2/Cython/Includes/numpy/__init__.pxd":217
  * 
  *             if ((flags & pybuf.PyBUF_C_CONTIGUOUS == pybuf.PyBUF_C_CONTIGUOUS)
  *                 and not PyArray_CHKFLAGS(self, NPY_C_CONTIGUOUS)):             # <<<<<<<<<<<<<<
@@ -2590,7 +3078,7 @@ static int __pyx_pf_5numpy_7ndarray___getbuffer__(PyArrayObject *__pyx_v_self, P
   __pyx_t_1 = __pyx_t_2;
   __pyx_L6_bool_binop_done:;
 
-  /* "../../../anaconda3/envs/control/lib/python3.4/site-packages/Cython/Includes/numpy/__init__.pxd":216
+  /* "../../tmp/cy/Cython-0.25.2/Cython/Includes/numpy/__init__.pxd":216
  *                 copy_shape = 0
  * 
  *             if ((flags & pybuf.PyBUF_C_CONTIGUOUS == pybuf.PyBUF_C_CONTIGUOUS)             # <<<<<<<<<<<<<<
@@ -2599,7 +3087,7 @@ static int __pyx_pf_5numpy_7ndarray___getbuffer__(PyArrayObject *__pyx_v_self, P
  */
   if (__pyx_t_1) {
 
-    /* "../../../anaconda3/envs/control/lib/python3.4/site-packages/Cython/Includes/numpy/__init__.pxd":218
+    /* "../../tmp/cy/Cython-0.25.2/Cython/Includes/numpy/__init__.pxd":218
  *             if ((flags & pybuf.PyBUF_C_CONTIGUOUS == pybuf.PyBUF_C_CONTIGUOUS)
  *                 and not PyArray_CHKFLAGS(self, NPY_C_CONTIGUOUS)):
  *                 raise ValueError(u"ndarray is not C contiguous")             # <<<<<<<<<<<<<<
@@ -2612,7 +3100,7 @@ static int __pyx_pf_5numpy_7ndarray___getbuffer__(PyArrayObject *__pyx_v_self, P
     __Pyx_DECREF(__pyx_t_3); __pyx_t_3 = 0;
     __PYX_ERR(1, 218, __pyx_L1_error)
 
-    /* "../../../anaconda3/envs/control/lib/python3.4/site-packages/Cython/Includes/numpy/__init__.pxd":216
+    /* "../../tmp/cy/Cython-0.25.2/Cython/Includes/numpy/__init__.pxd":216
  *                 copy_shape = 0
  * 
  *             if ((flags & pybuf.PyBUF_C_CONTIGUOUS == pybuf.PyBUF_C_CONTIGUOUS)             # <<<<<<<<<<<<<<
@@ -2621,7 +3109,7 @@ static int __pyx_pf_5numpy_7ndarray___getbuffer__(PyArrayObject *__pyx_v_self, P
  */
   }
 
-  /* "../../../anaconda3/envs/control/lib/python3.4/site-packages/Cython/Includes/numpy/__init__.pxd":220
+  /* "../../tmp/cy/Cython-0.25.2/Cython/Includes/numpy/__init__.pxd":220
  *                 raise ValueError(u"ndarray is not C contiguous")
  * 
  *             if ((flags & pybuf.PyBUF_F_CONTIGUOUS == pybuf.PyBUF_F_CONTIGUOUS)             # <<<<<<<<<<<<<<
@@ -2635,7 +3123,7 @@ static int __pyx_pf_5numpy_7ndarray___getbuffer__(PyArrayObject *__pyx_v_self, P
     goto __pyx_L9_bool_binop_done;
   }
 
-  /* "../../../anaconda3/envs/control/lib/python3.4/site-packages/Cython/Includes/numpy/__init__.pxd":221
+  /* "../../tmp/cy/Cython-0.25.2/Cython/Includes/numpy/__init__.pxd":221
  * 
  *             if ((flags & pybuf.PyBUF_F_CONTIGUOUS == pybuf.PyBUF_F_CONTIGUOUS)
  *                 and not PyArray_CHKFLAGS(self, NPY_F_CONTIGUOUS)):             # <<<<<<<<<<<<<<
@@ -2646,7 +3134,7 @@ static int __pyx_pf_5numpy_7ndarray___getbuffer__(PyArrayObject *__pyx_v_self, P
   __pyx_t_1 = __pyx_t_2;
   __pyx_L9_bool_binop_done:;
 
-  /* "../../../anaconda3/envs/control/lib/python3.4/site-packages/Cython/Includes/numpy/__init__.pxd":220
+  /* "../../tmp/cy/Cython-0.25.2/Cython/Includes/numpy/__init__.pxd":220
  *                 raise ValueError(u"ndarray is not C contiguous")
  * 
  *             if ((flags & pybuf.PyBUF_F_CONTIGUOUS == pybuf.PyBUF_F_CONTIGUOUS)             # <<<<<<<<<<<<<<
@@ -2655,7 +3143,7 @@ static int __pyx_pf_5numpy_7ndarray___getbuffer__(PyArrayObject *__pyx_v_self, P
  */
   if (__pyx_t_1) {
 
-    /* "../../../anaconda3/envs/control/lib/python3.4/site-packages/Cython/Includes/numpy/__init__.pxd":222
+    /* "../../tmp/cy/Cython-0.25.2/Cython/Includes/numpy/__init__.pxd":222
  *             if ((flags & pybuf.PyBUF_F_CONTIGUOUS == pybuf.PyBUF_F_CONTIGUOUS)
  *                 and not PyArray_CHKFLAGS(self, NPY_F_CONTIGUOUS)):
  *                 raise ValueError(u"ndarray is not Fortran contiguous")             # <<<<<<<<<<<<<<
@@ -2668,7 +3156,7 @@ static int __pyx_pf_5numpy_7ndarray___getbuffer__(PyArrayObject *__pyx_v_self, P
     __Pyx_DECREF(__pyx_t_3); __pyx_t_3 = 0;
     __PYX_ERR(1, 222, __pyx_L1_error)
 
-    /* "../../../anaconda3/envs/control/lib/python3.4/site-packages/Cython/Includes/numpy/__init__.pxd":220
+    /* "../../tmp/cy/Cython-0.25.2/Cython/Includes/numpy/__init__.pxd":220
  *                 raise ValueError(u"ndarray is not C contiguous")
  * 
  *             if ((flags & pybuf.PyBUF_F_CONTIGUOUS == pybuf.PyBUF_F_CONTIGUOUS)             # <<<<<<<<<<<<<<
@@ -2677,7 +3165,7 @@ static int __pyx_pf_5numpy_7ndarray___getbuffer__(PyArrayObject *__pyx_v_self, P
  */
   }
 
-  /* "../../../anaconda3/envs/control/lib/python3.4/site-packages/Cython/Includes/numpy/__init__.pxd":224
+  /* "../../tmp/cy/Cython-0.25.2/Cython/Includes/numpy/__init__.pxd":224
  *                 raise ValueError(u"ndarray is not Fortran contiguous")
  * 
  *             info.buf = PyArray_DATA(self)             # <<<<<<<<<<<<<<
@@ -2686,7 +3174,7 @@ static int __pyx_pf_5numpy_7ndarray___getbuffer__(PyArrayObject *__pyx_v_self, P
  */
   __pyx_v_info->buf = PyArray_DATA(__pyx_v_self);
 
-  /* "../../../anaconda3/envs/control/lib/python3.4/site-packages/Cython/Includes/numpy/__init__.pxd":225
+  /* "../../tmp/cy/Cython-0.25.2/Cython/Includes/numpy/__init__.pxd":225
  * 
  *             info.buf = PyArray_DATA(self)
  *             info.ndim = ndim             # <<<<<<<<<<<<<<
@@ -2695,7 +3183,7 @@ static int __pyx_pf_5numpy_7ndarray___getbuffer__(PyArrayObject *__pyx_v_self, P
  */
   __pyx_v_info->ndim = __pyx_v_ndim;
 
-  /* "../../../anaconda3/envs/control/lib/python3.4/site-packages/Cython/Includes/numpy/__init__.pxd":226
+  /* "../../tmp/cy/Cython-0.25.2/Cython/Includes/numpy/__init__.pxd":226
  *             info.buf = PyArray_DATA(self)
  *             info.ndim = ndim
  *             if copy_shape:             # <<<<<<<<<<<<<<
@@ -2705,7 +3193,7 @@ static int __pyx_pf_5numpy_7ndarray___getbuffer__(PyArrayObject *__pyx_v_self, P
   __pyx_t_1 = (__pyx_v_copy_shape != 0);
   if (__pyx_t_1) {
 
-    /* "../../../anaconda3/envs/control/lib/python3.4/site-packages/Cython/Includes/numpy/__init__.pxd":229
+    /* "../../tmp/cy/Cython-0.25.2/Cython/Includes/numpy/__init__.pxd":229
  *                 # Allocate new buffer for strides and shape info.
  *                 # This is allocated as one block, strides first.
  *                 info.strides = <Py_ssize_t*>stdlib.malloc(sizeof(Py_ssize_t) * <size_t>ndim * 2)             # <<<<<<<<<<<<<<
@@ -2714,7 +3202,7 @@ static int __pyx_pf_5numpy_7ndarray___getbuffer__(PyArrayObject *__pyx_v_self, P
  */
     __pyx_v_info->strides = ((Py_ssize_t *)malloc((((sizeof(Py_ssize_t)) * ((size_t)__pyx_v_ndim)) * 2)));
 
-    /* "../../../anaconda3/envs/control/lib/python3.4/site-packages/Cython/Includes/numpy/__init__.pxd":230
+    /* "../../tmp/cy/Cython-0.25.2/Cython/Includes/numpy/__init__.pxd":230
  *                 # This is allocated as one block, strides first.
  *                 info.strides = <Py_ssize_t*>stdlib.malloc(sizeof(Py_ssize_t) * <size_t>ndim * 2)
  *                 info.shape = info.strides + ndim             # <<<<<<<<<<<<<<
@@ -2723,7 +3211,7 @@ static int __pyx_pf_5numpy_7ndarray___getbuffer__(PyArrayObject *__pyx_v_self, P
  */
     __pyx_v_info->shape = (__pyx_v_info->strides + __pyx_v_ndim);
 
-    /* "../../../anaconda3/envs/control/lib/python3.4/site-packages/Cython/Includes/numpy/__init__.pxd":231
+    /* "../../tmp/cy/Cython-0.25.2/Cython/Includes/numpy/__init__.pxd":231
  *                 info.strides = <Py_ssize_t*>stdlib.malloc(sizeof(Py_ssize_t) * <size_t>ndim * 2)
  *                 info.shape = info.strides + ndim
  *                 for i in range(ndim):             # <<<<<<<<<<<<<<
@@ -2734,7 +3222,7 @@ static int __pyx_pf_5numpy_7ndarray___getbuffer__(PyArrayObject *__pyx_v_self, P
     for (__pyx_t_5 = 0; __pyx_t_5 < __pyx_t_4; __pyx_t_5+=1) {
       __pyx_v_i = __pyx_t_5;
 
-      /* "../../../anaconda3/envs/control/lib/python3.4/site-packages/Cython/Includes/numpy/__init__.pxd":232
+      /* "../../tmp/cy/Cython-0.25.2/Cython/Includes/numpy/__init__.pxd":232
  *                 info.shape = info.strides + ndim
  *                 for i in range(ndim):
  *                     info.strides[i] = PyArray_STRIDES(self)[i]             # <<<<<<<<<<<<<<
@@ -2743,7 +3231,7 @@ static int __pyx_pf_5numpy_7ndarray___getbuffer__(PyArrayObject *__pyx_v_self, P
  */
       (__pyx_v_info->strides[__pyx_v_i]) = (PyArray_STRIDES(__pyx_v_self)[__pyx_v_i]);
 
-      /* "../../../anaconda3/envs/control/lib/python3.4/site-packages/Cython/Includes/numpy/__init__.pxd":233
+      /* "../../tmp/cy/Cython-0.25.2/Cython/Includes/numpy/__init__.pxd":233
  *                 for i in range(ndim):
  *                     info.strides[i] = PyArray_STRIDES(self)[i]
  *                     info.shape[i] = PyArray_DIMS(self)[i]             # <<<<<<<<<<<<<<
@@ -2753,7 +3241,7 @@ static int __pyx_pf_5numpy_7ndarray___getbuffer__(PyArrayObject *__pyx_v_self, P
       (__pyx_v_info->shape[__pyx_v_i]) = (PyArray_DIMS(__pyx_v_self)[__pyx_v_i]);
     }
 
-    /* "../../../anaconda3/envs/control/lib/python3.4/site-packages/Cython/Includes/numpy/__init__.pxd":226
+    /* "../../tmp/cy/Cython-0.25.2/Cython/Includes/numpy/__init__.pxd":226
  *             info.buf = PyArray_DATA(self)
  *             info.ndim = ndim
  *             if copy_shape:             # <<<<<<<<<<<<<<
@@ -2763,7 +3251,7 @@ static int __pyx_pf_5numpy_7ndarray___getbuffer__(PyArrayObject *__pyx_v_self, P
     goto __pyx_L11;
   }
 
-  /* "../../../anaconda3/envs/control/lib/python3.4/site-packages/Cython/Includes/numpy/__init__.pxd":235
+  /* "../../tmp/cy/Cython-0.25.2/Cython/Includes/numpy/__init__.pxd":235
  *                     info.shape[i] = PyArray_DIMS(self)[i]
  *             else:
  *                 info.strides = <Py_ssize_t*>PyArray_STRIDES(self)             # <<<<<<<<<<<<<<
@@ -2773,7 +3261,7 @@ static int __pyx_pf_5numpy_7ndarray___getbuffer__(PyArrayObject *__pyx_v_self, P
   /*else*/ {
     __pyx_v_info->strides = ((Py_ssize_t *)PyArray_STRIDES(__pyx_v_self));
 
-    /* "../../../anaconda3/envs/control/lib/python3.4/site-packages/Cython/Includes/numpy/__init__.pxd":236
+    /* "../../tmp/cy/Cython-0.25.2/Cython/Includes/numpy/__init__.pxd":236
  *             else:
  *                 info.strides = <Py_ssize_t*>PyArray_STRIDES(self)
  *                 info.shape = <Py_ssize_t*>PyArray_DIMS(self)             # <<<<<<<<<<<<<<
@@ -2784,7 +3272,7 @@ static int __pyx_pf_5numpy_7ndarray___getbuffer__(PyArrayObject *__pyx_v_self, P
   }
   __pyx_L11:;
 
-  /* "../../../anaconda3/envs/control/lib/python3.4/site-packages/Cython/Includes/numpy/__init__.pxd":237
+  /* "../../tmp/cy/Cython-0.25.2/Cython/Includes/numpy/__init__.pxd":237
  *                 info.strides = <Py_ssize_t*>PyArray_STRIDES(self)
  *                 info.shape = <Py_ssize_t*>PyArray_DIMS(self)
  *             info.suboffsets = NULL             # <<<<<<<<<<<<<<
@@ -2793,7 +3281,7 @@ static int __pyx_pf_5numpy_7ndarray___getbuffer__(PyArrayObject *__pyx_v_self, P
  */
   __pyx_v_info->suboffsets = NULL;
 
-  /* "../../../anaconda3/envs/control/lib/python3.4/site-packages/Cython/Includes/numpy/__init__.pxd":238
+  /* "../../tmp/cy/Cython-0.25.2/Cython/Includes/numpy/__init__.pxd":238
  *                 info.shape = <Py_ssize_t*>PyArray_DIMS(self)
  *             info.suboffsets = NULL
  *             info.itemsize = PyArray_ITEMSIZE(self)             # <<<<<<<<<<<<<<
@@ -2802,7 +3290,7 @@ static int __pyx_pf_5numpy_7ndarray___getbuffer__(PyArrayObject *__pyx_v_self, P
  */
   __pyx_v_info->itemsize = PyArray_ITEMSIZE(__pyx_v_self);
 
-  /* "../../../anaconda3/envs/control/lib/python3.4/site-packages/Cython/Includes/numpy/__init__.pxd":239
+  /* "../../tmp/cy/Cython-0.25.2/Cython/Includes/numpy/__init__.pxd":239
  *             info.suboffsets = NULL
  *             info.itemsize = PyArray_ITEMSIZE(self)
  *             info.readonly = not PyArray_ISWRITEABLE(self)             # <<<<<<<<<<<<<<
@@ -2811,7 +3299,7 @@ static int __pyx_pf_5numpy_7ndarray___getbuffer__(PyArrayObject *__pyx_v_self, P
  */
   __pyx_v_info->readonly = (!(PyArray_ISWRITEABLE(__pyx_v_self) != 0));
 
-  /* "../../../anaconda3/envs/control/lib/python3.4/site-packages/Cython/Includes/numpy/__init__.pxd":242
+  /* "../../tmp/cy/Cython-0.25.2/Cython/Includes/numpy/__init__.pxd":242
  * 
  *             cdef int t
  *             cdef char* f = NULL             # <<<<<<<<<<<<<<
@@ -2820,7 +3308,7 @@ static int __pyx_pf_5numpy_7ndarray___getbuffer__(PyArrayObject *__pyx_v_self, P
  */
   __pyx_v_f = NULL;
 
-  /* "../../../anaconda3/envs/control/lib/python3.4/site-packages/Cython/Includes/numpy/__init__.pxd":243
+  /* "../../tmp/cy/Cython-0.25.2/Cython/Includes/numpy/__init__.pxd":243
  *             cdef int t
  *             cdef char* f = NULL
  *             cdef dtype descr = self.descr             # <<<<<<<<<<<<<<
@@ -2832,7 +3320,7 @@ static int __pyx_pf_5numpy_7ndarray___getbuffer__(PyArrayObject *__pyx_v_self, P
   __pyx_v_descr = ((PyArray_Descr *)__pyx_t_3);
   __pyx_t_3 = 0;
 
-  /* "../../../anaconda3/envs/control/lib/python3.4/site-packages/Cython/Includes/numpy/__init__.pxd":246
+  /* "../../tmp/cy/Cython-0.25.2/Cython/Includes/numpy/__init__.pxd":246
  *             cdef int offset
  * 
  *             cdef bint hasfields = PyDataType_HASFIELDS(descr)             # <<<<<<<<<<<<<<
@@ -2841,7 +3329,7 @@ static int __pyx_pf_5numpy_7ndarray___getbuffer__(PyArrayObject *__pyx_v_self, P
  */
   __pyx_v_hasfields = PyDataType_HASFIELDS(__pyx_v_descr);
 
-  /* "../../../anaconda3/envs/control/lib/python3.4/site-packages/Cython/Includes/numpy/__init__.pxd":248
+  /* "../../tmp/cy/Cython-0.25.2/Cython/Includes/numpy/__init__.pxd":248
  *             cdef bint hasfields = PyDataType_HASFIELDS(descr)
  * 
  *             if not hasfields and not copy_shape:             # <<<<<<<<<<<<<<
@@ -2859,7 +3347,7 @@ static int __pyx_pf_5numpy_7ndarray___getbuffer__(PyArrayObject *__pyx_v_self, P
   __pyx_L15_bool_binop_done:;
   if (__pyx_t_1) {
 
-    /* "../../../anaconda3/envs/control/lib/python3.4/site-packages/Cython/Includes/numpy/__init__.pxd":250
+    /* "../../tmp/cy/Cython-0.25.2/Cython/Includes/numpy/__init__.pxd":250
  *             if not hasfields and not copy_shape:
  *                 # do not call releasebuffer
  *                 info.obj = None             # <<<<<<<<<<<<<<
@@ -2872,7 +3360,7 @@ static int __pyx_pf_5numpy_7ndarray___getbuffer__(PyArrayObject *__pyx_v_self, P
     __Pyx_DECREF(__pyx_v_info->obj);
     __pyx_v_info->obj = Py_None;
 
-    /* "../../../anaconda3/envs/control/lib/python3.4/site-packages/Cython/Includes/numpy/__init__.pxd":248
+    /* "../../tmp/cy/Cython-0.25.2/Cython/Includes/numpy/__init__.pxd":248
  *             cdef bint hasfields = PyDataType_HASFIELDS(descr)
  * 
  *             if not hasfields and not copy_shape:             # <<<<<<<<<<<<<<
@@ -2882,7 +3370,7 @@ static int __pyx_pf_5numpy_7ndarray___getbuffer__(PyArrayObject *__pyx_v_self, P
     goto __pyx_L14;
   }
 
-  /* "../../../anaconda3/envs/control/lib/python3.4/site-packages/Cython/Includes/numpy/__init__.pxd":253
+  /* "../../tmp/cy/Cython-0.25.2/Cython/Includes/numpy/__init__.pxd":253
  *             else:
  *                 # need to call releasebuffer
  *                 info.obj = self             # <<<<<<<<<<<<<<
@@ -2898,7 +3386,7 @@ static int __pyx_pf_5numpy_7ndarray___getbuffer__(PyArrayObject *__pyx_v_self, P
   }
   __pyx_L14:;
 
-  /* "../../../anaconda3/envs/control/lib/python3.4/site-packages/Cython/Includes/numpy/__init__.pxd":255
+  /* "../../tmp/cy/Cython-0.25.2/Cython/Includes/numpy/__init__.pxd":255
  *                 info.obj = self
  * 
  *             if not hasfields:             # <<<<<<<<<<<<<<
@@ -2908,7 +3396,7 @@ static int __pyx_pf_5numpy_7ndarray___getbuffer__(PyArrayObject *__pyx_v_self, P
   __pyx_t_1 = ((!(__pyx_v_hasfields != 0)) != 0);
   if (__pyx_t_1) {
 
-    /* "../../../anaconda3/envs/control/lib/python3.4/site-packages/Cython/Includes/numpy/__init__.pxd":256
+    /* "../../tmp/cy/Cython-0.25.2/Cython/Includes/numpy/__init__.pxd":256
  * 
  *             if not hasfields:
  *                 t = descr.type_num             # <<<<<<<<<<<<<<
@@ -2918,7 +3406,7 @@ static int __pyx_pf_5numpy_7ndarray___getbuffer__(PyArrayObject *__pyx_v_self, P
     __pyx_t_4 = __pyx_v_descr->type_num;
     __pyx_v_t = __pyx_t_4;
 
-    /* "../../../anaconda3/envs/control/lib/python3.4/site-packages/Cython/Includes/numpy/__init__.pxd":257
+    /* "../../tmp/cy/Cython-0.25.2/Cython/Includes/numpy/__init__.pxd":257
  *             if not hasfields:
  *                 t = descr.type_num
  *                 if ((descr.byteorder == c'>' and little_endian) or             # <<<<<<<<<<<<<<
@@ -2938,7 +3426,7 @@ static int __pyx_pf_5numpy_7ndarray___getbuffer__(PyArrayObject *__pyx_v_self, P
     }
     __pyx_L20_next_or:;
 
-    /* "../../../anaconda3/envs/control/lib/python3.4/site-packages/Cython/Includes/numpy/__init__.pxd":258
+    /* "../../tmp/cy/Cython-0.25.2/Cython/Includes/numpy/__init__.pxd":258
  *                 t = descr.type_num
  *                 if ((descr.byteorder == c'>' and little_endian) or
  *                     (descr.byteorder == c'<' and not little_endian)):             # <<<<<<<<<<<<<<
@@ -2955,7 +3443,7 @@ static int __pyx_pf_5numpy_7ndarray___getbuffer__(PyArrayObject *__pyx_v_self, P
     __pyx_t_1 = __pyx_t_2;
     __pyx_L19_bool_binop_done:;
 
-    /* "../../../anaconda3/envs/control/lib/python3.4/site-packages/Cython/Includes/numpy/__init__.pxd":257
+    /* "../../tmp/cy/Cython-0.25.2/Cython/Includes/numpy/__init__.pxd":257
  *             if not hasfields:
  *                 t = descr.type_num
  *                 if ((descr.byteorder == c'>' and little_endian) or             # <<<<<<<<<<<<<<
@@ -2964,7 +3452,7 @@ static int __pyx_pf_5numpy_7ndarray___getbuffer__(PyArrayObject *__pyx_v_self, P
  */
     if (__pyx_t_1) {
 
-      /* "../../../anaconda3/envs/control/lib/python3.4/site-packages/Cython/Includes/numpy/__init__.pxd":259
+      /* "../../tmp/cy/Cython-0.25.2/Cython/Includes/numpy/__init__.pxd":259
  *                 if ((descr.byteorder == c'>' and little_endian) or
  *                     (descr.byteorder == c'<' and not little_endian)):
  *                     raise ValueError(u"Non-native byte order not supported")             # <<<<<<<<<<<<<<
@@ -2977,7 +3465,7 @@ static int __pyx_pf_5numpy_7ndarray___getbuffer__(PyArrayObject *__pyx_v_self, P
       __Pyx_DECREF(__pyx_t_3); __pyx_t_3 = 0;
       __PYX_ERR(1, 259, __pyx_L1_error)
 
-      /* "../../../anaconda3/envs/control/lib/python3.4/site-packages/Cython/Includes/numpy/__init__.pxd":257
+      /* "../../tmp/cy/Cython-0.25.2/Cython/Includes/numpy/__init__.pxd":257
  *             if not hasfields:
  *                 t = descr.type_num
  *                 if ((descr.byteorder == c'>' and little_endian) or             # <<<<<<<<<<<<<<
@@ -2986,7 +3474,7 @@ static int __pyx_pf_5numpy_7ndarray___getbuffer__(PyArrayObject *__pyx_v_self, P
  */
     }
 
-    /* "../../../anaconda3/envs/control/lib/python3.4/site-packages/Cython/Includes/numpy/__init__.pxd":260
+    /* "../../tmp/cy/Cython-0.25.2/Cython/Includes/numpy/__init__.pxd":260
  *                     (descr.byteorder == c'<' and not little_endian)):
  *                     raise ValueError(u"Non-native byte order not supported")
  *                 if   t == NPY_BYTE:        f = "b"             # <<<<<<<<<<<<<<
@@ -2998,7 +3486,7 @@ static int __pyx_pf_5numpy_7ndarray___getbuffer__(PyArrayObject *__pyx_v_self, P
       __pyx_v_f = ((char *)"b");
       break;
 
-      /* "../../../anaconda3/envs/control/lib/python3.4/site-packages/Cython/Includes/numpy/__init__.pxd":261
+      /* "../../tmp/cy/Cython-0.25.2/Cython/Includes/numpy/__init__.pxd":261
  *                     raise ValueError(u"Non-native byte order not supported")
  *                 if   t == NPY_BYTE:        f = "b"
  *                 elif t == NPY_UBYTE:       f = "B"             # <<<<<<<<<<<<<<
@@ -3009,7 +3497,7 @@ static int __pyx_pf_5numpy_7ndarray___getbuffer__(PyArrayObject *__pyx_v_self, P
       __pyx_v_f = ((char *)"B");
       break;
 
-      /* "../../../anaconda3/envs/control/lib/python3.4/site-packages/Cython/Includes/numpy/__init__.pxd":262
+      /* "../../tmp/cy/Cython-0.25.2/Cython/Includes/numpy/__init__.pxd":262
  *                 if   t == NPY_BYTE:        f = "b"
  *                 elif t == NPY_UBYTE:       f = "B"
  *                 elif t == NPY_SHORT:       f = "h"             # <<<<<<<<<<<<<<
@@ -3020,7 +3508,7 @@ static int __pyx_pf_5numpy_7ndarray___getbuffer__(PyArrayObject *__pyx_v_self, P
       __pyx_v_f = ((char *)"h");
       break;
 
-      /* "../../../anaconda3/envs/control/lib/python3.4/site-packages/Cython/Includes/numpy/__init__.pxd":263
+      /* "../../tmp/cy/Cython-0.25.2/Cython/Includes/numpy/__init__.pxd":263
  *                 elif t == NPY_UBYTE:       f = "B"
  *                 elif t == NPY_SHORT:       f = "h"
  *                 elif t == NPY_USHORT:      f = "H"             # <<<<<<<<<<<<<<
@@ -3031,7 +3519,7 @@ static int __pyx_pf_5numpy_7ndarray___getbuffer__(PyArrayObject *__pyx_v_self, P
       __pyx_v_f = ((char *)"H");
       break;
 
-      /* "../../../anaconda3/envs/control/lib/python3.4/site-packages/Cython/Includes/numpy/__init__.pxd":264
+      /* "../../tmp/cy/Cython-0.25.2/Cython/Includes/numpy/__init__.pxd":264
  *                 elif t == NPY_SHORT:       f = "h"
  *                 elif t == NPY_USHORT:      f = "H"
  *                 elif t == NPY_INT:         f = "i"             # <<<<<<<<<<<<<<
@@ -3042,7 +3530,7 @@ static int __pyx_pf_5numpy_7ndarray___getbuffer__(PyArrayObject *__pyx_v_self, P
       __pyx_v_f = ((char *)"i");
       break;
 
-      /* "../../../anaconda3/envs/control/lib/python3.4/site-packages/Cython/Includes/numpy/__init__.pxd":265
+      /* "../../tmp/cy/Cython-0.25.2/Cython/Includes/numpy/__init__.pxd":265
  *                 elif t == NPY_USHORT:      f = "H"
  *                 elif t == NPY_INT:         f = "i"
  *                 elif t == NPY_UINT:        f = "I"             # <<<<<<<<<<<<<<
@@ -3053,7 +3541,7 @@ static int __pyx_pf_5numpy_7ndarray___getbuffer__(PyArrayObject *__pyx_v_self, P
       __pyx_v_f = ((char *)"I");
       break;
 
-      /* "../../../anaconda3/envs/control/lib/python3.4/site-packages/Cython/Includes/numpy/__init__.pxd":266
+      /* "../../tmp/cy/Cython-0.25.2/Cython/Includes/numpy/__init__.pxd":266
  *                 elif t == NPY_INT:         f = "i"
  *                 elif t == NPY_UINT:        f = "I"
  *                 elif t == NPY_LONG:        f = "l"             # <<<<<<<<<<<<<<
@@ -3064,7 +3552,7 @@ static int __pyx_pf_5numpy_7ndarray___getbuffer__(PyArrayObject *__pyx_v_self, P
       __pyx_v_f = ((char *)"l");
       break;
 
-      /* "../../../anaconda3/envs/control/lib/python3.4/site-packages/Cython/Includes/numpy/__init__.pxd":267
+      /* "../../tmp/cy/Cython-0.25.2/Cython/Includes/numpy/__init__.pxd":267
  *                 elif t == NPY_UINT:        f = "I"
  *                 elif t == NPY_LONG:        f = "l"
  *                 elif t == NPY_ULONG:       f = "L"             # <<<<<<<<<<<<<<
@@ -3075,7 +3563,7 @@ static int __pyx_pf_5numpy_7ndarray___getbuffer__(PyArrayObject *__pyx_v_self, P
       __pyx_v_f = ((char *)"L");
       break;
 
-      /* "../../../anaconda3/envs/control/lib/python3.4/site-packages/Cython/Includes/numpy/__init__.pxd":268
+      /* "../../tmp/cy/Cython-0.25.2/Cython/Includes/numpy/__init__.pxd":268
  *                 elif t == NPY_LONG:        f = "l"
  *                 elif t == NPY_ULONG:       f = "L"
  *                 elif t == NPY_LONGLONG:    f = "q"             # <<<<<<<<<<<<<<
@@ -3086,7 +3574,7 @@ static int __pyx_pf_5numpy_7ndarray___getbuffer__(PyArrayObject *__pyx_v_self, P
       __pyx_v_f = ((char *)"q");
       break;
 
-      /* "../../../anaconda3/envs/control/lib/python3.4/site-packages/Cython/Includes/numpy/__init__.pxd":269
+      /* "../../tmp/cy/Cython-0.25.2/Cython/Includes/numpy/__init__.pxd":269
  *                 elif t == NPY_ULONG:       f = "L"
  *                 elif t == NPY_LONGLONG:    f = "q"
  *                 elif t == NPY_ULONGLONG:   f = "Q"             # <<<<<<<<<<<<<<
@@ -3097,7 +3585,7 @@ static int __pyx_pf_5numpy_7ndarray___getbuffer__(PyArrayObject *__pyx_v_self, P
       __pyx_v_f = ((char *)"Q");
       break;
 
-      /* "../../../anaconda3/envs/control/lib/python3.4/site-packages/Cython/Includes/numpy/__init__.pxd":270
+      /* "../../tmp/cy/Cython-0.25.2/Cython/Includes/numpy/__init__.pxd":270
  *                 elif t == NPY_LONGLONG:    f = "q"
  *                 elif t == NPY_ULONGLONG:   f = "Q"
  *                 elif t == NPY_FLOAT:       f = "f"             # <<<<<<<<<<<<<<
@@ -3108,7 +3596,7 @@ static int __pyx_pf_5numpy_7ndarray___getbuffer__(PyArrayObject *__pyx_v_self, P
       __pyx_v_f = ((char *)"f");
       break;
 
-      /* "../../../anaconda3/envs/control/lib/python3.4/site-packages/Cython/Includes/numpy/__init__.pxd":271
+      /* "../../tmp/cy/Cython-0.25.2/Cython/Includes/numpy/__init__.pxd":271
  *                 elif t == NPY_ULONGLONG:   f = "Q"
  *                 elif t == NPY_FLOAT:       f = "f"
  *                 elif t == NPY_DOUBLE:      f = "d"             # <<<<<<<<<<<<<<
@@ -3119,7 +3607,7 @@ static int __pyx_pf_5numpy_7ndarray___getbuffer__(PyArrayObject *__pyx_v_self, P
       __pyx_v_f = ((char *)"d");
       break;
 
-      /* "../../../anaconda3/envs/control/lib/python3.4/site-packages/Cython/Includes/numpy/__init__.pxd":272
+      /* "../../tmp/cy/Cython-0.25.2/Cython/Includes/numpy/__init__.pxd":272
  *                 elif t == NPY_FLOAT:       f = "f"
  *                 elif t == NPY_DOUBLE:      f = "d"
  *                 elif t == NPY_LONGDOUBLE:  f = "g"             # <<<<<<<<<<<<<<
@@ -3130,7 +3618,7 @@ static int __pyx_pf_5numpy_7ndarray___getbuffer__(PyArrayObject *__pyx_v_self, P
       __pyx_v_f = ((char *)"g");
       break;
 
-      /* "../../../anaconda3/envs/control/lib/python3.4/site-packages/Cython/Includes/numpy/__init__.pxd":273
+      /* "../../tmp/cy/Cython-0.25.2/Cython/Includes/numpy/__init__.pxd":273
  *                 elif t == NPY_DOUBLE:      f = "d"
  *                 elif t == NPY_LONGDOUBLE:  f = "g"
  *                 elif t == NPY_CFLOAT:      f = "Zf"             # <<<<<<<<<<<<<<
@@ -3141,7 +3629,7 @@ static int __pyx_pf_5numpy_7ndarray___getbuffer__(PyArrayObject *__pyx_v_self, P
       __pyx_v_f = ((char *)"Zf");
       break;
 
-      /* "../../../anaconda3/envs/control/lib/python3.4/site-packages/Cython/Includes/numpy/__init__.pxd":274
+      /* "../../tmp/cy/Cython-0.25.2/Cython/Includes/numpy/__init__.pxd":274
  *                 elif t == NPY_LONGDOUBLE:  f = "g"
  *                 elif t == NPY_CFLOAT:      f = "Zf"
  *                 elif t == NPY_CDOUBLE:     f = "Zd"             # <<<<<<<<<<<<<<
@@ -3152,7 +3640,7 @@ static int __pyx_pf_5numpy_7ndarray___getbuffer__(PyArrayObject *__pyx_v_self, P
       __pyx_v_f = ((char *)"Zd");
       break;
 
-      /* "../../../anaconda3/envs/control/lib/python3.4/site-packages/Cython/Includes/numpy/__init__.pxd":275
+      /* "../../tmp/cy/Cython-0.25.2/Cython/Includes/numpy/__init__.pxd":275
  *                 elif t == NPY_CFLOAT:      f = "Zf"
  *                 elif t == NPY_CDOUBLE:     f = "Zd"
  *                 elif t == NPY_CLONGDOUBLE: f = "Zg"             # <<<<<<<<<<<<<<
@@ -3163,7 +3651,7 @@ static int __pyx_pf_5numpy_7ndarray___getbuffer__(PyArrayObject *__pyx_v_self, P
       __pyx_v_f = ((char *)"Zg");
       break;
 
-      /* "../../../anaconda3/envs/control/lib/python3.4/site-packages/Cython/Includes/numpy/__init__.pxd":276
+      /* "../../tmp/cy/Cython-0.25.2/Cython/Includes/numpy/__init__.pxd":276
  *                 elif t == NPY_CDOUBLE:     f = "Zd"
  *                 elif t == NPY_CLONGDOUBLE: f = "Zg"
  *                 elif t == NPY_OBJECT:      f = "O"             # <<<<<<<<<<<<<<
@@ -3175,7 +3663,7 @@ static int __pyx_pf_5numpy_7ndarray___getbuffer__(PyArrayObject *__pyx_v_self, P
       break;
       default:
 
-      /* "../../../anaconda3/envs/control/lib/python3.4/site-packages/Cython/Includes/numpy/__init__.pxd":278
+      /* "../../tmp/cy/Cython-0.25.2/Cython/Includes/numpy/__init__.pxd":278
  *                 elif t == NPY_OBJECT:      f = "O"
  *                 else:
  *                     raise ValueError(u"unknown dtype code in numpy.pxd (%d)" % t)             # <<<<<<<<<<<<<<
@@ -3201,7 +3689,7 @@ static int __pyx_pf_5numpy_7ndarray___getbuffer__(PyArrayObject *__pyx_v_self, P
       break;
     }
 
-    /* "../../../anaconda3/envs/control/lib/python3.4/site-packages/Cython/Includes/numpy/__init__.pxd":279
+    /* "../../tmp/cy/Cython-0.25.2/Cython/Includes/numpy/__init__.pxd":279
  *                 else:
  *                     raise ValueError(u"unknown dtype code in numpy.pxd (%d)" % t)
  *                 info.format = f             # <<<<<<<<<<<<<<
@@ -3210,7 +3698,7 @@ static int __pyx_pf_5numpy_7ndarray___getbuffer__(PyArrayObject *__pyx_v_self, P
  */
     __pyx_v_info->format = __pyx_v_f;
 
-    /* "../../../anaconda3/envs/control/lib/python3.4/site-packages/Cython/Includes/numpy/__init__.pxd":280
+    /* "../../tmp/cy/Cython-0.25.2/Cython/Includes/numpy/__init__.pxd":280
  *                     raise ValueError(u"unknown dtype code in numpy.pxd (%d)" % t)
  *                 info.format = f
  *                 return             # <<<<<<<<<<<<<<
@@ -3220,7 +3708,7 @@ static int __pyx_pf_5numpy_7ndarray___getbuffer__(PyArrayObject *__pyx_v_self, P
     __pyx_r = 0;
     goto __pyx_L0;
 
-    /* "../../../anaconda3/envs/control/lib/python3.4/site-packages/Cython/Includes/numpy/__init__.pxd":255
+    /* "../../tmp/cy/Cython-0.25.2/Cython/Includes/numpy/__init__.pxd":255
  *                 info.obj = self
  * 
  *             if not hasfields:             # <<<<<<<<<<<<<<
@@ -3229,7 +3717,7 @@ static int __pyx_pf_5numpy_7ndarray___getbuffer__(PyArrayObject *__pyx_v_self, P
  */
   }
 
-  /* "../../../anaconda3/envs/control/lib/python3.4/site-packages/Cython/Includes/numpy/__init__.pxd":282
+  /* "../../tmp/cy/Cython-0.25.2/Cython/Includes/numpy/__init__.pxd":282
  *                 return
  *             else:
  *                 info.format = <char*>stdlib.malloc(_buffer_format_string_len)             # <<<<<<<<<<<<<<
@@ -3239,7 +3727,7 @@ static int __pyx_pf_5numpy_7ndarray___getbuffer__(PyArrayObject *__pyx_v_self, P
   /*else*/ {
     __pyx_v_info->format = ((char *)malloc(0xFF));
 
-    /* "../../../anaconda3/envs/control/lib/python3.4/site-packages/Cython/Includes/numpy/__init__.pxd":283
+    /* "../../tmp/cy/Cython-0.25.2/Cython/Includes/numpy/__init__.pxd":283
  *             else:
  *                 info.format = <char*>stdlib.malloc(_buffer_format_string_len)
  *                 info.format[0] = c'^' # Native data types, manual alignment             # <<<<<<<<<<<<<<
@@ -3248,7 +3736,7 @@ static int __pyx_pf_5numpy_7ndarray___getbuffer__(PyArrayObject *__pyx_v_self, P
  */
     (__pyx_v_info->format[0]) = '^';
 
-    /* "../../../anaconda3/envs/control/lib/python3.4/site-packages/Cython/Includes/numpy/__init__.pxd":284
+    /* "../../tmp/cy/Cython-0.25.2/Cython/Includes/numpy/__init__.pxd":284
  *                 info.format = <char*>stdlib.malloc(_buffer_format_string_len)
  *                 info.format[0] = c'^' # Native data types, manual alignment
  *                 offset = 0             # <<<<<<<<<<<<<<
@@ -3257,7 +3745,7 @@ static int __pyx_pf_5numpy_7ndarray___getbuffer__(PyArrayObject *__pyx_v_self, P
  */
     __pyx_v_offset = 0;
 
-    /* "../../../anaconda3/envs/control/lib/python3.4/site-packages/Cython/Includes/numpy/__init__.pxd":285
+    /* "../../tmp/cy/Cython-0.25.2/Cython/Includes/numpy/__init__.pxd":285
  *                 info.format[0] = c'^' # Native data types, manual alignment
  *                 offset = 0
  *                 f = _util_dtypestring(descr, info.format + 1,             # <<<<<<<<<<<<<<
@@ -3267,7 +3755,7 @@ static int __pyx_pf_5numpy_7ndarray___getbuffer__(PyArrayObject *__pyx_v_self, P
     __pyx_t_7 = __pyx_f_5numpy__util_dtypestring(__pyx_v_descr, (__pyx_v_info->format + 1), (__pyx_v_info->format + 0xFF), (&__pyx_v_offset)); if (unlikely(__pyx_t_7 == NULL)) __PYX_ERR(1, 285, __pyx_L1_error)
     __pyx_v_f = __pyx_t_7;
 
-    /* "../../../anaconda3/envs/control/lib/python3.4/site-packages/Cython/Includes/numpy/__init__.pxd":288
+    /* "../../tmp/cy/Cython-0.25.2/Cython/Includes/numpy/__init__.pxd":288
  *                                       info.format + _buffer_format_string_len,
  *                                       &offset)
  *                 f[0] = c'\0' # Terminate format string             # <<<<<<<<<<<<<<
@@ -3277,7 +3765,7 @@ static int __pyx_pf_5numpy_7ndarray___getbuffer__(PyArrayObject *__pyx_v_self, P
     (__pyx_v_f[0]) = '\x00';
   }
 
-  /* "../../../anaconda3/envs/control/lib/python3.4/site-packages/Cython/Includes/numpy/__init__.pxd":197
+  /* "../../tmp/cy/Cython-0.25.2/Cython/Includes/numpy/__init__.pxd":197
  *         # experimental exception made for __getbuffer__ and __releasebuffer__
  *         # -- the details of this may change.
  *         def __getbuffer__(ndarray self, Py_buffer* info, int flags):             # <<<<<<<<<<<<<<
@@ -3309,7 +3797,7 @@ static int __pyx_pf_5numpy_7ndarray___getbuffer__(PyArrayObject *__pyx_v_self, P
   return __pyx_r;
 }
 
-/* "../../../anaconda3/envs/control/lib/python3.4/site-packages/Cython/Includes/numpy/__init__.pxd":290
+/* "../../tmp/cy/Cython-0.25.2/Cython/Includes/numpy/__init__.pxd":290
  *                 f[0] = c'\0' # Terminate format string
  * 
  *         def __releasebuffer__(ndarray self, Py_buffer* info):             # <<<<<<<<<<<<<<
@@ -3333,7 +3821,7 @@ static void __pyx_pf_5numpy_7ndarray_2__releasebuffer__(PyArrayObject *__pyx_v_s
   int __pyx_t_1;
   __Pyx_RefNannySetupContext("__releasebuffer__", 0);
 
-  /* "../../../anaconda3/envs/control/lib/python3.4/site-packages/Cython/Includes/numpy/__init__.pxd":291
+  /* "../../tmp/cy/Cython-0.25.2/Cython/Includes/numpy/__init__.pxd":291
  * 
  *         def __releasebuffer__(ndarray self, Py_buffer* info):
  *             if PyArray_HASFIELDS(self):             # <<<<<<<<<<<<<<
@@ -3343,7 +3831,7 @@ static void __pyx_pf_5numpy_7ndarray_2__releasebuffer__(PyArrayObject *__pyx_v_s
   __pyx_t_1 = (PyArray_HASFIELDS(__pyx_v_self) != 0);
   if (__pyx_t_1) {
 
-    /* "../../../anaconda3/envs/control/lib/python3.4/site-packages/Cython/Includes/numpy/__init__.pxd":292
+    /* "../../tmp/cy/Cython-0.25.2/Cython/Includes/numpy/__init__.pxd":292
  *         def __releasebuffer__(ndarray self, Py_buffer* info):
  *             if PyArray_HASFIELDS(self):
  *                 stdlib.free(info.format)             # <<<<<<<<<<<<<<
@@ -3352,7 +3840,7 @@ static void __pyx_pf_5numpy_7ndarray_2__releasebuffer__(PyArrayObject *__pyx_v_s
  */
     free(__pyx_v_info->format);
 
-    /* "../../../anaconda3/envs/control/lib/python3.4/site-packages/Cython/Includes/numpy/__init__.pxd":291
+    /* "../../tmp/cy/Cython-0.25.2/Cython/Includes/numpy/__init__.pxd":291
  * 
  *         def __releasebuffer__(ndarray self, Py_buffer* info):
  *             if PyArray_HASFIELDS(self):             # <<<<<<<<<<<<<<
@@ -3361,7 +3849,7 @@ static void __pyx_pf_5numpy_7ndarray_2__releasebuffer__(PyArrayObject *__pyx_v_s
  */
   }
 
-  /* "../../../anaconda3/envs/control/lib/python3.4/site-packages/Cython/Includes/numpy/__init__.pxd":293
+  /* "../../tmp/cy/Cython-0.25.2/Cython/Includes/numpy/__init__.pxd":293
  *             if PyArray_HASFIELDS(self):
  *                 stdlib.free(info.format)
  *             if sizeof(npy_intp) != sizeof(Py_ssize_t):             # <<<<<<<<<<<<<<
@@ -3371,7 +3859,7 @@ static void __pyx_pf_5numpy_7ndarray_2__releasebuffer__(PyArrayObject *__pyx_v_s
   __pyx_t_1 = (((sizeof(npy_intp)) != (sizeof(Py_ssize_t))) != 0);
   if (__pyx_t_1) {
 
-    /* "../../../anaconda3/envs/control/lib/python3.4/site-packages/Cython/Includes/numpy/__init__.pxd":294
+    /* "../../tmp/cy/Cython-0.25.2/Cython/Includes/numpy/__init__.pxd":294
  *                 stdlib.free(info.format)
  *             if sizeof(npy_intp) != sizeof(Py_ssize_t):
  *                 stdlib.free(info.strides)             # <<<<<<<<<<<<<<
@@ -3380,7 +3868,7 @@ static void __pyx_pf_5numpy_7ndarray_2__releasebuffer__(PyArrayObject *__pyx_v_s
  */
     free(__pyx_v_info->strides);
 
-    /* "../../../anaconda3/envs/control/lib/python3.4/site-packages/Cython/Includes/numpy/__init__.pxd":293
+    /* "../../tmp/cy/Cython-0.25.2/Cython/Includes/numpy/__init__.pxd":293
  *             if PyArray_HASFIELDS(self):
  *                 stdlib.free(info.format)
  *             if sizeof(npy_intp) != sizeof(Py_ssize_t):             # <<<<<<<<<<<<<<
@@ -3389,7 +3877,7 @@ static void __pyx_pf_5numpy_7ndarray_2__releasebuffer__(PyArrayObject *__pyx_v_s
  */
   }
 
-  /* "../../../anaconda3/envs/control/lib/python3.4/site-packages/Cython/Includes/numpy/__init__.pxd":290
+  /* "../../tmp/cy/Cython-0.25.2/Cython/Includes/numpy/__init__.pxd":290
  *                 f[0] = c'\0' # Terminate format string
  * 
  *         def __releasebuffer__(ndarray self, Py_buffer* info):             # <<<<<<<<<<<<<<
@@ -3401,7 +3889,7 @@ static void __pyx_pf_5numpy_7ndarray_2__releasebuffer__(PyArrayObject *__pyx_v_s
   __Pyx_RefNannyFinishContext();
 }
 
-/* "../../../anaconda3/envs/control/lib/python3.4/site-packages/Cython/Includes/numpy/__init__.pxd":770
+/* "../../tmp/cy/Cython-0.25.2/Cython/Includes/numpy/__init__.pxd":770
  * ctypedef npy_cdouble     complex_t
  * 
  * cdef inline object PyArray_MultiIterNew1(a):             # <<<<<<<<<<<<<<
@@ -3415,7 +3903,7 @@ static CYTHON_INLINE PyObject *__pyx_f_5numpy_PyArray_MultiIterNew1(PyObject *__
   PyObject *__pyx_t_1 = NULL;
   __Pyx_RefNannySetupContext("PyArray_MultiIterNew1", 0);
 
-  /* "../../../anaconda3/envs/control/lib/python3.4/site-packages/Cython/Includes/numpy/__init__.pxd":771
+  /* "../../tmp/cy/Cython-0.25.2/Cython/Includes/numpy/__init__.pxd":771
  * 
  * cdef inline object PyArray_MultiIterNew1(a):
  *     return PyArray_MultiIterNew(1, <void*>a)             # <<<<<<<<<<<<<<
@@ -3429,7 +3917,7 @@ static CYTHON_INLINE PyObject *__pyx_f_5numpy_PyArray_MultiIterNew1(PyObject *__
   __pyx_t_1 = 0;
   goto __pyx_L0;
 
-  /* "../../../anaconda3/envs/control/lib/python3.4/site-packages/Cython/Includes/numpy/__init__.pxd":770
+  /* "../../tmp/cy/Cython-0.25.2/Cython/Includes/numpy/__init__.pxd":770
  * ctypedef npy_cdouble     complex_t
  * 
  * cdef inline object PyArray_MultiIterNew1(a):             # <<<<<<<<<<<<<<
@@ -3448,7 +3936,7 @@ static CYTHON_INLINE PyObject *__pyx_f_5numpy_PyArray_MultiIterNew1(PyObject *__
   return __pyx_r;
 }
 
-/* "../../../anaconda3/envs/control/lib/python3.4/site-packages/Cython/Includes/numpy/__init__.pxd":773
+/* "../../tmp/cy/Cython-0.25.2/Cython/Includes/numpy/__init__.pxd":773
  *     return PyArray_MultiIterNew(1, <void*>a)
  * 
  * cdef inline object PyArray_MultiIterNew2(a, b):             # <<<<<<<<<<<<<<
@@ -3462,7 +3950,7 @@ static CYTHON_INLINE PyObject *__pyx_f_5numpy_PyArray_MultiIterNew2(PyObject *__
   PyObject *__pyx_t_1 = NULL;
   __Pyx_RefNannySetupContext("PyArray_MultiIterNew2", 0);
 
-  /* "../../../anaconda3/envs/control/lib/python3.4/site-packages/Cython/Includes/numpy/__init__.pxd":774
+  /* "../../tmp/cy/Cython-0.25.2/Cython/Includes/numpy/__init__.pxd":774
  * 
  * cdef inline object PyArray_MultiIterNew2(a, b):
  *     return PyArray_MultiIterNew(2, <void*>a, <void*>b)             # <<<<<<<<<<<<<<
@@ -3476,7 +3964,7 @@ static CYTHON_INLINE PyObject *__pyx_f_5numpy_PyArray_MultiIterNew2(PyObject *__
   __pyx_t_1 = 0;
   goto __pyx_L0;
 
-  /* "../../../anaconda3/envs/control/lib/python3.4/site-packages/Cython/Includes/numpy/__init__.pxd":773
+  /* "../../tmp/cy/Cython-0.25.2/Cython/Includes/numpy/__init__.pxd":773
  *     return PyArray_MultiIterNew(1, <void*>a)
  * 
  * cdef inline object PyArray_MultiIterNew2(a, b):             # <<<<<<<<<<<<<<
@@ -3495,7 +3983,7 @@ static CYTHON_INLINE PyObject *__pyx_f_5numpy_PyArray_MultiIterNew2(PyObject *__
   return __pyx_r;
 }
 
-/* "../../../anaconda3/envs/control/lib/python3.4/site-packages/Cython/Includes/numpy/__init__.pxd":776
+/* "../../tmp/cy/Cython-0.25.2/Cython/Includes/numpy/__init__.pxd":776
  *     return PyArray_MultiIterNew(2, <void*>a, <void*>b)
  * 
  * cdef inline object PyArray_MultiIterNew3(a, b, c):             # <<<<<<<<<<<<<<
@@ -3509,7 +3997,7 @@ static CYTHON_INLINE PyObject *__pyx_f_5numpy_PyArray_MultiIterNew3(PyObject *__
   PyObject *__pyx_t_1 = NULL;
   __Pyx_RefNannySetupContext("PyArray_MultiIterNew3", 0);
 
-  /* "../../../anaconda3/envs/control/lib/python3.4/site-packages/Cython/Includes/numpy/__init__.pxd":777
+  /* "../../tmp/cy/Cython-0.25.2/Cython/Includes/numpy/__init__.pxd":777
  * 
  * cdef inline object PyArray_MultiIterNew3(a, b, c):
  *     return PyArray_MultiIterNew(3, <void*>a, <void*>b, <void*> c)             # <<<<<<<<<<<<<<
@@ -3523,7 +4011,7 @@ static CYTHON_INLINE PyObject *__pyx_f_5numpy_PyArray_MultiIterNew3(PyObject *__
   __pyx_t_1 = 0;
   goto __pyx_L0;
 
-  /* "../../../anaconda3/envs/control/lib/python3.4/site-packages/Cython/Includes/numpy/__init__.pxd":776
+  /* "../../tmp/cy/Cython-0.25.2/Cython/Includes/numpy/__init__.pxd":776
  *     return PyArray_MultiIterNew(2, <void*>a, <void*>b)
  * 
  * cdef inline object PyArray_MultiIterNew3(a, b, c):             # <<<<<<<<<<<<<<
@@ -3542,7 +4030,7 @@ static CYTHON_INLINE PyObject *__pyx_f_5numpy_PyArray_MultiIterNew3(PyObject *__
   return __pyx_r;
 }
 
-/* "../../../anaconda3/envs/control/lib/python3.4/site-packages/Cython/Includes/numpy/__init__.pxd":779
+/* "../../tmp/cy/Cython-0.25.2/Cython/Includes/numpy/__init__.pxd":779
  *     return PyArray_MultiIterNew(3, <void*>a, <void*>b, <void*> c)
  * 
  * cdef inline object PyArray_MultiIterNew4(a, b, c, d):             # <<<<<<<<<<<<<<
@@ -3556,7 +4044,7 @@ static CYTHON_INLINE PyObject *__pyx_f_5numpy_PyArray_MultiIterNew4(PyObject *__
   PyObject *__pyx_t_1 = NULL;
   __Pyx_RefNannySetupContext("PyArray_MultiIterNew4", 0);
 
-  /* "../../../anaconda3/envs/control/lib/python3.4/site-packages/Cython/Includes/numpy/__init__.pxd":780
+  /* "../../tmp/cy/Cython-0.25.2/Cython/Includes/numpy/__init__.pxd":780
  * 
  * cdef inline object PyArray_MultiIterNew4(a, b, c, d):
  *     return PyArray_MultiIterNew(4, <void*>a, <void*>b, <void*>c, <void*> d)             # <<<<<<<<<<<<<<
@@ -3570,7 +4058,7 @@ static CYTHON_INLINE PyObject *__pyx_f_5numpy_PyArray_MultiIterNew4(PyObject *__
   __pyx_t_1 = 0;
   goto __pyx_L0;
 
-  /* "../../../anaconda3/envs/control/lib/python3.4/site-packages/Cython/Includes/numpy/__init__.pxd":779
+  /* "../../tmp/cy/Cython-0.25.2/Cython/Includes/numpy/__init__.pxd":779
  *     return PyArray_MultiIterNew(3, <void*>a, <void*>b, <void*> c)
  * 
  * cdef inline object PyArray_MultiIterNew4(a, b, c, d):             # <<<<<<<<<<<<<<
@@ -3589,7 +4077,7 @@ static CYTHON_INLINE PyObject *__pyx_f_5numpy_PyArray_MultiIterNew4(PyObject *__
   return __pyx_r;
 }
 
-/* "../../../anaconda3/envs/control/lib/python3.4/site-packages/Cython/Includes/numpy/__init__.pxd":782
+/* "../../tmp/cy/Cython-0.25.2/Cython/Includes/numpy/__init__.pxd":782
  *     return PyArray_MultiIterNew(4, <void*>a, <void*>b, <void*>c, <void*> d)
  * 
  * cdef inline object PyArray_MultiIterNew5(a, b, c, d, e):             # <<<<<<<<<<<<<<
@@ -3603,7 +4091,7 @@ static CYTHON_INLINE PyObject *__pyx_f_5numpy_PyArray_MultiIterNew5(PyObject *__
   PyObject *__pyx_t_1 = NULL;
   __Pyx_RefNannySetupContext("PyArray_MultiIterNew5", 0);
 
-  /* "../../../anaconda3/envs/control/lib/python3.4/site-packages/Cython/Includes/numpy/__init__.pxd":783
+  /* "../../tmp/cy/Cython-0.25.2/Cython/Includes/numpy/__init__.pxd":783
  * 
  * cdef inline object PyArray_MultiIterNew5(a, b, c, d, e):
  *     return PyArray_MultiIterNew(5, <void*>a, <void*>b, <void*>c, <void*> d, <void*> e)             # <<<<<<<<<<<<<<
@@ -3617,7 +4105,7 @@ static CYTHON_INLINE PyObject *__pyx_f_5numpy_PyArray_MultiIterNew5(PyObject *__
   __pyx_t_1 = 0;
   goto __pyx_L0;
 
-  /* "../../../anaconda3/envs/control/lib/python3.4/site-packages/Cython/Includes/numpy/__init__.pxd":782
+  /* "../../tmp/cy/Cython-0.25.2/Cython/Includes/numpy/__init__.pxd":782
  *     return PyArray_MultiIterNew(4, <void*>a, <void*>b, <void*>c, <void*> d)
  * 
  * cdef inline object PyArray_MultiIterNew5(a, b, c, d, e):             # <<<<<<<<<<<<<<
@@ -3636,7 +4124,7 @@ static CYTHON_INLINE PyObject *__pyx_f_5numpy_PyArray_MultiIterNew5(PyObject *__
   return __pyx_r;
 }
 
-/* "../../../anaconda3/envs/control/lib/python3.4/site-packages/Cython/Includes/numpy/__init__.pxd":785
+/* "../../tmp/cy/Cython-0.25.2/Cython/Includes/numpy/__init__.pxd":785
  *     return PyArray_MultiIterNew(5, <void*>a, <void*>b, <void*>c, <void*> d, <void*> e)
  * 
  * cdef inline char* _util_dtypestring(dtype descr, char* f, char* end, int* offset) except NULL:             # <<<<<<<<<<<<<<
@@ -3665,7 +4153,7 @@ static CYTHON_INLINE char *__pyx_f_5numpy__util_dtypestring(PyArray_Descr *__pyx
   char *__pyx_t_9;
   __Pyx_RefNannySetupContext("_util_dtypestring", 0);
 
-  /* "../../../anaconda3/envs/control/lib/python3.4/site-packages/Cython/Includes/numpy/__init__.pxd":790
+  /* "../../tmp/cy/Cython-0.25.2/Cython/Includes/numpy/__init__.pxd":790
  * 
  *     cdef dtype child
  *     cdef int endian_detector = 1             # <<<<<<<<<<<<<<
@@ -3674,7 +4162,7 @@ static CYTHON_INLINE char *__pyx_f_5numpy__util_dtypestring(PyArray_Descr *__pyx
  */
   __pyx_v_endian_detector = 1;
 
-  /* "../../../anaconda3/envs/control/lib/python3.4/site-packages/Cython/Includes/numpy/__init__.pxd":791
+  /* "../../tmp/cy/Cython-0.25.2/Cython/Includes/numpy/__init__.pxd":791
  *     cdef dtype child
  *     cdef int endian_detector = 1
  *     cdef bint little_endian = ((<char*>&endian_detector)[0] != 0)             # <<<<<<<<<<<<<<
@@ -3683,7 +4171,7 @@ static CYTHON_INLINE char *__pyx_f_5numpy__util_dtypestring(PyArray_Descr *__pyx
  */
   __pyx_v_little_endian = ((((char *)(&__pyx_v_endian_detector))[0]) != 0);
 
-  /* "../../../anaconda3/envs/control/lib/python3.4/site-packages/Cython/Includes/numpy/__init__.pxd":794
+  /* "../../tmp/cy/Cython-0.25.2/Cython/Includes/numpy/__init__.pxd":794
  *     cdef tuple fields
  * 
  *     for childname in descr.names:             # <<<<<<<<<<<<<<
@@ -3706,7 +4194,7 @@ static CYTHON_INLINE char *__pyx_f_5numpy__util_dtypestring(PyArray_Descr *__pyx
     __Pyx_XDECREF_SET(__pyx_v_childname, __pyx_t_3);
     __pyx_t_3 = 0;
 
-    /* "../../../anaconda3/envs/control/lib/python3.4/site-packages/Cython/Includes/numpy/__init__.pxd":795
+    /* "../../tmp/cy/Cython-0.25.2/Cython/Includes/numpy/__init__.pxd":795
  * 
  *     for childname in descr.names:
  *         fields = descr.fields[childname]             # <<<<<<<<<<<<<<
@@ -3723,7 +4211,7 @@ static CYTHON_INLINE char *__pyx_f_5numpy__util_dtypestring(PyArray_Descr *__pyx
     __Pyx_XDECREF_SET(__pyx_v_fields, ((PyObject*)__pyx_t_3));
     __pyx_t_3 = 0;
 
-    /* "../../../anaconda3/envs/control/lib/python3.4/site-packages/Cython/Includes/numpy/__init__.pxd":796
+    /* "../../tmp/cy/Cython-0.25.2/Cython/Includes/numpy/__init__.pxd":796
  *     for childname in descr.names:
  *         fields = descr.fields[childname]
  *         child, new_offset = fields             # <<<<<<<<<<<<<<
@@ -3762,7 +4250,7 @@ static CYTHON_INLINE char *__pyx_f_5numpy__util_dtypestring(PyArray_Descr *__pyx
     __Pyx_XDECREF_SET(__pyx_v_new_offset, __pyx_t_4);
     __pyx_t_4 = 0;
 
-    /* "../../../anaconda3/envs/control/lib/python3.4/site-packages/Cython/Includes/numpy/__init__.pxd":798
+    /* "../../tmp/cy/Cython-0.25.2/Cython/Includes/numpy/__init__.pxd":798
  *         child, new_offset = fields
  * 
  *         if (end - f) - <int>(new_offset - offset[0]) < 15:             # <<<<<<<<<<<<<<
@@ -3779,7 +4267,7 @@ static CYTHON_INLINE char *__pyx_f_5numpy__util_dtypestring(PyArray_Descr *__pyx
     __pyx_t_6 = ((((__pyx_v_end - __pyx_v_f) - ((int)__pyx_t_5)) < 15) != 0);
     if (__pyx_t_6) {
 
-      /* "../../../anaconda3/envs/control/lib/python3.4/site-packages/Cython/Includes/numpy/__init__.pxd":799
+      /* "../../tmp/cy/Cython-0.25.2/Cython/Includes/numpy/__init__.pxd":799
  * 
  *         if (end - f) - <int>(new_offset - offset[0]) < 15:
  *             raise RuntimeError(u"Format string allocated too short, see comment in numpy.pxd")             # <<<<<<<<<<<<<<
@@ -3792,7 +4280,7 @@ static CYTHON_INLINE char *__pyx_f_5numpy__util_dtypestring(PyArray_Descr *__pyx
       __Pyx_DECREF(__pyx_t_3); __pyx_t_3 = 0;
       __PYX_ERR(1, 799, __pyx_L1_error)
 
-      /* "../../../anaconda3/envs/control/lib/python3.4/site-packages/Cython/Includes/numpy/__init__.pxd":798
+      /* "../../tmp/cy/Cython-0.25.2/Cython/Includes/numpy/__init__.pxd":798
  *         child, new_offset = fields
  * 
  *         if (end - f) - <int>(new_offset - offset[0]) < 15:             # <<<<<<<<<<<<<<
@@ -3801,7 +4289,7 @@ static CYTHON_INLINE char *__pyx_f_5numpy__util_dtypestring(PyArray_Descr *__pyx
  */
     }
 
-    /* "../../../anaconda3/envs/control/lib/python3.4/site-packages/Cython/Includes/numpy/__init__.pxd":801
+    /* "../../tmp/cy/Cython-0.25.2/Cython/Includes/numpy/__init__.pxd":801
  *             raise RuntimeError(u"Format string allocated too short, see comment in numpy.pxd")
  * 
  *         if ((child.byteorder == c'>' and little_endian) or             # <<<<<<<<<<<<<<
@@ -3821,7 +4309,7 @@ static CYTHON_INLINE char *__pyx_f_5numpy__util_dtypestring(PyArray_Descr *__pyx
     }
     __pyx_L8_next_or:;
 
-    /* "../../../anaconda3/envs/control/lib/python3.4/site-packages/Cython/Includes/numpy/__init__.pxd":802
+    /* "../../tmp/cy/Cython-0.25.2/Cython/Includes/numpy/__init__.pxd":802
  * 
  *         if ((child.byteorder == c'>' and little_endian) or
  *             (child.byteorder == c'<' and not little_endian)):             # <<<<<<<<<<<<<<
@@ -3838,7 +4326,7 @@ static CYTHON_INLINE char *__pyx_f_5numpy__util_dtypestring(PyArray_Descr *__pyx
     __pyx_t_6 = __pyx_t_7;
     __pyx_L7_bool_binop_done:;
 
-    /* "../../../anaconda3/envs/control/lib/python3.4/site-packages/Cython/Includes/numpy/__init__.pxd":801
+    /* "../../tmp/cy/Cython-0.25.2/Cython/Includes/numpy/__init__.pxd":801
  *             raise RuntimeError(u"Format string allocated too short, see comment in numpy.pxd")
  * 
  *         if ((child.byteorder == c'>' and little_endian) or             # <<<<<<<<<<<<<<
@@ -3847,7 +4335,7 @@ static CYTHON_INLINE char *__pyx_f_5numpy__util_dtypestring(PyArray_Descr *__pyx
  */
     if (__pyx_t_6) {
 
-      /* "../../../anaconda3/envs/control/lib/python3.4/site-packages/Cython/Includes/numpy/__init__.pxd":803
+      /* "../../tmp/cy/Cython-0.25.2/Cython/Includes/numpy/__init__.pxd":803
  *         if ((child.byteorder == c'>' and little_endian) or
  *             (child.byteorder == c'<' and not little_endian)):
  *             raise ValueError(u"Non-native byte order not supported")             # <<<<<<<<<<<<<<
@@ -3860,7 +4348,7 @@ static CYTHON_INLINE char *__pyx_f_5numpy__util_dtypestring(PyArray_Descr *__pyx
       __Pyx_DECREF(__pyx_t_3); __pyx_t_3 = 0;
       __PYX_ERR(1, 803, __pyx_L1_error)
 
-      /* "../../../anaconda3/envs/control/lib/python3.4/site-packages/Cython/Includes/numpy/__init__.pxd":801
+      /* "../../tmp/cy/Cython-0.25.2/Cython/Includes/numpy/__init__.pxd":801
  *             raise RuntimeError(u"Format string allocated too short, see comment in numpy.pxd")
  * 
  *         if ((child.byteorder == c'>' and little_endian) or             # <<<<<<<<<<<<<<
@@ -3869,7 +4357,7 @@ static CYTHON_INLINE char *__pyx_f_5numpy__util_dtypestring(PyArray_Descr *__pyx
  */
     }
 
-    /* "../../../anaconda3/envs/control/lib/python3.4/site-packages/Cython/Includes/numpy/__init__.pxd":813
+    /* "../../tmp/cy/Cython-0.25.2/Cython/Includes/numpy/__init__.pxd":813
  * 
  *         # Output padding bytes
  *         while offset[0] < new_offset:             # <<<<<<<<<<<<<<
@@ -3885,7 +4373,7 @@ static CYTHON_INLINE char *__pyx_f_5numpy__util_dtypestring(PyArray_Descr *__pyx
       __Pyx_DECREF(__pyx_t_4); __pyx_t_4 = 0;
       if (!__pyx_t_6) break;
 
-      /* "../../../anaconda3/envs/control/lib/python3.4/site-packages/Cython/Includes/numpy/__init__.pxd":814
+      /* "../../tmp/cy/Cython-0.25.2/Cython/Includes/numpy/__init__.pxd":814
  *         # Output padding bytes
  *         while offset[0] < new_offset:
  *             f[0] = 120 # "x"; pad byte             # <<<<<<<<<<<<<<
@@ -3894,7 +4382,7 @@ static CYTHON_INLINE char *__pyx_f_5numpy__util_dtypestring(PyArray_Descr *__pyx
  */
       (__pyx_v_f[0]) = 0x78;
 
-      /* "../../../anaconda3/envs/control/lib/python3.4/site-packages/Cython/Includes/numpy/__init__.pxd":815
+      /* "../../tmp/cy/Cython-0.25.2/Cython/Includes/numpy/__init__.pxd":815
  *         while offset[0] < new_offset:
  *             f[0] = 120 # "x"; pad byte
  *             f += 1             # <<<<<<<<<<<<<<
@@ -3903,7 +4391,7 @@ static CYTHON_INLINE char *__pyx_f_5numpy__util_dtypestring(PyArray_Descr *__pyx
  */
       __pyx_v_f = (__pyx_v_f + 1);
 
-      /* "../../../anaconda3/envs/control/lib/python3.4/site-packages/Cython/Includes/numpy/__init__.pxd":816
+      /* "../../tmp/cy/Cython-0.25.2/Cython/Includes/numpy/__init__.pxd":816
  *             f[0] = 120 # "x"; pad byte
  *             f += 1
  *             offset[0] += 1             # <<<<<<<<<<<<<<
@@ -3914,7 +4402,7 @@ static CYTHON_INLINE char *__pyx_f_5numpy__util_dtypestring(PyArray_Descr *__pyx
       (__pyx_v_offset[__pyx_t_8]) = ((__pyx_v_offset[__pyx_t_8]) + 1);
     }
 
-    /* "../../../anaconda3/envs/control/lib/python3.4/site-packages/Cython/Includes/numpy/__init__.pxd":818
+    /* "../../tmp/cy/Cython-0.25.2/Cython/Includes/numpy/__init__.pxd":818
  *             offset[0] += 1
  * 
  *         offset[0] += child.itemsize             # <<<<<<<<<<<<<<
@@ -3924,7 +4412,7 @@ static CYTHON_INLINE char *__pyx_f_5numpy__util_dtypestring(PyArray_Descr *__pyx
     __pyx_t_8 = 0;
     (__pyx_v_offset[__pyx_t_8]) = ((__pyx_v_offset[__pyx_t_8]) + __pyx_v_child->elsize);
 
-    /* "../../../anaconda3/envs/control/lib/python3.4/site-packages/Cython/Includes/numpy/__init__.pxd":820
+    /* "../../tmp/cy/Cython-0.25.2/Cython/Includes/numpy/__init__.pxd":820
  *         offset[0] += child.itemsize
  * 
  *         if not PyDataType_HASFIELDS(child):             # <<<<<<<<<<<<<<
@@ -3934,7 +4422,7 @@ static CYTHON_INLINE char *__pyx_f_5numpy__util_dtypestring(PyArray_Descr *__pyx
     __pyx_t_6 = ((!(PyDataType_HASFIELDS(__pyx_v_child) != 0)) != 0);
     if (__pyx_t_6) {
 
-      /* "../../../anaconda3/envs/control/lib/python3.4/site-packages/Cython/Includes/numpy/__init__.pxd":821
+      /* "../../tmp/cy/Cython-0.25.2/Cython/Includes/numpy/__init__.pxd":821
  * 
  *         if not PyDataType_HASFIELDS(child):
  *             t = child.type_num             # <<<<<<<<<<<<<<
@@ -3946,7 +4434,7 @@ static CYTHON_INLINE char *__pyx_f_5numpy__util_dtypestring(PyArray_Descr *__pyx
       __Pyx_XDECREF_SET(__pyx_v_t, __pyx_t_4);
       __pyx_t_4 = 0;
 
-      /* "../../../anaconda3/envs/control/lib/python3.4/site-packages/Cython/Includes/numpy/__init__.pxd":822
+      /* "../../tmp/cy/Cython-0.25.2/Cython/Includes/numpy/__init__.pxd":822
  *         if not PyDataType_HASFIELDS(child):
  *             t = child.type_num
  *             if end - f < 5:             # <<<<<<<<<<<<<<
@@ -3956,7 +4444,7 @@ static CYTHON_INLINE char *__pyx_f_5numpy__util_dtypestring(PyArray_Descr *__pyx
       __pyx_t_6 = (((__pyx_v_end - __pyx_v_f) < 5) != 0);
       if (__pyx_t_6) {
 
-        /* "../../../anaconda3/envs/control/lib/python3.4/site-packages/Cython/Includes/numpy/__init__.pxd":823
+        /* "../../tmp/cy/Cython-0.25.2/Cython/Includes/numpy/__init__.pxd":823
  *             t = child.type_num
  *             if end - f < 5:
  *                 raise RuntimeError(u"Format string allocated too short.")             # <<<<<<<<<<<<<<
@@ -3969,7 +4457,7 @@ static CYTHON_INLINE char *__pyx_f_5numpy__util_dtypestring(PyArray_Descr *__pyx
         __Pyx_DECREF(__pyx_t_4); __pyx_t_4 = 0;
         __PYX_ERR(1, 823, __pyx_L1_error)
 
-        /* "../../../anaconda3/envs/control/lib/python3.4/site-packages/Cython/Includes/numpy/__init__.pxd":822
+        /* "../../tmp/cy/Cython-0.25.2/Cython/Includes/numpy/__init__.pxd":822
  *         if not PyDataType_HASFIELDS(child):
  *             t = child.type_num
  *             if end - f < 5:             # <<<<<<<<<<<<<<
@@ -3978,7 +4466,7 @@ static CYTHON_INLINE char *__pyx_f_5numpy__util_dtypestring(PyArray_Descr *__pyx
  */
       }
 
-      /* "../../../anaconda3/envs/control/lib/python3.4/site-packages/Cython/Includes/numpy/__init__.pxd":826
+      /* "../../tmp/cy/Cython-0.25.2/Cython/Includes/numpy/__init__.pxd":826
  * 
  *             # Until ticket #99 is fixed, use integers to avoid warnings
  *             if   t == NPY_BYTE:        f[0] =  98 #"b"             # <<<<<<<<<<<<<<
@@ -3996,7 +4484,7 @@ static CYTHON_INLINE char *__pyx_f_5numpy__util_dtypestring(PyArray_Descr *__pyx
         goto __pyx_L15;
       }
 
-      /* "../../../anaconda3/envs/control/lib/python3.4/site-packages/Cython/Includes/numpy/__init__.pxd":827
+      /* "../../tmp/cy/Cython-0.25.2/Cython/Includes/numpy/__init__.pxd":827
  *             # Until ticket #99 is fixed, use integers to avoid warnings
  *             if   t == NPY_BYTE:        f[0] =  98 #"b"
  *             elif t == NPY_UBYTE:       f[0] =  66 #"B"             # <<<<<<<<<<<<<<
@@ -4014,7 +4502,7 @@ static CYTHON_INLINE char *__pyx_f_5numpy__util_dtypestring(PyArray_Descr *__pyx
         goto __pyx_L15;
       }
 
-      /* "../../../anaconda3/envs/control/lib/python3.4/site-packages/Cython/Includes/numpy/__init__.pxd":828
+      /* "../../tmp/cy/Cython-0.25.2/Cython/Includes/numpy/__init__.pxd":828
  *             if   t == NPY_BYTE:        f[0] =  98 #"b"
  *             elif t == NPY_UBYTE:       f[0] =  66 #"B"
  *             elif t == NPY_SHORT:       f[0] = 104 #"h"             # <<<<<<<<<<<<<<
@@ -4032,7 +4520,7 @@ static CYTHON_INLINE char *__pyx_f_5numpy__util_dtypestring(PyArray_Descr *__pyx
         goto __pyx_L15;
       }
 
-      /* "../../../anaconda3/envs/control/lib/python3.4/site-packages/Cython/Includes/numpy/__init__.pxd":829
+      /* "../../tmp/cy/Cython-0.25.2/Cython/Includes/numpy/__init__.pxd":829
  *             elif t == NPY_UBYTE:       f[0] =  66 #"B"
  *             elif t == NPY_SHORT:       f[0] = 104 #"h"
  *             elif t == NPY_USHORT:      f[0] =  72 #"H"             # <<<<<<<<<<<<<<
@@ -4050,7 +4538,7 @@ static CYTHON_INLINE char *__pyx_f_5numpy__util_dtypestring(PyArray_Descr *__pyx
         goto __pyx_L15;
       }
 
-      /* "../../../anaconda3/envs/control/lib/python3.4/site-packages/Cython/Includes/numpy/__init__.pxd":830
+      /* "../../tmp/cy/Cython-0.25.2/Cython/Includes/numpy/__init__.pxd":830
  *             elif t == NPY_SHORT:       f[0] = 104 #"h"
  *             elif t == NPY_USHORT:      f[0] =  72 #"H"
  *             elif t == NPY_INT:         f[0] = 105 #"i"             # <<<<<<<<<<<<<<
@@ -4068,7 +4556,7 @@ static CYTHON_INLINE char *__pyx_f_5numpy__util_dtypestring(PyArray_Descr *__pyx
         goto __pyx_L15;
       }
 
-      /* "../../../anaconda3/envs/control/lib/python3.4/site-packages/Cython/Includes/numpy/__init__.pxd":831
+      /* "../../tmp/cy/Cython-0.25.2/Cython/Includes/numpy/__init__.pxd":831
  *             elif t == NPY_USHORT:      f[0] =  72 #"H"
  *             elif t == NPY_INT:         f[0] = 105 #"i"
  *             elif t == NPY_UINT:        f[0] =  73 #"I"             # <<<<<<<<<<<<<<
@@ -4086,7 +4574,7 @@ static CYTHON_INLINE char *__pyx_f_5numpy__util_dtypestring(PyArray_Descr *__pyx
         goto __pyx_L15;
       }
 
-      /* "../../../anaconda3/envs/control/lib/python3.4/site-packages/Cython/Includes/numpy/__init__.pxd":832
+      /* "../../tmp/cy/Cython-0.25.2/Cython/Includes/numpy/__init__.pxd":832
  *             elif t == NPY_INT:         f[0] = 105 #"i"
  *             elif t == NPY_UINT:        f[0] =  73 #"I"
  *             elif t == NPY_LONG:        f[0] = 108 #"l"             # <<<<<<<<<<<<<<
@@ -4104,7 +4592,7 @@ static CYTHON_INLINE char *__pyx_f_5numpy__util_dtypestring(PyArray_Descr *__pyx
         goto __pyx_L15;
       }
 
-      /* "../../../anaconda3/envs/control/lib/python3.4/site-packages/Cython/Includes/numpy/__init__.pxd":833
+      /* "../../tmp/cy/Cython-0.25.2/Cython/Includes/numpy/__init__.pxd":833
  *             elif t == NPY_UINT:        f[0] =  73 #"I"
  *             elif t == NPY_LONG:        f[0] = 108 #"l"
  *             elif t == NPY_ULONG:       f[0] = 76  #"L"             # <<<<<<<<<<<<<<
@@ -4122,7 +4610,7 @@ static CYTHON_INLINE char *__pyx_f_5numpy__util_dtypestring(PyArray_Descr *__pyx
         goto __pyx_L15;
       }
 
-      /* "../../../anaconda3/envs/control/lib/python3.4/site-packages/Cython/Includes/numpy/__init__.pxd":834
+      /* "../../tmp/cy/Cython-0.25.2/Cython/Includes/numpy/__init__.pxd":834
  *             elif t == NPY_LONG:        f[0] = 108 #"l"
  *             elif t == NPY_ULONG:       f[0] = 76  #"L"
  *             elif t == NPY_LONGLONG:    f[0] = 113 #"q"             # <<<<<<<<<<<<<<
@@ -4140,7 +4628,7 @@ static CYTHON_INLINE char *__pyx_f_5numpy__util_dtypestring(PyArray_Descr *__pyx
         goto __pyx_L15;
       }
 
-      /* "../../../anaconda3/envs/control/lib/python3.4/site-packages/Cython/Includes/numpy/__init__.pxd":835
+      /* "../../tmp/cy/Cython-0.25.2/Cython/Includes/numpy/__init__.pxd":835
  *             elif t == NPY_ULONG:       f[0] = 76  #"L"
  *             elif t == NPY_LONGLONG:    f[0] = 113 #"q"
  *             elif t == NPY_ULONGLONG:   f[0] = 81  #"Q"             # <<<<<<<<<<<<<<
@@ -4158,7 +4646,7 @@ static CYTHON_INLINE char *__pyx_f_5numpy__util_dtypestring(PyArray_Descr *__pyx
         goto __pyx_L15;
       }
 
-      /* "../../../anaconda3/envs/control/lib/python3.4/site-packages/Cython/Includes/numpy/__init__.pxd":836
+      /* "../../tmp/cy/Cython-0.25.2/Cython/Includes/numpy/__init__.pxd":836
  *             elif t == NPY_LONGLONG:    f[0] = 113 #"q"
  *             elif t == NPY_ULONGLONG:   f[0] = 81  #"Q"
  *             elif t == NPY_FLOAT:       f[0] = 102 #"f"             # <<<<<<<<<<<<<<
@@ -4176,7 +4664,7 @@ static CYTHON_INLINE char *__pyx_f_5numpy__util_dtypestring(PyArray_Descr *__pyx
         goto __pyx_L15;
       }
 
-      /* "../../../anaconda3/envs/control/lib/python3.4/site-packages/Cython/Includes/numpy/__init__.pxd":837
+      /* "../../tmp/cy/Cython-0.25.2/Cython/Includes/numpy/__init__.pxd":837
  *             elif t == NPY_ULONGLONG:   f[0] = 81  #"Q"
  *             elif t == NPY_FLOAT:       f[0] = 102 #"f"
  *             elif t == NPY_DOUBLE:      f[0] = 100 #"d"             # <<<<<<<<<<<<<<
@@ -4194,7 +4682,7 @@ static CYTHON_INLINE char *__pyx_f_5numpy__util_dtypestring(PyArray_Descr *__pyx
         goto __pyx_L15;
       }
 
-      /* "../../../anaconda3/envs/control/lib/python3.4/site-packages/Cython/Includes/numpy/__init__.pxd":838
+      /* "../../tmp/cy/Cython-0.25.2/Cython/Includes/numpy/__init__.pxd":838
  *             elif t == NPY_FLOAT:       f[0] = 102 #"f"
  *             elif t == NPY_DOUBLE:      f[0] = 100 #"d"
  *             elif t == NPY_LONGDOUBLE:  f[0] = 103 #"g"             # <<<<<<<<<<<<<<
@@ -4212,7 +4700,7 @@ static CYTHON_INLINE char *__pyx_f_5numpy__util_dtypestring(PyArray_Descr *__pyx
         goto __pyx_L15;
       }
 
-      /* "../../../anaconda3/envs/control/lib/python3.4/site-packages/Cython/Includes/numpy/__init__.pxd":839
+      /* "../../tmp/cy/Cython-0.25.2/Cython/Includes/numpy/__init__.pxd":839
  *             elif t == NPY_DOUBLE:      f[0] = 100 #"d"
  *             elif t == NPY_LONGDOUBLE:  f[0] = 103 #"g"
  *             elif t == NPY_CFLOAT:      f[0] = 90; f[1] = 102; f += 1 # Zf             # <<<<<<<<<<<<<<
@@ -4232,7 +4720,7 @@ static CYTHON_INLINE char *__pyx_f_5numpy__util_dtypestring(PyArray_Descr *__pyx
         goto __pyx_L15;
       }
 
-      /* "../../../anaconda3/envs/control/lib/python3.4/site-packages/Cython/Includes/numpy/__init__.pxd":840
+      /* "../../tmp/cy/Cython-0.25.2/Cython/Includes/numpy/__init__.pxd":840
  *             elif t == NPY_LONGDOUBLE:  f[0] = 103 #"g"
  *             elif t == NPY_CFLOAT:      f[0] = 90; f[1] = 102; f += 1 # Zf
  *             elif t == NPY_CDOUBLE:     f[0] = 90; f[1] = 100; f += 1 # Zd             # <<<<<<<<<<<<<<
@@ -4252,7 +4740,7 @@ static CYTHON_INLINE char *__pyx_f_5numpy__util_dtypestring(PyArray_Descr *__pyx
         goto __pyx_L15;
       }
 
-      /* "../../../anaconda3/envs/control/lib/python3.4/site-packages/Cython/Includes/numpy/__init__.pxd":841
+      /* "../../tmp/cy/Cython-0.25.2/Cython/Includes/numpy/__init__.pxd":841
  *             elif t == NPY_CFLOAT:      f[0] = 90; f[1] = 102; f += 1 # Zf
  *             elif t == NPY_CDOUBLE:     f[0] = 90; f[1] = 100; f += 1 # Zd
  *             elif t == NPY_CLONGDOUBLE: f[0] = 90; f[1] = 103; f += 1 # Zg             # <<<<<<<<<<<<<<
@@ -4272,7 +4760,7 @@ static CYTHON_INLINE char *__pyx_f_5numpy__util_dtypestring(PyArray_Descr *__pyx
         goto __pyx_L15;
       }
 
-      /* "../../../anaconda3/envs/control/lib/python3.4/site-packages/Cython/Includes/numpy/__init__.pxd":842
+      /* "../../tmp/cy/Cython-0.25.2/Cython/Includes/numpy/__init__.pxd":842
  *             elif t == NPY_CDOUBLE:     f[0] = 90; f[1] = 100; f += 1 # Zd
  *             elif t == NPY_CLONGDOUBLE: f[0] = 90; f[1] = 103; f += 1 # Zg
  *             elif t == NPY_OBJECT:      f[0] = 79 #"O"             # <<<<<<<<<<<<<<
@@ -4290,7 +4778,7 @@ static CYTHON_INLINE char *__pyx_f_5numpy__util_dtypestring(PyArray_Descr *__pyx
         goto __pyx_L15;
       }
 
-      /* "../../../anaconda3/envs/control/lib/python3.4/site-packages/Cython/Includes/numpy/__init__.pxd":844
+      /* "../../tmp/cy/Cython-0.25.2/Cython/Includes/numpy/__init__.pxd":844
  *             elif t == NPY_OBJECT:      f[0] = 79 #"O"
  *             else:
  *                 raise ValueError(u"unknown dtype code in numpy.pxd (%d)" % t)             # <<<<<<<<<<<<<<
@@ -4314,7 +4802,7 @@ static CYTHON_INLINE char *__pyx_f_5numpy__util_dtypestring(PyArray_Descr *__pyx
       }
       __pyx_L15:;
 
-      /* "../../../anaconda3/envs/control/lib/python3.4/site-packages/Cython/Includes/numpy/__init__.pxd":845
+      /* "../../tmp/cy/Cython-0.25.2/Cython/Includes/numpy/__init__.pxd":845
  *             else:
  *                 raise ValueError(u"unknown dtype code in numpy.pxd (%d)" % t)
  *             f += 1             # <<<<<<<<<<<<<<
@@ -4323,7 +4811,7 @@ static CYTHON_INLINE char *__pyx_f_5numpy__util_dtypestring(PyArray_Descr *__pyx
  */
       __pyx_v_f = (__pyx_v_f + 1);
 
-      /* "../../../anaconda3/envs/control/lib/python3.4/site-packages/Cython/Includes/numpy/__init__.pxd":820
+      /* "../../tmp/cy/Cython-0.25.2/Cython/Includes/numpy/__init__.pxd":820
  *         offset[0] += child.itemsize
  * 
  *         if not PyDataType_HASFIELDS(child):             # <<<<<<<<<<<<<<
@@ -4333,7 +4821,7 @@ static CYTHON_INLINE char *__pyx_f_5numpy__util_dtypestring(PyArray_Descr *__pyx
       goto __pyx_L13;
     }
 
-    /* "../../../anaconda3/envs/control/lib/python3.4/site-packages/Cython/Includes/numpy/__init__.pxd":849
+    /* "../../tmp/cy/Cython-0.25.2/Cython/Includes/numpy/__init__.pxd":849
  *             # Cython ignores struct boundary information ("T{...}"),
  *             # so don't output it
  *             f = _util_dtypestring(child, f, end, offset)             # <<<<<<<<<<<<<<
@@ -4346,7 +4834,7 @@ static CYTHON_INLINE char *__pyx_f_5numpy__util_dtypestring(PyArray_Descr *__pyx
     }
     __pyx_L13:;
 
-    /* "../../../anaconda3/envs/control/lib/python3.4/site-packages/Cython/Includes/numpy/__init__.pxd":794
+    /* "../../tmp/cy/Cython-0.25.2/Cython/Includes/numpy/__init__.pxd":794
  *     cdef tuple fields
  * 
  *     for childname in descr.names:             # <<<<<<<<<<<<<<
@@ -4356,7 +4844,7 @@ static CYTHON_INLINE char *__pyx_f_5numpy__util_dtypestring(PyArray_Descr *__pyx
   }
   __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
 
-  /* "../../../anaconda3/envs/control/lib/python3.4/site-packages/Cython/Includes/numpy/__init__.pxd":850
+  /* "../../tmp/cy/Cython-0.25.2/Cython/Includes/numpy/__init__.pxd":850
  *             # so don't output it
  *             f = _util_dtypestring(child, f, end, offset)
  *     return f             # <<<<<<<<<<<<<<
@@ -4366,7 +4854,7 @@ static CYTHON_INLINE char *__pyx_f_5numpy__util_dtypestring(PyArray_Descr *__pyx
   __pyx_r = __pyx_v_f;
   goto __pyx_L0;
 
-  /* "../../../anaconda3/envs/control/lib/python3.4/site-packages/Cython/Includes/numpy/__init__.pxd":785
+  /* "../../tmp/cy/Cython-0.25.2/Cython/Includes/numpy/__init__.pxd":785
  *     return PyArray_MultiIterNew(5, <void*>a, <void*>b, <void*>c, <void*> d, <void*> e)
  * 
  * cdef inline char* _util_dtypestring(dtype descr, char* f, char* end, int* offset) except NULL:             # <<<<<<<<<<<<<<
@@ -4391,7 +4879,7 @@ static CYTHON_INLINE char *__pyx_f_5numpy__util_dtypestring(PyArray_Descr *__pyx
   return __pyx_r;
 }
 
-/* "../../../anaconda3/envs/control/lib/python3.4/site-packages/Cython/Includes/numpy/__init__.pxd":966
+/* "../../tmp/cy/Cython-0.25.2/Cython/Includes/numpy/__init__.pxd":966
  * 
  * 
  * cdef inline void set_array_base(ndarray arr, object base):             # <<<<<<<<<<<<<<
@@ -4406,7 +4894,7 @@ static CYTHON_INLINE void __pyx_f_5numpy_set_array_base(PyArrayObject *__pyx_v_a
   int __pyx_t_2;
   __Pyx_RefNannySetupContext("set_array_base", 0);
 
-  /* "../../../anaconda3/envs/control/lib/python3.4/site-packages/Cython/Includes/numpy/__init__.pxd":968
+  /* "../../tmp/cy/Cython-0.25.2/Cython/Includes/numpy/__init__.pxd":968
  * cdef inline void set_array_base(ndarray arr, object base):
  *      cdef PyObject* baseptr
  *      if base is None:             # <<<<<<<<<<<<<<
@@ -4417,7 +4905,7 @@ static CYTHON_INLINE void __pyx_f_5numpy_set_array_base(PyArrayObject *__pyx_v_a
   __pyx_t_2 = (__pyx_t_1 != 0);
   if (__pyx_t_2) {
 
-    /* "../../../anaconda3/envs/control/lib/python3.4/site-packages/Cython/Includes/numpy/__init__.pxd":969
+    /* "../../tmp/cy/Cython-0.25.2/Cython/Includes/numpy/__init__.pxd":969
  *      cdef PyObject* baseptr
  *      if base is None:
  *          baseptr = NULL             # <<<<<<<<<<<<<<
@@ -4426,7 +4914,7 @@ static CYTHON_INLINE void __pyx_f_5numpy_set_array_base(PyArrayObject *__pyx_v_a
  */
     __pyx_v_baseptr = NULL;
 
-    /* "../../../anaconda3/envs/control/lib/python3.4/site-packages/Cython/Includes/numpy/__init__.pxd":968
+    /* "../../tmp/cy/Cython-0.25.2/Cython/Includes/numpy/__init__.pxd":968
  * cdef inline void set_array_base(ndarray arr, object base):
  *      cdef PyObject* baseptr
  *      if base is None:             # <<<<<<<<<<<<<<
@@ -4436,7 +4924,7 @@ static CYTHON_INLINE void __pyx_f_5numpy_set_array_base(PyArrayObject *__pyx_v_a
     goto __pyx_L3;
   }
 
-  /* "../../../anaconda3/envs/control/lib/python3.4/site-packages/Cython/Includes/numpy/__init__.pxd":971
+  /* "../../tmp/cy/Cython-0.25.2/Cython/Includes/numpy/__init__.pxd":971
  *          baseptr = NULL
  *      else:
  *          Py_INCREF(base) # important to do this before decref below!             # <<<<<<<<<<<<<<
@@ -4446,7 +4934,7 @@ static CYTHON_INLINE void __pyx_f_5numpy_set_array_base(PyArrayObject *__pyx_v_a
   /*else*/ {
     Py_INCREF(__pyx_v_base);
 
-    /* "../../../anaconda3/envs/control/lib/python3.4/site-packages/Cython/Includes/numpy/__init__.pxd":972
+    /* "../../tmp/cy/Cython-0.25.2/Cython/Includes/numpy/__init__.pxd":972
  *      else:
  *          Py_INCREF(base) # important to do this before decref below!
  *          baseptr = <PyObject*>base             # <<<<<<<<<<<<<<
@@ -4457,7 +4945,7 @@ static CYTHON_INLINE void __pyx_f_5numpy_set_array_base(PyArrayObject *__pyx_v_a
   }
   __pyx_L3:;
 
-  /* "../../../anaconda3/envs/control/lib/python3.4/site-packages/Cython/Includes/numpy/__init__.pxd":973
+  /* "../../tmp/cy/Cython-0.25.2/Cython/Includes/numpy/__init__.pxd":973
  *          Py_INCREF(base) # important to do this before decref below!
  *          baseptr = <PyObject*>base
  *      Py_XDECREF(arr.base)             # <<<<<<<<<<<<<<
@@ -4466,7 +4954,7 @@ static CYTHON_INLINE void __pyx_f_5numpy_set_array_base(PyArrayObject *__pyx_v_a
  */
   Py_XDECREF(__pyx_v_arr->base);
 
-  /* "../../../anaconda3/envs/control/lib/python3.4/site-packages/Cython/Includes/numpy/__init__.pxd":974
+  /* "../../tmp/cy/Cython-0.25.2/Cython/Includes/numpy/__init__.pxd":974
  *          baseptr = <PyObject*>base
  *      Py_XDECREF(arr.base)
  *      arr.base = baseptr             # <<<<<<<<<<<<<<
@@ -4475,7 +4963,7 @@ static CYTHON_INLINE void __pyx_f_5numpy_set_array_base(PyArrayObject *__pyx_v_a
  */
   __pyx_v_arr->base = __pyx_v_baseptr;
 
-  /* "../../../anaconda3/envs/control/lib/python3.4/site-packages/Cython/Includes/numpy/__init__.pxd":966
+  /* "../../tmp/cy/Cython-0.25.2/Cython/Includes/numpy/__init__.pxd":966
  * 
  * 
  * cdef inline void set_array_base(ndarray arr, object base):             # <<<<<<<<<<<<<<
@@ -4487,7 +4975,7 @@ static CYTHON_INLINE void __pyx_f_5numpy_set_array_base(PyArrayObject *__pyx_v_a
   __Pyx_RefNannyFinishContext();
 }
 
-/* "../../../anaconda3/envs/control/lib/python3.4/site-packages/Cython/Includes/numpy/__init__.pxd":976
+/* "../../tmp/cy/Cython-0.25.2/Cython/Includes/numpy/__init__.pxd":976
  *      arr.base = baseptr
  * 
  * cdef inline object get_array_base(ndarray arr):             # <<<<<<<<<<<<<<
@@ -4501,7 +4989,7 @@ static CYTHON_INLINE PyObject *__pyx_f_5numpy_get_array_base(PyArrayObject *__py
   int __pyx_t_1;
   __Pyx_RefNannySetupContext("get_array_base", 0);
 
-  /* "../../../anaconda3/envs/control/lib/python3.4/site-packages/Cython/Includes/numpy/__init__.pxd":977
+  /* "../../tmp/cy/Cython-0.25.2/Cython/Includes/numpy/__init__.pxd":977
  * 
  * cdef inline object get_array_base(ndarray arr):
  *     if arr.base is NULL:             # <<<<<<<<<<<<<<
@@ -4511,7 +4999,7 @@ static CYTHON_INLINE PyObject *__pyx_f_5numpy_get_array_base(PyArrayObject *__py
   __pyx_t_1 = ((__pyx_v_arr->base == NULL) != 0);
   if (__pyx_t_1) {
 
-    /* "../../../anaconda3/envs/control/lib/python3.4/site-packages/Cython/Includes/numpy/__init__.pxd":978
+    /* "../../tmp/cy/Cython-0.25.2/Cython/Includes/numpy/__init__.pxd":978
  * cdef inline object get_array_base(ndarray arr):
  *     if arr.base is NULL:
  *         return None             # <<<<<<<<<<<<<<
@@ -4523,7 +5011,7 @@ static CYTHON_INLINE PyObject *__pyx_f_5numpy_get_array_base(PyArrayObject *__py
     __pyx_r = Py_None;
     goto __pyx_L0;
 
-    /* "../../../anaconda3/envs/control/lib/python3.4/site-packages/Cython/Includes/numpy/__init__.pxd":977
+    /* "../../tmp/cy/Cython-0.25.2/Cython/Includes/numpy/__init__.pxd":977
  * 
  * cdef inline object get_array_base(ndarray arr):
  *     if arr.base is NULL:             # <<<<<<<<<<<<<<
@@ -4532,7 +5020,7 @@ static CYTHON_INLINE PyObject *__pyx_f_5numpy_get_array_base(PyArrayObject *__py
  */
   }
 
-  /* "../../../anaconda3/envs/control/lib/python3.4/site-packages/Cython/Includes/numpy/__init__.pxd":980
+  /* "../../tmp/cy/Cython-0.25.2/Cython/Includes/numpy/__init__.pxd":980
  *         return None
  *     else:
  *         return <object>arr.base             # <<<<<<<<<<<<<<
@@ -4546,7 +5034,7 @@ static CYTHON_INLINE PyObject *__pyx_f_5numpy_get_array_base(PyArrayObject *__py
     goto __pyx_L0;
   }
 
-  /* "../../../anaconda3/envs/control/lib/python3.4/site-packages/Cython/Includes/numpy/__init__.pxd":976
+  /* "../../tmp/cy/Cython-0.25.2/Cython/Includes/numpy/__init__.pxd":976
  *      arr.base = baseptr
  * 
  * cdef inline object get_array_base(ndarray arr):             # <<<<<<<<<<<<<<
@@ -4561,7 +5049,7 @@ static CYTHON_INLINE PyObject *__pyx_f_5numpy_get_array_base(PyArrayObject *__py
   return __pyx_r;
 }
 
-/* "../../../anaconda3/envs/control/lib/python3.4/site-packages/Cython/Includes/numpy/__init__.pxd":985
+/* "../../tmp/cy/Cython-0.25.2/Cython/Includes/numpy/__init__.pxd":985
  * # Versions of the import_* functions which are more suitable for
  * # Cython code.
  * cdef inline int import_array() except -1:             # <<<<<<<<<<<<<<
@@ -4582,7 +5070,7 @@ static CYTHON_INLINE int __pyx_f_5numpy_import_array(void) {
   PyObject *__pyx_t_8 = NULL;
   __Pyx_RefNannySetupContext("import_array", 0);
 
-  /* "../../../anaconda3/envs/control/lib/python3.4/site-packages/Cython/Includes/numpy/__init__.pxd":986
+  /* "../../tmp/cy/Cython-0.25.2/Cython/Includes/numpy/__init__.pxd":986
  * # Cython code.
  * cdef inline int import_array() except -1:
  *     try:             # <<<<<<<<<<<<<<
@@ -4598,7 +5086,7 @@ static CYTHON_INLINE int __pyx_f_5numpy_import_array(void) {
     __Pyx_XGOTREF(__pyx_t_3);
     /*try:*/ {
 
-      /* "../../../anaconda3/envs/control/lib/python3.4/site-packages/Cython/Includes/numpy/__init__.pxd":987
+      /* "../../tmp/cy/Cython-0.25.2/Cython/Includes/numpy/__init__.pxd":987
  * cdef inline int import_array() except -1:
  *     try:
  *         _import_array()             # <<<<<<<<<<<<<<
@@ -4607,7 +5095,7 @@ static CYTHON_INLINE int __pyx_f_5numpy_import_array(void) {
  */
       __pyx_t_4 = _import_array(); if (unlikely(__pyx_t_4 == -1)) __PYX_ERR(1, 987, __pyx_L3_error)
 
-      /* "../../../anaconda3/envs/control/lib/python3.4/site-packages/Cython/Includes/numpy/__init__.pxd":986
+      /* "../../tmp/cy/Cython-0.25.2/Cython/Includes/numpy/__init__.pxd":986
  * # Cython code.
  * cdef inline int import_array() except -1:
  *     try:             # <<<<<<<<<<<<<<
@@ -4622,7 +5110,7 @@ static CYTHON_INLINE int __pyx_f_5numpy_import_array(void) {
     __pyx_L3_error:;
     __Pyx_PyThreadState_assign
 
-    /* "../../../anaconda3/envs/control/lib/python3.4/site-packages/Cython/Includes/numpy/__init__.pxd":988
+    /* "../../tmp/cy/Cython-0.25.2/Cython/Includes/numpy/__init__.pxd":988
  *     try:
  *         _import_array()
  *     except Exception:             # <<<<<<<<<<<<<<
@@ -4637,7 +5125,7 @@ static CYTHON_INLINE int __pyx_f_5numpy_import_array(void) {
       __Pyx_GOTREF(__pyx_t_6);
       __Pyx_GOTREF(__pyx_t_7);
 
-      /* "../../../anaconda3/envs/control/lib/python3.4/site-packages/Cython/Includes/numpy/__init__.pxd":989
+      /* "../../tmp/cy/Cython-0.25.2/Cython/Includes/numpy/__init__.pxd":989
  *         _import_array()
  *     except Exception:
  *         raise ImportError("numpy.core.multiarray failed to import")             # <<<<<<<<<<<<<<
@@ -4653,7 +5141,7 @@ static CYTHON_INLINE int __pyx_f_5numpy_import_array(void) {
     goto __pyx_L5_except_error;
     __pyx_L5_except_error:;
 
-    /* "../../../anaconda3/envs/control/lib/python3.4/site-packages/Cython/Includes/numpy/__init__.pxd":986
+    /* "../../tmp/cy/Cython-0.25.2/Cython/Includes/numpy/__init__.pxd":986
  * # Cython code.
  * cdef inline int import_array() except -1:
  *     try:             # <<<<<<<<<<<<<<
@@ -4669,7 +5157,7 @@ static CYTHON_INLINE int __pyx_f_5numpy_import_array(void) {
     __pyx_L10_try_end:;
   }
 
-  /* "../../../anaconda3/envs/control/lib/python3.4/site-packages/Cython/Includes/numpy/__init__.pxd":985
+  /* "../../tmp/cy/Cython-0.25.2/Cython/Includes/numpy/__init__.pxd":985
  * # Versions of the import_* functions which are more suitable for
  * # Cython code.
  * cdef inline int import_array() except -1:             # <<<<<<<<<<<<<<
@@ -4692,7 +5180,7 @@ static CYTHON_INLINE int __pyx_f_5numpy_import_array(void) {
   return __pyx_r;
 }
 
-/* "../../../anaconda3/envs/control/lib/python3.4/site-packages/Cython/Includes/numpy/__init__.pxd":991
+/* "../../tmp/cy/Cython-0.25.2/Cython/Includes/numpy/__init__.pxd":991
  *         raise ImportError("numpy.core.multiarray failed to import")
  * 
  * cdef inline int import_umath() except -1:             # <<<<<<<<<<<<<<
@@ -4713,7 +5201,7 @@ static CYTHON_INLINE int __pyx_f_5numpy_import_umath(void) {
   PyObject *__pyx_t_8 = NULL;
   __Pyx_RefNannySetupContext("import_umath", 0);
 
-  /* "../../../anaconda3/envs/control/lib/python3.4/site-packages/Cython/Includes/numpy/__init__.pxd":992
+  /* "../../tmp/cy/Cython-0.25.2/Cython/Includes/numpy/__init__.pxd":992
  * 
  * cdef inline int import_umath() except -1:
  *     try:             # <<<<<<<<<<<<<<
@@ -4729,7 +5217,7 @@ static CYTHON_INLINE int __pyx_f_5numpy_import_umath(void) {
     __Pyx_XGOTREF(__pyx_t_3);
     /*try:*/ {
 
-      /* "../../../anaconda3/envs/control/lib/python3.4/site-packages/Cython/Includes/numpy/__init__.pxd":993
+      /* "../../tmp/cy/Cython-0.25.2/Cython/Includes/numpy/__init__.pxd":993
  * cdef inline int import_umath() except -1:
  *     try:
  *         _import_umath()             # <<<<<<<<<<<<<<
@@ -4738,7 +5226,7 @@ static CYTHON_INLINE int __pyx_f_5numpy_import_umath(void) {
  */
       __pyx_t_4 = _import_umath(); if (unlikely(__pyx_t_4 == -1)) __PYX_ERR(1, 993, __pyx_L3_error)
 
-      /* "../../../anaconda3/envs/control/lib/python3.4/site-packages/Cython/Includes/numpy/__init__.pxd":992
+      /* "../../tmp/cy/Cython-0.25.2/Cython/Includes/numpy/__init__.pxd":992
  * 
  * cdef inline int import_umath() except -1:
  *     try:             # <<<<<<<<<<<<<<
@@ -4753,7 +5241,7 @@ static CYTHON_INLINE int __pyx_f_5numpy_import_umath(void) {
     __pyx_L3_error:;
     __Pyx_PyThreadState_assign
 
-    /* "../../../anaconda3/envs/control/lib/python3.4/site-packages/Cython/Includes/numpy/__init__.pxd":994
+    /* "../../tmp/cy/Cython-0.25.2/Cython/Includes/numpy/__init__.pxd":994
  *     try:
  *         _import_umath()
  *     except Exception:             # <<<<<<<<<<<<<<
@@ -4768,7 +5256,7 @@ static CYTHON_INLINE int __pyx_f_5numpy_import_umath(void) {
       __Pyx_GOTREF(__pyx_t_6);
       __Pyx_GOTREF(__pyx_t_7);
 
-      /* "../../../anaconda3/envs/control/lib/python3.4/site-packages/Cython/Includes/numpy/__init__.pxd":995
+      /* "../../tmp/cy/Cython-0.25.2/Cython/Includes/numpy/__init__.pxd":995
  *         _import_umath()
  *     except Exception:
  *         raise ImportError("numpy.core.umath failed to import")             # <<<<<<<<<<<<<<
@@ -4784,7 +5272,7 @@ static CYTHON_INLINE int __pyx_f_5numpy_import_umath(void) {
     goto __pyx_L5_except_error;
     __pyx_L5_except_error:;
 
-    /* "../../../anaconda3/envs/control/lib/python3.4/site-packages/Cython/Includes/numpy/__init__.pxd":992
+    /* "../../tmp/cy/Cython-0.25.2/Cython/Includes/numpy/__init__.pxd":992
  * 
  * cdef inline int import_umath() except -1:
  *     try:             # <<<<<<<<<<<<<<
@@ -4800,7 +5288,7 @@ static CYTHON_INLINE int __pyx_f_5numpy_import_umath(void) {
     __pyx_L10_try_end:;
   }
 
-  /* "../../../anaconda3/envs/control/lib/python3.4/site-packages/Cython/Includes/numpy/__init__.pxd":991
+  /* "../../tmp/cy/Cython-0.25.2/Cython/Includes/numpy/__init__.pxd":991
  *         raise ImportError("numpy.core.multiarray failed to import")
  * 
  * cdef inline int import_umath() except -1:             # <<<<<<<<<<<<<<
@@ -4823,7 +5311,7 @@ static CYTHON_INLINE int __pyx_f_5numpy_import_umath(void) {
   return __pyx_r;
 }
 
-/* "../../../anaconda3/envs/control/lib/python3.4/site-packages/Cython/Includes/numpy/__init__.pxd":997
+/* "../../tmp/cy/Cython-0.25.2/Cython/Includes/numpy/__init__.pxd":997
  *         raise ImportError("numpy.core.umath failed to import")
  * 
  * cdef inline int import_ufunc() except -1:             # <<<<<<<<<<<<<<
@@ -4844,7 +5332,7 @@ static CYTHON_INLINE int __pyx_f_5numpy_import_ufunc(void) {
   PyObject *__pyx_t_8 = NULL;
   __Pyx_RefNannySetupContext("import_ufunc", 0);
 
-  /* "../../../anaconda3/envs/control/lib/python3.4/site-packages/Cython/Includes/numpy/__init__.pxd":998
+  /* "../../tmp/cy/Cython-0.25.2/Cython/Includes/numpy/__init__.pxd":998
  * 
  * cdef inline int import_ufunc() except -1:
  *     try:             # <<<<<<<<<<<<<<
@@ -4860,7 +5348,7 @@ static CYTHON_INLINE int __pyx_f_5numpy_import_ufunc(void) {
     __Pyx_XGOTREF(__pyx_t_3);
     /*try:*/ {
 
-      /* "../../../anaconda3/envs/control/lib/python3.4/site-packages/Cython/Includes/numpy/__init__.pxd":999
+      /* "../../tmp/cy/Cython-0.25.2/Cython/Includes/numpy/__init__.pxd":999
  * cdef inline int import_ufunc() except -1:
  *     try:
  *         _import_umath()             # <<<<<<<<<<<<<<
@@ -4869,7 +5357,7 @@ static CYTHON_INLINE int __pyx_f_5numpy_import_ufunc(void) {
  */
       __pyx_t_4 = _import_umath(); if (unlikely(__pyx_t_4 == -1)) __PYX_ERR(1, 999, __pyx_L3_error)
 
-      /* "../../../anaconda3/envs/control/lib/python3.4/site-packages/Cython/Includes/numpy/__init__.pxd":998
+      /* "../../tmp/cy/Cython-0.25.2/Cython/Includes/numpy/__init__.pxd":998
  * 
  * cdef inline int import_ufunc() except -1:
  *     try:             # <<<<<<<<<<<<<<
@@ -4884,7 +5372,7 @@ static CYTHON_INLINE int __pyx_f_5numpy_import_ufunc(void) {
     __pyx_L3_error:;
     __Pyx_PyThreadState_assign
 
-    /* "../../../anaconda3/envs/control/lib/python3.4/site-packages/Cython/Includes/numpy/__init__.pxd":1000
+    /* "../../tmp/cy/Cython-0.25.2/Cython/Includes/numpy/__init__.pxd":1000
  *     try:
  *         _import_umath()
  *     except Exception:             # <<<<<<<<<<<<<<
@@ -4898,7 +5386,7 @@ static CYTHON_INLINE int __pyx_f_5numpy_import_ufunc(void) {
       __Pyx_GOTREF(__pyx_t_6);
       __Pyx_GOTREF(__pyx_t_7);
 
-      /* "../../../anaconda3/envs/control/lib/python3.4/site-packages/Cython/Includes/numpy/__init__.pxd":1001
+      /* "../../tmp/cy/Cython-0.25.2/Cython/Includes/numpy/__init__.pxd":1001
  *         _import_umath()
  *     except Exception:
  *         raise ImportError("numpy.core.umath failed to import")             # <<<<<<<<<<<<<<
@@ -4912,7 +5400,7 @@ static CYTHON_INLINE int __pyx_f_5numpy_import_ufunc(void) {
     goto __pyx_L5_except_error;
     __pyx_L5_except_error:;
 
-    /* "../../../anaconda3/envs/control/lib/python3.4/site-packages/Cython/Includes/numpy/__init__.pxd":998
+    /* "../../tmp/cy/Cython-0.25.2/Cython/Includes/numpy/__init__.pxd":998
  * 
  * cdef inline int import_ufunc() except -1:
  *     try:             # <<<<<<<<<<<<<<
@@ -4928,7 +5416,7 @@ static CYTHON_INLINE int __pyx_f_5numpy_import_ufunc(void) {
     __pyx_L10_try_end:;
   }
 
-  /* "../../../anaconda3/envs/control/lib/python3.4/site-packages/Cython/Includes/numpy/__init__.pxd":997
+  /* "../../tmp/cy/Cython-0.25.2/Cython/Includes/numpy/__init__.pxd":997
  *         raise ImportError("numpy.core.umath failed to import")
  * 
  * cdef inline int import_ufunc() except -1:             # <<<<<<<<<<<<<<
@@ -5196,12 +5684,13 @@ static PyMethodDef __pyx_methods_9abr_jaco2_9interface_11jaco2_rs485_pyJaco2[] =
   {"Connect", (PyCFunction)__pyx_pw_9abr_jaco2_9interface_11jaco2_rs485_7pyJaco2_5Connect, METH_NOARGS, 0},
   {"Disconnect", (PyCFunction)__pyx_pw_9abr_jaco2_9interface_11jaco2_rs485_7pyJaco2_7Disconnect, METH_NOARGS, 0},
   {"GetFeedback", (PyCFunction)__pyx_pw_9abr_jaco2_9interface_11jaco2_rs485_7pyJaco2_9GetFeedback, METH_NOARGS, 0},
-  {"GetTorqueLoad", (PyCFunction)__pyx_pw_9abr_jaco2_9interface_11jaco2_rs485_7pyJaco2_11GetTorqueLoad, METH_NOARGS, 0},
-  {"InitForceMode", (PyCFunction)__pyx_pw_9abr_jaco2_9interface_11jaco2_rs485_7pyJaco2_13InitForceMode, METH_NOARGS, 0},
-  {"InitPositionMode", (PyCFunction)__pyx_pw_9abr_jaco2_9interface_11jaco2_rs485_7pyJaco2_15InitPositionMode, METH_NOARGS, 0},
-  {"SendForces", (PyCFunction)__pyx_pw_9abr_jaco2_9interface_11jaco2_rs485_7pyJaco2_17SendForces, METH_O, 0},
-  {"SendTargetAngles", (PyCFunction)__pyx_pw_9abr_jaco2_9interface_11jaco2_rs485_7pyJaco2_19SendTargetAngles, METH_O, 0},
-  {"SendTargetAnglesHand", (PyCFunction)__pyx_pw_9abr_jaco2_9interface_11jaco2_rs485_7pyJaco2_21SendTargetAnglesHand, METH_O, 0},
+  {"GetFeedbackInto", (PyCFunction)__pyx_pw_9abr_jaco2_9interface_11jaco2_rs485_7pyJaco2_11GetFeedbackInto, METH_VARARGS|METH_KEYWORDS, 0},
+  {"GetTorqueLoad", (PyCFunction)__pyx_pw_9abr_jaco2_9interface_11jaco2_rs485_7pyJaco2_13GetTorqueLoad, METH_NOARGS, 0},
+  {"InitForceMode", (PyCFunction)__pyx_pw_9abr_jaco2_9interface_11jaco2_rs485_7pyJaco2_15InitForceMode, METH_NOARGS, 0},
+  {"InitPositionMode", (PyCFunction)__pyx_pw_9abr_jaco2_9interface_11jaco2_rs485_7pyJaco2_17InitPositionMode, METH_NOARGS, 0},
+  {"SendForces", (PyCFunction)__pyx_pw_9abr_jaco2_9interface_11jaco2_rs485_7pyJaco2_19SendForces, METH_O, 0},
+  {"SendTargetAngles", (PyCFunction)__pyx_pw_9abr_jaco2_9interface_11jaco2_rs485_7pyJaco2_21SendTargetAngles, METH_O, 0},
+  {"SendTargetAnglesHand", (PyCFunction)__pyx_pw_9abr_jaco2_9interface_11jaco2_rs485_7pyJaco2_23SendTargetAnglesHand, METH_O, 0},
   {0, 0, 0, 0}
 };
 
@@ -5318,9 +5807,9 @@ static __Pyx_StringTabEntry __pyx_string_tab[] = {
   {0, 0, 0, 0, 0, 0, 0}
 };
 static int __Pyx_InitCachedBuiltins(void) {
-  __pyx_builtin_ImportError = __Pyx_GetBuiltinName(__pyx_n_s_ImportError); if (!__pyx_builtin_ImportError) __PYX_ERR(0, 33, __pyx_L1_error)
+  __pyx_builtin_ImportError = __Pyx_GetBuiltinName(__pyx_n_s_ImportError); if (!__pyx_builtin_ImportError) __PYX_ERR(0, 37, __pyx_L1_error)
+  __pyx_builtin_range = __Pyx_GetBuiltinName(__pyx_n_s_range); if (!__pyx_builtin_range) __PYX_ERR(0, 65, __pyx_L1_error)
   __pyx_builtin_ValueError = __Pyx_GetBuiltinName(__pyx_n_s_ValueError); if (!__pyx_builtin_ValueError) __PYX_ERR(1, 218, __pyx_L1_error)
-  __pyx_builtin_range = __Pyx_GetBuiltinName(__pyx_n_s_range); if (!__pyx_builtin_range) __PYX_ERR(1, 231, __pyx_L1_error)
   __pyx_builtin_RuntimeError = __Pyx_GetBuiltinName(__pyx_n_s_RuntimeError); if (!__pyx_builtin_RuntimeError) __PYX_ERR(1, 799, __pyx_L1_error)
   return 0;
   __pyx_L1_error:;
@@ -5331,7 +5820,7 @@ static int __Pyx_InitCachedConstants(void) {
   __Pyx_RefNannyDeclarations
   __Pyx_RefNannySetupContext("__Pyx_InitCachedConstants", 0);
 
-  /* "../../../anaconda3/envs/control/lib/python3.4/site-packages/Cython/Includes/numpy/__init__.pxd":218
+  /* "../../tmp/cy/Cython-0.25.2/Cython/Includes/numpy/__init__.pxd":218
  *             if ((flags & pybuf.PyBUF_C_CONTIGUOUS == pybuf.PyBUF_C_CONTIGUOUS)
  *                 and not PyArray_CHKFLAGS(self, NPY_C_CONTIGUOUS)):
  *                 raise ValueError(u"ndarray is not C contiguous")             # <<<<<<<<<<<<<<
@@ -5342,7 +5831,7 @@ static int __Pyx_InitCachedConstants(void) {
   __Pyx_GOTREF(__pyx_tuple_);
   __Pyx_GIVEREF(__pyx_tuple_);
 
-  /* "../../../anaconda3/envs/control/lib/python3.4/site-packages/Cython/Includes/numpy/__init__.pxd":222
+  /* "../../tmp/cy/Cython-0.25.2/Cython/Includes/numpy/__init__.pxd":222
  *             if ((flags & pybuf.PyBUF_F_CONTIGUOUS == pybuf.PyBUF_F_CONTIGUOUS)
  *                 and not PyArray_CHKFLAGS(self, NPY_F_CONTIGUOUS)):
  *                 raise ValueError(u"ndarray is not Fortran contiguous")             # <<<<<<<<<<<<<<
@@ -5353,7 +5842,7 @@ static int __Pyx_InitCachedConstants(void) {
   __Pyx_GOTREF(__pyx_tuple__2);
   __Pyx_GIVEREF(__pyx_tuple__2);
 
-  /* "../../../anaconda3/envs/control/lib/python3.4/site-packages/Cython/Includes/numpy/__init__.pxd":259
+  /* "../../tmp/cy/Cython-0.25.2/Cython/Includes/numpy/__init__.pxd":259
  *                 if ((descr.byteorder == c'>' and little_endian) or
  *                     (descr.byteorder == c'<' and not little_endian)):
  *                     raise ValueError(u"Non-native byte order not supported")             # <<<<<<<<<<<<<<
@@ -5364,7 +5853,7 @@ static int __Pyx_InitCachedConstants(void) {
   __Pyx_GOTREF(__pyx_tuple__3);
   __Pyx_GIVEREF(__pyx_tuple__3);
 
-  /* "../../../anaconda3/envs/control/lib/python3.4/site-packages/Cython/Includes/numpy/__init__.pxd":799
+  /* "../../tmp/cy/Cython-0.25.2/Cython/Includes/numpy/__init__.pxd":799
  * 
  *         if (end - f) - <int>(new_offset - offset[0]) < 15:
  *             raise RuntimeError(u"Format string allocated too short, see comment in numpy.pxd")             # <<<<<<<<<<<<<<
@@ -5375,7 +5864,7 @@ static int __Pyx_InitCachedConstants(void) {
   __Pyx_GOTREF(__pyx_tuple__4);
   __Pyx_GIVEREF(__pyx_tuple__4);
 
-  /* "../../../anaconda3/envs/control/lib/python3.4/site-packages/Cython/Includes/numpy/__init__.pxd":803
+  /* "../../tmp/cy/Cython-0.25.2/Cython/Includes/numpy/__init__.pxd":803
  *         if ((child.byteorder == c'>' and little_endian) or
  *             (child.byteorder == c'<' and not little_endian)):
  *             raise ValueError(u"Non-native byte order not supported")             # <<<<<<<<<<<<<<
@@ -5386,7 +5875,7 @@ static int __Pyx_InitCachedConstants(void) {
   __Pyx_GOTREF(__pyx_tuple__5);
   __Pyx_GIVEREF(__pyx_tuple__5);
 
-  /* "../../../anaconda3/envs/control/lib/python3.4/site-packages/Cython/Includes/numpy/__init__.pxd":823
+  /* "../../tmp/cy/Cython-0.25.2/Cython/Includes/numpy/__init__.pxd":823
  *             t = child.type_num
  *             if end - f < 5:
  *                 raise RuntimeError(u"Format string allocated too short.")             # <<<<<<<<<<<<<<
@@ -5397,7 +5886,7 @@ static int __Pyx_InitCachedConstants(void) {
   __Pyx_GOTREF(__pyx_tuple__6);
   __Pyx_GIVEREF(__pyx_tuple__6);
 
-  /* "../../../anaconda3/envs/control/lib/python3.4/site-packages/Cython/Includes/numpy/__init__.pxd":989
+  /* "../../tmp/cy/Cython-0.25.2/Cython/Includes/numpy/__init__.pxd":989
  *         _import_array()
  *     except Exception:
  *         raise ImportError("numpy.core.multiarray failed to import")             # <<<<<<<<<<<<<<
@@ -5408,7 +5897,7 @@ static int __Pyx_InitCachedConstants(void) {
   __Pyx_GOTREF(__pyx_tuple__7);
   __Pyx_GIVEREF(__pyx_tuple__7);
 
-  /* "../../../anaconda3/envs/control/lib/python3.4/site-packages/Cython/Includes/numpy/__init__.pxd":995
+  /* "../../tmp/cy/Cython-0.25.2/Cython/Includes/numpy/__init__.pxd":995
  *         _import_umath()
  *     except Exception:
  *         raise ImportError("numpy.core.umath failed to import")             # <<<<<<<<<<<<<<
@@ -5419,7 +5908,7 @@ static int __Pyx_InitCachedConstants(void) {
   __Pyx_GOTREF(__pyx_tuple__8);
   __Pyx_GIVEREF(__pyx_tuple__8);
 
-  /* "../../../anaconda3/envs/control/lib/python3.4/site-packages/Cython/Includes/numpy/__init__.pxd":1001
+  /* "../../tmp/cy/Cython-0.25.2/Cython/Includes/numpy/__init__.pxd":1001
  *         _import_umath()
  *     except Exception:
  *         raise ImportError("numpy.core.umath failed to import")             # <<<<<<<<<<<<<<
@@ -5531,9 +6020,9 @@ PyMODINIT_FUNC PyInit_jaco2_rs485(void)
   /*--- Variable export code ---*/
   /*--- Function export code ---*/
   /*--- Type init code ---*/
-  if (PyType_Ready(&__pyx_type_9abr_jaco2_9interface_11jaco2_rs485_pyJaco2) < 0) __PYX_ERR(0, 27, __pyx_L1_error)
+  if (PyType_Ready(&__pyx_type_9abr_jaco2_9interface_11jaco2_rs485_pyJaco2) < 0) __PYX_ERR(0, 31, __pyx_L1_error)
   __pyx_type_9abr_jaco2_9interface_11jaco2_rs485_pyJaco2.tp_print = 0;
-  if (PyObject_SetAttrString(__pyx_m, "pyJaco2", (PyObject *)&__pyx_type_9abr_jaco2_9interface_11jaco2_rs485_pyJaco2) < 0) __PYX_ERR(0, 27, __pyx_L1_error)
+  if (PyObject_SetAttrString(__pyx_m, "pyJaco2", (PyObject *)&__pyx_type_9abr_jaco2_9interface_11jaco2_rs485_pyJaco2) < 0) __PYX_ERR(0, 31, __pyx_L1_error)
   __pyx_ptype_9abr_jaco2_9interface_11jaco2_rs485_pyJaco2 = &__pyx_type_9abr_jaco2_9interface_11jaco2_rs485_pyJaco2;
   /*--- Type import code ---*/
   __pyx_ptype_7cpython_4type_type = __Pyx_ImportType(__Pyx_BUILTIN_MODULE_NAME, "type", 
@@ -5558,14 +6047,32 @@ PyMODINIT_FUNC PyInit_jaco2_rs485(void)
   /* "abr_jaco2/interface/jaco2_cython.pyx":1
  * import numpy as np             # <<<<<<<<<<<<<<
  * cimport numpy as np
- * from libcpp cimport bool
+ * from libc.math cimport fmod, M_PI
  */
   __pyx_t_1 = __Pyx_Import(__pyx_n_s_numpy, 0, -1); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 1, __pyx_L1_error)
   __Pyx_GOTREF(__pyx_t_1);
   if (PyDict_SetItem(__pyx_d, __pyx_n_s_np, __pyx_t_1) < 0) __PYX_ERR(0, 1, __pyx_L1_error)
   __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
 
-  /* "abr_jaco2/interface/jaco2_cython.pyx":30
+  /* "abr_jaco2/interface/jaco2_cython.pyx":7
+ * 
+ * # unit conversion constants, Jaco API uses degrees
+ * cdef double DEG2RAD = M_PI / 180.0             # <<<<<<<<<<<<<<
+ * cdef double TWO_PI = 2.0 * M_PI
+ * 
+ */
+  __pyx_v_9abr_jaco2_9interface_11jaco2_rs485_DEG2RAD = (M_PI / 180.0);
+
+  /* "abr_jaco2/interface/jaco2_cython.pyx":8
+ * # unit conversion constants, Jaco API uses degrees
+ * cdef double DEG2RAD = M_PI / 180.0
+ * cdef double TWO_PI = 2.0 * M_PI             # <<<<<<<<<<<<<<
+ * 
+ * # none of the Jaco2 functions touch Python objects, so they are declared nogil
+ */
+  __pyx_v_9abr_jaco2_9interface_11jaco2_rs485_TWO_PI = (2.0 * M_PI);
+
+  /* "abr_jaco2/interface/jaco2_cython.pyx":34
  *     cdef Jaco2* thisptr # hold a C++ instance
  *     cdef bool use_redis
  *     try:             # <<<<<<<<<<<<<<
@@ -5581,43 +6088,43 @@ PyMODINIT_FUNC PyInit_jaco2_rs485(void)
     __Pyx_XGOTREF(__pyx_t_4);
     /*try:*/ {
 
-      /* "abr_jaco2/interface/jaco2_cython.pyx":31
+      /* "abr_jaco2/interface/jaco2_cython.pyx":35
  *     cdef bool use_redis
  *     try:
  *         import redis             # <<<<<<<<<<<<<<
  *         r = redis.StrictRedis(host='localhost')
  *     except ImportError:
  */
-      __pyx_t_1 = __Pyx_Import(__pyx_n_s_redis, 0, -1); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 31, __pyx_L2_error)
+      __pyx_t_1 = __Pyx_Import(__pyx_n_s_redis, 0, -1); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 35, __pyx_L2_error)
       __Pyx_GOTREF(__pyx_t_1);
-      if (PyDict_SetItem((PyObject *)__pyx_ptype_9abr_jaco2_9interface_11jaco2_rs485_pyJaco2->tp_dict, __pyx_n_s_redis, __pyx_t_1) < 0) __PYX_ERR(0, 31, __pyx_L2_error)
+      if (PyDict_SetItem((PyObject *)__pyx_ptype_9abr_jaco2_9interface_11jaco2_rs485_pyJaco2->tp_dict, __pyx_n_s_redis, __pyx_t_1) < 0) __PYX_ERR(0, 35, __pyx_L2_error)
       __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
       PyType_Modified(__pyx_ptype_9abr_jaco2_9interface_11jaco2_rs485_pyJaco2);
 
-      /* "abr_jaco2/interface/jaco2_cython.pyx":32
+      /* "abr_jaco2/interface/jaco2_cython.pyx":36
  *     try:
  *         import redis
  *         r = redis.StrictRedis(host='localhost')             # <<<<<<<<<<<<<<
  *     except ImportError:
  *         pass
  */
-      __pyx_t_1 = __Pyx_GetNameInClass((PyObject *)__pyx_ptype_9abr_jaco2_9interface_11jaco2_rs485_pyJaco2, __pyx_n_s_redis); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 32, __pyx_L2_error)
+      __pyx_t_1 = __Pyx_GetNameInClass((PyObject *)__pyx_ptype_9abr_jaco2_9interface_11jaco2_rs485_pyJaco2, __pyx_n_s_redis); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 36, __pyx_L2_error)
       __Pyx_GOTREF(__pyx_t_1);
-      __pyx_t_5 = __Pyx_PyObject_GetAttrStr(__pyx_t_1, __pyx_n_s_StrictRedis); if (unlikely(!__pyx_t_5)) __PYX_ERR(0, 32, __pyx_L2_error)
+      __pyx_t_5 = __Pyx_PyObject_GetAttrStr(__pyx_t_1, __pyx_n_s_StrictRedis); if (unlikely(!__pyx_t_5)) __PYX_ERR(0, 36, __pyx_L2_error)
       __Pyx_GOTREF(__pyx_t_5);
       __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
-      __pyx_t_1 = PyDict_New(); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 32, __pyx_L2_error)
+      __pyx_t_1 = PyDict_New(); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 36, __pyx_L2_error)
       __Pyx_GOTREF(__pyx_t_1);
-      if (PyDict_SetItem(__pyx_t_1, __pyx_n_s_host, __pyx_n_s_localhost) < 0) __PYX_ERR(0, 32, __pyx_L2_error)
-      __pyx_t_6 = __Pyx_PyObject_Call(__pyx_t_5, __pyx_empty_tuple, __pyx_t_1); if (unlikely(!__pyx_t_6)) __PYX_ERR(0, 32, __pyx_L2_error)
+      if (PyDict_SetItem(__pyx_t_1, __pyx_n_s_host, __pyx_n_s_localhost) < 0) __PYX_ERR(0, 36, __pyx_L2_error)
+      __pyx_t_6 = __Pyx_PyObject_Call(__pyx_t_5, __pyx_empty_tuple, __pyx_t_1); if (unlikely(!__pyx_t_6)) __PYX_ERR(0, 36, __pyx_L2_error)
       __Pyx_GOTREF(__pyx_t_6);
       __Pyx_DECREF(__pyx_t_5); __pyx_t_5 = 0;
       __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
-      if (PyDict_SetItem((PyObject *)__pyx_ptype_9abr_jaco2_9interface_11jaco2_rs485_pyJaco2->tp_dict, __pyx_n_s_r, __pyx_t_6) < 0) __PYX_ERR(0, 32, __pyx_L2_error)
+      if (PyDict_SetItem((PyObject *)__pyx_ptype_9abr_jaco2_9interface_11jaco2_rs485_pyJaco2->tp_dict, __pyx_n_s_r, __pyx_t_6) < 0) __PYX_ERR(0, 36, __pyx_L2_error)
       __Pyx_DECREF(__pyx_t_6); __pyx_t_6 = 0;
       PyType_Modified(__pyx_ptype_9abr_jaco2_9interface_11jaco2_rs485_pyJaco2);
 
-      /* "abr_jaco2/interface/jaco2_cython.pyx":30
+      /* "abr_jaco2/interface/jaco2_cython.pyx":34
  *     cdef Jaco2* thisptr # hold a C++ instance
  *     cdef bool use_redis
  *     try:             # <<<<<<<<<<<<<<
@@ -5635,7 +6142,7 @@ PyMODINIT_FUNC PyInit_jaco2_rs485(void)
     __Pyx_XDECREF(__pyx_t_1); __pyx_t_1 = 0;
     __Pyx_XDECREF(__pyx_t_6); __pyx_t_6 = 0;
 
-    /* "abr_jaco2/interface/jaco2_cython.pyx":33
+    /* "abr_jaco2/interface/jaco2_cython.pyx":37
  *         import redis
  *         r = redis.StrictRedis(host='localhost')
  *     except ImportError:             # <<<<<<<<<<<<<<
@@ -5650,7 +6157,7 @@ PyMODINIT_FUNC PyInit_jaco2_rs485(void)
     goto __pyx_L4_except_error;
     __pyx_L4_except_error:;
 
-    /* "abr_jaco2/interface/jaco2_cython.pyx":30
+    /* "abr_jaco2/interface/jaco2_cython.pyx":34
  *     cdef Jaco2* thisptr # hold a C++ instance
  *     cdef bool use_redis
  *     try:             # <<<<<<<<<<<<<<
@@ -5675,7 +6182,7 @@ PyMODINIT_FUNC PyInit_jaco2_rs485(void)
   /* "abr_jaco2/interface/jaco2_cython.pyx":1
  * import numpy as np             # <<<<<<<<<<<<<<
  * cimport numpy as np
- * from libcpp cimport bool
+ * from libc.math cimport fmod, M_PI
  */
   __pyx_t_6 = PyDict_New(); if (unlikely(!__pyx_t_6)) __PYX_ERR(0, 1, __pyx_L1_error)
   __Pyx_GOTREF(__pyx_t_6);
@@ -1,8 +1,15 @@
 import numpy as np
 cimport numpy as np
+from libc.math cimport fmod, M_PI
 from libcpp cimport bool
 
-cdef extern from "jaco2_rs485.h":
+# unit conversion constants, Jaco API uses degrees
+cdef double DEG2RAD = M_PI / 180.0
+cdef double TWO_PI = 2.0 * M_PI
+
+# none of the Jaco2 functions touch Python objects, so they are declared nogil
+# and the GIL is released while they block on RS485 communication
+cdef extern from "jaco2_rs485.h" nogil:
     cdef cppclass Jaco2:
         Jaco2(int display_error_level)
         # main functions
@@ -38,36 +45,59 @@ cdef class pyJaco2:
         del self.thisptr
 
     def Connect(self):
-        self.thisptr.Connect()
+        with nogil:
+            self.thisptr.Connect()
 
     def Disconnect(self):
-        self.thisptr.Disconnect()
+        with nogil:
+            self.thisptr.Disconnect()
 
     def GetFeedback(self):
         return {'q': self.thisptr.pos,
                 'dq': self.thisptr.vel}
 
+    def GetFeedbackInto(self, np.ndarray[double, mode="c"] q,
+                        np.ndarray[double, mode="c"] dq):
+        # copy feedback into preallocated arrays, avoids building a dict,
+        # converting from degrees into radians with q wrapped to [0, 2pi)
+        cdef int ii
+        cdef double q_rad
+        for ii in range(6):
+            q_rad = fmod(self.thisptr.pos[ii] * DEG2RAD, TWO_PI)
+            if q_rad < 0:
+                q_rad += TWO_PI
+            q[ii] = q_rad
+            dq[ii] = self.thisptr.vel[ii] * DEG2RAD
+
     def GetTorqueLoad(self):
         # TODO: doesn't work returning self.thisptr.torque_load
         return {'torque_load' : self.thisptr.torque_load}
 
     def InitForceMode(self):
-        self.thisptr.InitForceMode()
+        with nogil:
+            self.thisptr.InitForceMode()
 
     def InitPositionMode(self):
-        self.thisptr.InitPositionMode()
+        with nogil:
+            self.thisptr.InitPositionMode()
 
     def SendForces(self, np.ndarray[float, mode="c"] u):
-        self.thisptr.SendForces(&u[0])
+        cdef float* u_ptr = &u[0]
+        with nogil:
+            self.thisptr.SendForces(u_ptr)
 
     def SendTargetAngles(self, np.ndarray[float, mode="c"] q_target):
-        target_reached = 0
-        self.thisptr.SendTargetAnglesSetup()
+        cdef int target_reached = 0
+        cdef float* q_target_ptr = &q_target[0]
+        with nogil:
+            self.thisptr.SendTargetAnglesSetup()
         while target_reached < 6:
-            target_reached = self.thisptr.SendTargetAngles(&q_target[0])
+            with nogil:
+                target_reached = self.thisptr.SendTargetAngles(q_target_ptr)
             if self.use_redis:
                 self.r.set('q', '%.3f %.3f %.3f %.3f %.3f %.3f' %
                       tuple(self.thisptr.pos_rad))
 
     def SendTargetAnglesHand(self, bool open):
-        self.thisptr.SendTargetAnglesHand(open)
+        with nogil:
+            self.thisptr.SendTargetAnglesHand(open)
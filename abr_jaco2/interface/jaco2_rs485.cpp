@@ -458,25 +458,27 @@ void Jaco2::SendForces(float u[6]) {
 
     MyRS485_Write(force_message, packets_sent, write_count);
     usleep(1250); // TODO: EXPERIMENT WITH DIFFERENT DELAY
-    MyRS485_Read(feedback_message, packets_read, read_count);
+    // read as many messages as the buffer holds rather than just the
+    // packets_read expected for one reply, so any replies left over from
+    // previous loops are drained instead of being read next loop
+    MyRS485_Read(feedback_message, FEEDBACK_BUFFER_SIZE, read_count);
 
     // The response for a SEND_POSITION_AND_TORQUE (0x0014) command is 3
     // messages per motor [0x0015, 0x0016, 0x0017]. Read through all
-    // feedback, and if data for a motor hasn't been received yet update
-    // then update the position and velocity variables for that motor. Use
-    // reduced processing here rather than through ProcessFeedback for speed.
-    // NOTE: torque_load is not updated while reading this feedback
+    // feedback and update the position and velocity variables for each
+    // motor. Older replies come first in the read, so keep overwriting and
+    // the newest data for each motor is what is used rather than stale
+    // data. Use reduced processing here rather than through ProcessFeedback
+    // for speed.
     memset(updated, 0, (size_t)sizeof(int)*6);
     for(int ii = 0; ii < read_count; ii++) {
         if(feedback_message[ii].Command == RS485_MSG_SEND_ALL_VALUES_1) {
             //actuator 0 is 16
             current_motor = feedback_message[ii].SourceAddress - 16;
-            if (updated[current_motor] == 0) {
-                pos[current_motor] = feedback_message[ii].DataFloat[1];
-                vel[current_motor] = feedback_message[ii].DataFloat[2];
-                torque_load[current_motor] = feedback_message[ii].DataFloat[3];
-                updated[current_motor] = 1;
-            }
+            pos[current_motor] = feedback_message[ii].DataFloat[1];
+            vel[current_motor] = feedback_message[ii].DataFloat[2];
+            torque_load[current_motor] = feedback_message[ii].DataFloat[3];
+            updated[current_motor] = 1;
         }
         else if(feedback_message[ii].Command == REPORT_ERROR) {
             //cout << "PRINTING ERROR" << endl;
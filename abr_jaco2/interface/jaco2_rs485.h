@@ -39,6 +39,7 @@ using namespace std;
 #define SEND_TORQUE_CONFIG_CONTROL_PARAM_1 0x214
 #define SEND_TORQUE_CONFIG_CONTROL_PARAM_2 0x215
 #define POSITION_LIMIT 0x0021
+#define FEEDBACK_BUFFER_SIZE 50 // max number of messages read at once
 
 class Jaco2 {
 
@@ -52,7 +53,7 @@ class Jaco2 {
 
         // RS485 arrays of structs
         RS485_Message clear_error_message[6];
-        RS485_Message feedback_message[50];  // TODO: does this need to be 50?
+        RS485_Message feedback_message[FEEDBACK_BUFFER_SIZE];
         RS485_Message force_message[6];
         RS485_Message get_position_hand_message[3];
         RS485_Message get_position_message[6];
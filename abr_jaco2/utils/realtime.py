@@ -0,0 +1,92 @@
+import ctypes
+import ctypes.util
+import gc
+import os
+import warnings
+
+# mlockall flags, see sys/mman.h
+_MCL_CURRENT = 1
+_MCL_FUTURE = 2
+
+
+class RealTime(object):
+    """ Real-time process settings for the force control loop
+
+    On start pins the process to a CPU, switches it to SCHED_FIFO,
+    disables the garbage collector and locks its memory, so scheduler
+    preemption, collection pauses and page faults don't stall the loop.
+    On stop everything is restored. Call start right before
+    Interface.init_force_mode and stop once the arm is back in position
+    mode, so code generation and start up don't run with real-time
+    priority.
+
+    For the most consistent loop times isolate the CPU with the kernel
+    parameter isolcpus=<cpu>. SCHED_FIFO requires root (or CAP_SYS_NICE)
+    and locking memory requires `ulimit -l unlimited`, any setting that
+    can't be applied gives a warning and is skipped.
+
+    Parameters
+    ----------
+    cpu : int, optional (Default: 3)
+        the CPU to pin the process to, None to not change affinity
+    priority : int, optional (Default: 80)
+        the SCHED_FIFO priority, 1 (lowest) to 99 (highest)
+    """
+
+    def __init__(self, cpu=3, priority=80):
+        self.cpu = cpu
+        self.priority = priority
+
+        self._affinity = None
+        self._policy = None
+        self._libc = None
+
+    def start(self):
+        """ Applies the real-time settings """
+
+        if self.cpu is not None:
+            try:
+                self._affinity = os.sched_getaffinity(0)
+                os.sched_setaffinity(0, {self.cpu})
+            except (AttributeError, OSError) as e:
+                self._affinity = None
+                warnings.warn('Could not pin process to CPU %i: %s'
+                              % (self.cpu, e))
+
+        try:
+            self._policy = (os.sched_getscheduler(0), os.sched_getparam(0))
+            os.sched_setscheduler(
+                0, os.SCHED_FIFO, os.sched_param(self.priority))
+        except (AttributeError, OSError) as e:
+            self._policy = None
+            warnings.warn('Could not set SCHED_FIFO scheduling: %s' % e)
+
+        gc.disable()
+
+        try:
+            self._libc = ctypes.CDLL(
+                ctypes.util.find_library('c'), use_errno=True)
+        except OSError as e:
+            warnings.warn('Could not load libc to lock memory: %s' % e)
+        else:
+            if self._libc.mlockall(_MCL_CURRENT | _MCL_FUTURE) != 0:
+                warnings.warn('Could not lock memory: %s'
+                              % os.strerror(ctypes.get_errno()))
+
+    def stop(self):
+        """ Restores the settings from before start was called """
+
+        if self._libc is not None:
+            self._libc.munlockall()
+            self._libc = None
+
+        gc.collect()
+        gc.enable()
+
+        if self._policy is not None:
+            os.sched_setscheduler(0, *self._policy)
+            self._policy = None
+
+        if self._affinity is not None:
+            os.sched_setaffinity(0, self._affinity)
+            self._affinity = None
@@ -13,18 +13,55 @@ jaco2 and it is not recommended to use larger masses.
 The adaptive controller takes in the joint positions and velocities for the
 base three joints (base, shoulder, elbow) and outputs a control signal [Nm] for
 the respective three joints.
+
+The per-loop signal assembly is compiled with numba if it is installed
+(`pip install numba`), otherwise it runs as plain Python.
+
+While in force mode the script runs with real-time settings, see
+abr_jaco2.RealTime for the permissions and kernel parameters it needs.
 """
 
 import numpy as np
 import os
-import timeit
+from time import perf_counter_ns
 import traceback
 
 from abr_control.controllers import OSC, signals, path_planners
 import abr_jaco2
 
+try:
+    from numba import njit
+except ImportError:
+    print('numba not installed, running per-loop math in Python')
+    def njit(*args, **kwargs):
+        return lambda func: func
+
 plot_error = True
 
+
+@njit(cache=True, fastmath=True)
+def pack_input(q_scaled, dq_scaled, input_signal):
+    """ Fills input_signal with the shoulder and elbow q and dq """
+    input_signal[0] = q_scaled[1]
+    input_signal[1] = q_scaled[2]
+    input_signal[2] = dq_scaled[1]
+    input_signal[3] = dq_scaled[2]
+
+
+@njit(cache=True, fastmath=True)
+def assemble_u(u_base, u_adapt, u):
+    """ Fills u with the total control signal
+
+    Scales the base joint signal to adjust for stiction (x3 if positive,
+    else x2) and adds the adaptive signal to the shoulder and elbow.
+    """
+    for ii in range(u.shape[0]):
+        u[ii] = u_base[ii]
+    u[0] *= 2.0 + float(u[0] > 0.0)
+    u[1] += u_adapt[0]
+    u[2] += u_adapt[1]
+
+
 # initialize our robot config
 robot_config = abr_jaco2.Config(use_cython=True, hand_attached=True)
 
@@ -40,11 +77,17 @@ dt = 0.003
 # outside of the main loop, because force mode auto-exits after 200ms
 zeros = np.zeros(robot_config.N_JOINTS)
 
-robot_config.Tx('EE', q=zeros, x=robot_config.OFFSET)
+# NOTE: this also generates the Tx('EE') function used in the loop below
+u_base = ctrlr.generate(zeros, zeros, np.zeros(3), offset=robot_config.OFFSET)
 
-ctrlr.generate(zeros, zeros, np.zeros(3), offset=robot_config.OFFSET)
+# input and training signals for the adaptive controller and the total
+# control signal, filled in place every loop
+input_signal = np.empty(4)
+training_signal = np.empty(2)
+u = np.empty(robot_config.N_JOINTS)
 
 interface = abr_jaco2.Interface(robot_config)
+realtime = abr_jaco2.RealTime(cpu=3, priority=80)
 
 target_xyz = np.array([.57, 0.03, .87])
 
@@ -60,41 +103,53 @@ adapt = signals.DynamicsAdaptation(
     weights_file=None,
     backend='nengo')
 
+# run the adaptive controller once and compile the per-loop math with the
+# arrays the loop will pass in, so numba doesn't recompile in force mode
+pack_input(robot_config.scaledown('q', zeros),
+           robot_config.scaledown('dq', zeros),
+           input_signal)
+training_signal[:] = 0
+u_adapt = adapt.generate(input_signal=input_signal,
+                         training_signal=training_signal)
+assemble_u(u_base, u_adapt, u)
+
 # connect to and initialize the arm
 interface.connect()
 interface.init_position_mode()
 interface.send_target_angles(robot_config.INIT_TORQUE_POSITION)
 
+count = 0
 if plot_error:
-    error_track = []
+    # store the offset from the target, the error is calculated after the
+    # run. Preallocate space for loops as fast as 1ms, if the buffer does
+    # fill up tracking stops rather than growing it inside the loop
+    error_track = np.empty((int(time_limit / 0.001), 3), dtype=np.float32)
 
 try:
+    # pin to one CPU with SCHED_FIFO priority, disable the garbage
+    # collector and lock memory to reduce jitter while in force mode
+    realtime.start()
     interface.init_force_mode()
 
-    # get the end-effector's initial position
-    feedback = interface.get_feedback()
-    count = 0
-    loop_time = 0
+    loop_time = 0  # in nanoseconds
+    time_limit_ns = int(time_limit * 1e9)
 
-    # get joint angle and velocity feedback
+    # get the end-effector's initial position
     feedback = interface.get_feedback()
-    # calculate end-effector position
-    ee_xyz = robot_config.Tx('EE', q=feedback['q'], x=robot_config.OFFSET)
+    ee_xyz = robot_config.Tx('EE', q=feedback.q, x=robot_config.OFFSET)
 
     filtered_target = np.concatenate((ee_xyz, np.array([0, 0, 0])), axis=0)
 
-    while loop_time < time_limit:
-        start = timeit.default_timer()
+    while loop_time < time_limit_ns:
+        start = perf_counter_ns()
 
         # get next step along trajectory
         filtered_target = path.step(
                 state=filtered_target, target_pos=target_xyz)
 
         feedback = interface.get_feedback()
-        q = feedback['q']
-        dq = feedback['dq']
-
-        ee_xyz = robot_config.Tx('EE', q=q, x=robot_config.OFFSET)
+        q = feedback.q
+        dq = feedback.dq
 
         # calculate the control signal
         u_base = ctrlr.generate(
@@ -104,43 +159,33 @@ try:
             target_vel=filtered_target[3:],
             offset = robot_config.OFFSET)
 
-        # adjust for some stiction in the base
-        if u_base[0] > 0:
-            u_base[0] *= 3.0
-        else:
-            u_base[0] *= 2.0
-
         # calculate teh adaptive control signal
-        input_signal = np.array([robot_config.scaledown('q',q)[1],
-                                   robot_config.scaledown('q',q)[2],
-                                   robot_config.scaledown('dq',dq)[1],
-                                   robot_config.scaledown('dq',dq)[2]])
-        training_signal = np.array([ctrlr.training_signal[1],
-                                    ctrlr.training_signal[2]])
+        pack_input(robot_config.scaledown('q', q),
+                   robot_config.scaledown('dq', dq),
+                   input_signal)
+        training_signal[0] = ctrlr.training_signal[1]
+        training_signal[1] = ctrlr.training_signal[2]
         u_adapt = adapt.generate(input_signal=input_signal,
                     training_signal=training_signal)
 
-        u_adapt = np.array([0,
-                            u_adapt[0],
-                            u_adapt[1],
-                            0,
-                            0,
-                            0])
-        u = u_base + u_adapt
-
-        interface.send_forces(np.array(u, dtype='float32'))
-        error = np.sqrt(np.sum((ee_xyz - target_xyz)**2))
-
-        end = timeit.default_timer() - start
-        loop_time += end
+        # adjust for stiction in the base and add in the adaptive signal
+        assemble_u(u_base, u_adapt, u)
 
-        if plot_error:
-            error_track.append(np.copy(error))
+        interface.send_forces(u)
 
-        if count % 1000 == 0:
-            print('error: ', error)
+        # the end-effector position is only needed to track the error
+        print_error = count % 1000 == 0
+        track_error = plot_error and count < error_track.shape[0]
+        if track_error or print_error:
+            ee_xyz = robot_config.Tx('EE', q=q, x=robot_config.OFFSET)
+            if track_error:
+                np.subtract(ee_xyz, target_xyz, out=error_track[count])
+            if print_error:
+                print('error: ', np.linalg.norm(ee_xyz - target_xyz))
         count += 1
 
+        loop_time += perf_counter_ns() - start
+
 except:
     print(traceback.format_exc())
 
@@ -150,12 +195,15 @@ finally:
     interface.send_target_angles(robot_config.INIT_TORQUE_POSITION)
     interface.disconnect()
 
+    # out of force mode, restore the scheduling, memory and gc settings
+    realtime.stop()
+
     if plot_error:
         import matplotlib
         matplotlib.use("TKAgg")
         import matplotlib.pyplot as plt
         plt.figure()
         plt.title("Trajectory Error")
-        plt.plot(error_track)
+        plt.plot(np.linalg.norm(error_track[:count], axis=1))
         plt.ylabel("Distance to target [m]")
         plt.show()
@@ -39,13 +39,13 @@ interface.init_force_mode()
 try:
     while 1:
         feedback = interface.get_feedback()
-        u = ctrlr.generate(q=feedback['q'], dq=feedback['dq'])
+        u = ctrlr.generate(q=feedback.q, dq=feedback.dq)
         # add in joint limit avoidance
-        u += avoid.generate(feedback['q'])
+        u += avoid.generate(feedback.q)
         # apply the control signal
         interface.send_forces(u)
         # track data
-        q_track.append(np.copy(feedback['q']))
+        q_track.append(np.copy(feedback.q))
 
 except:
     print(traceback.format_exc())
@@ -1,9 +1,13 @@
 """Uses force control to compensate for gravity.  The arm will
-hold its position while maintaining compliance.  """
+hold its position while maintaining compliance.
+
+While in force mode the script runs with real-time settings, see
+abr_jaco2.RealTime for the permissions and kernel parameters it needs.
+"""
 
 import numpy as np
 import traceback
-import timeit
+from time import perf_counter_ns
 
 import abr_jaco2
 from abr_control.controllers import Floating
@@ -19,8 +23,12 @@ ctrlr.generate(zeros, zeros)
 
 # create our interface for the jaco2
 interface = abr_jaco2.Interface(robot_config)
+realtime = abr_jaco2.RealTime(cpu=3, priority=80)
 
-time_track = []
+# loop times in nanoseconds. Preallocate space for loops as fast as 1ms, if
+# the buffer does fill up tracking stops rather than growing it in the loop
+time_track = np.empty(int(10 / 0.001), dtype=np.int64)
+count = 0
 
 # connect to the jaco
 interface.connect()
@@ -32,19 +40,25 @@ try:
     print('Running loop speed test for the next 10 seconds...')
     print('During this time the arm will be in float mode and'
            + ' should not move unless it is perturbed')
+    # pin to one CPU with SCHED_FIFO priority, disable the garbage
+    # collector and lock memory to reduce jitter while in force mode
+    realtime.start()
     interface.init_force_mode()
-    run_time = 0
-    while run_time<10:
-        start = timeit.default_timer()
+    run_time = 0  # in nanoseconds
+    run_time_limit = int(10 * 1e9)
+    while run_time < run_time_limit:
+        start = perf_counter_ns()
         feedback = interface.get_feedback()
 
-        u = ctrlr.generate(q=feedback['q'], dq=feedback['dq'])
-        interface.send_forces(np.array(u, dtype='float32'))
+        u = ctrlr.generate(q=feedback.q, dq=feedback.dq)
+        interface.send_forces(u)
 
         # track data
-        loop_time = timeit.default_timer() - start
+        loop_time = perf_counter_ns() - start
         run_time += loop_time
-        time_track.append(np.copy(loop_time))
+        if count < time_track.shape[0]:
+            time_track[count] = loop_time
+            count += 1
 
 
 except Exception as e:
@@ -55,7 +69,11 @@ finally:
     interface.send_target_angles(robot_config.INIT_TORQUE_POSITION)
     interface.disconnect()
 
-    time_track = np.array(time_track)
+    # out of force mode, restore the scheduling, memory and gc settings
+    realtime.stop()
+
+    # convert from nanoseconds to seconds
+    time_track = time_track[:count] * 1e-9
     avg_loop = np.mean(time_track)
     avg_loop_ms = avg_loop*1000
     if avg_loop > 0.005:
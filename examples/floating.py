@@ -32,11 +32,11 @@ try:
     while 1:
         feedback = interface.get_feedback()
 
-        u = ctrlr.generate(q=feedback['q'], dq=feedback['dq'])
-        interface.send_forces(np.array(u, dtype='float32'))
+        u = ctrlr.generate(q=feedback.q, dq=feedback.dq)
+        interface.send_forces(u)
 
         # track data
-        q_track.append(np.copy(feedback['q']))
+        q_track.append(np.copy(feedback.q))
 
 except Exception as e:
     print(traceback.format_exc())
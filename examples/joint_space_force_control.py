@@ -52,13 +52,13 @@ try:
         feedback = interface.get_feedback()
 
         u = ctrlr.generate(
-            q=feedback['q'], dq=feedback['dq'],
+            q=feedback.q, dq=feedback.dq,
             target_pos=target_pos, target_vel=target_vel)
-        interface.send_forces(np.array(u, dtype='float32'))
+        interface.send_forces(u)
 
         # track data
-        q_track.append(np.copy(feedback['q']))
-        error = np.sqrt(np.sum(((target_pos - feedback['q']) % (2*np.pi))**2))
+        q_track.append(np.copy(feedback.q))
+        error = np.sqrt(np.sum(((target_pos - feedback.q) % (2*np.pi))**2))
 
         if count % 100 == 0:
             print('error: ', error)
@@ -39,7 +39,7 @@ try:
         feedback = interface.get_feedback()
 
         # track data
-        q_track.append(np.copy(feedback['q']))
+        q_track.append(np.copy(feedback.q))
         target_track.append(np.copy(target_joint_angles[ii]))
 
         # wait for a second before moving to the next target
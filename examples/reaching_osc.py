@@ -48,19 +48,19 @@ try:
     target_index = 0
 
     feedback = interface.get_feedback()
-    xyz = robot_config.Tx('EE', q=feedback['q'], x=robot_config.OFFSET)
+    xyz = robot_config.Tx('EE', q=feedback.q, x=robot_config.OFFSET)
     filtered_target = np.concatenate((xyz, np.array([0, 0, 0])), axis=0)
 
     interface.init_force_mode()
     while target_index < len(target_xyz):
         feedback = interface.get_feedback()
-        xyz = robot_config.Tx('EE', q=feedback['q'], x=robot_config.OFFSET)
+        xyz = robot_config.Tx('EE', q=feedback.q, x=robot_config.OFFSET)
 
         filtered_target = path.step(
             state=filtered_target, target_pos=target_xyz[target_index])
         # generate the control signal
         u = ctrlr.generate(
-            q=feedback['q'], dq=feedback['dq'],
+            q=feedback.q, dq=feedback.dq,
             target_pos=filtered_target[:3],  # (x, y, z)
             target_vel=filtered_target[3:],  # (dx, dy, dz)
             offset=robot_config.OFFSET)
@@ -71,7 +71,7 @@ try:
         else:
             u[0] *= 2.0
 
-        interface.send_forces(np.array(u, dtype='float32'))
+        interface.send_forces(u)
         error = np.sqrt(np.sum((xyz - target_xyz[target_index])**2))
 
         # print out the error every so often